@@ -2,44 +2,90 @@ import argparse
 from typing import Tuple
 
 from src.config import Config
+from src.stats import FORMATS
+from src.strategy_names import STRATEGIES
 
 
-def parse_args(args: list) -> Tuple[str, int, str, bool]:
+def build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments for the Wordle client program.
-
-    This function sets up an argument parser to handle the following arguments:
-    - hostname: (required) The hostname of the server to connect to.
-    - username: (required) The Northeastern username for authentication.
-    - -p: (optional) The TCP port the server is listening on.
-    - -s: (optional) A flag to use TLS encrypted socket connection.
-
-    Args:
-        args (list): List of command-line arguments to parse.
+    Build the argument parser for the Wordle client program.
 
     Returns:
-        Tuple[str, int, str, bool]: A tuple containing:
-            - hostname (str): The server hostname.
-            - port (int): The port number to connect to.
-            - username (str): The Northeastern username.
-            - use_tls (bool): Whether to use TLS encryption.
+        argparse.ArgumentParser: The configured argument parser.
     """
     parser = argparse.ArgumentParser(description="Client program to connect to a server.")
 
     # Add optional arguments
     parser.add_argument('-p', type=int, help="tcp port the server is listening on", default=Config.DEFAULT_PORT)
     parser.add_argument('-s', action='store_true', help="use TLS encrypted socket connection")
+    parser.add_argument('--strategy', choices=STRATEGIES, default=Config.STRATEGY,
+                        help="guess selection strategy (default: %(default)s)")
+    parser.add_argument('--games', type=int, default=None,
+                        help="play this many games concurrently with asyncio and print a throughput report")
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help="number of simultaneous connections when --games is given (default: %(default)s)")
+    parser.add_argument('--stats', choices=FORMATS, default=Config.STATS or None,
+                        help="record per-phase timings and counters and dump them at exit in this format")
+    parser.add_argument('--stats-file', default=None,
+                        help="write the --stats dump to this file instead of stderr (default: STATS_FILE)")
 
     # Add required positional arguments
     parser.add_argument('hostname', type=str, help="hostname of the server")
     parser.add_argument('username', type=str, help="northeastern username")
 
-    # Parse the arguments
+    return parser
+
+
+def parse_options(args: list) -> argparse.Namespace:
+    """
+    Parse all command-line options for the Wordle client program.
+
+    Unlike parse_args, this returns the full namespace, including options that
+    only affect how the client plays (such as --strategy, --games, --concurrency and --stats).
+
+    Args:
+        args (list): List of command-line arguments to parse.
+
+    Returns:
+        argparse.Namespace: The parsed options, with the TLS port applied when -s is given.
+    """
+    parser = build_parser()
     parsed_args = parser.parse_args(args)
 
+    if parsed_args.games is not None and parsed_args.games < 1:
+        parser.error("--games must be at least 1")
+    if parsed_args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if parsed_args.stats_file and not parsed_args.stats:
+        parser.error("--stats-file requires --stats")
+
     # If TLS is enabled and no port is specified, use TLS port
     if parsed_args.s:
         if parsed_args.p == Config.DEFAULT_PORT:
             parsed_args.p = Config.TLS_PORT
 
+    return parsed_args
+
+
+def parse_args(args: list) -> Tuple[str, int, str, bool]:
+    """
+    Parse command-line arguments for the Wordle client program.
+
+    This function sets up an argument parser to handle the following arguments:
+    - hostname: (required) The hostname of the server to connect to.
+    - username: (required) The Northeastern username for authentication.
+    - -p: (optional) The TCP port the server is listening on.
+    - -s: (optional) A flag to use TLS encrypted socket connection.
+
+    Args:
+        args (list): List of command-line arguments to parse.
+
+    Returns:
+        Tuple[str, int, str, bool]: A tuple containing:
+            - hostname (str): The server hostname.
+            - port (int): The port number to connect to.
+            - username (str): The Northeastern username.
+            - use_tls (bool): Whether to use TLS encryption.
+    """
+    parsed_args = parse_options(args)
     return parsed_args.hostname, parsed_args.p, parsed_args.username, parsed_args.s
@@ -0,0 +1,278 @@
+import asyncio
+import logging
+import ssl
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+from src import stats
+from src.config import Config
+from src.game import Game
+from src.my_socket import tls_context
+from src.protocol import GuessEncoder, decode_response, encode_hello
+
+
+class GameResult(NamedTuple):
+    """
+    The outcome of one game played by the multi-game driver.
+
+    Attributes:
+        flag (Optional[str]): The secret flag, or None if the game failed.
+        guesses (int): The number of guesses sent.
+        latency (float): Seconds from opening the connection to the end of the game.
+        error (Optional[str]): The error message if the game failed.
+    """
+    flag: Optional[str]
+    guesses: int
+    latency: float
+    error: Optional[str] = None
+
+
+class MultiGameClient:
+    """
+    Play many Wordle games concurrently from one process using asyncio.
+
+    Each game runs on its own connection and speaks the same hello/guess/bye
+    protocol as Game. Up to `concurrency` connections are kept busy at once.
+    Every game keeps only its compact GameState; guesses are computed by one
+    shared Game on a single worker thread, so the solver never blocks the
+    event loop and thousands of games in flight cost little memory.
+    """
+
+    def __init__(self, host: str, port: int, username: str, use_tls: bool = False,
+                 concurrency: int = 1, strategy: str = Config.STRATEGY):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.concurrency = max(1, concurrency)
+        self.strategy = strategy
+        self.ssl_context = tls_context(Config.TLS_CA_FILE) if use_tls else None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._solver: Optional[Game] = None
+        self._solver_lock = asyncio.Lock()
+        self._games_left = 0
+
+    async def run(self, games: int) -> List[GameResult]:
+        """
+        Play the given number of games, keeping up to `concurrency` of them in flight.
+
+        Args:
+            games (int): The number of games to play.
+
+        Returns:
+            List[GameResult]: The result of each game, in completion order.
+        """
+        results: List[GameResult] = []
+        self._games_left = games
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='solver')
+
+        async def worker() -> None:
+            while self._games_left > 0:
+                self._games_left -= 1
+                results.append(await self.play_game())
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, games))))
+        finally:
+            self.executor.shutdown(wait=True)
+        return results
+
+    async def play_game(self) -> GameResult:
+        """
+        Play one game on a new connection.
+
+        Returns:
+            GameResult: The outcome of the game; failures are reported, not raised.
+        """
+        start = time.perf_counter()
+        guesses = 0
+        try:
+            with stats.timer("connect"):
+                reader, writer = await asyncio.open_connection(
+                    self.host, self.port, ssl=self.ssl_context,
+                    server_hostname=self.host if self.ssl_context else None,
+                    happy_eyeballs_delay=Config.HAPPY_EYEBALLS_DELAY)
+        except (OSError, ssl.SSLError) as e:
+            return GameResult(None, guesses, time.perf_counter() - start, f"Failed to connect: {e}")
+
+        solver = await self._get_solver()
+        state = solver.new_state()
+        try:
+            response = await self._exchange(reader, writer, encode_hello(self.username), validate=True)
+            if response["type"] == "error":
+                raise ValueError(response["message"])
+            encoder = GuessEncoder(response["id"])
+
+            guess = solver._get_initial_guess()
+            loop = asyncio.get_running_loop()
+            while True:
+                with stats.timer("json_encode"):
+                    data = encoder.encode(guess)
+                response = await self._exchange(reader, writer, data, validate=Config.VALIDATE_RESPONSES)
+                guesses += 1
+                if response["type"] == "bye":
+                    return GameResult(response["flag"], guesses, time.perf_counter() - start)
+                if response["type"] == "error":
+                    raise ValueError(response["message"])
+                guess = await loop.run_in_executor(self.executor, solver.next_guess_for, state, response)
+        except Exception as e:
+            return GameResult(None, guesses, time.perf_counter() - start, str(e) or type(e).__name__)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    @staticmethod
+    async def _exchange(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, data: bytes,
+                        validate: bool = False) -> Dict:
+        """
+        Send one encoded message and wait for the server's one-line JSON reply.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+            data (bytes): The newline-terminated message to send.
+            validate (bool): Decode the whole reply rather than only the fields the client uses.
+
+        Returns:
+            Dict: The decoded reply.
+
+        Raises:
+            ConnectionError: If the server closes the connection before replying.
+        """
+        with stats.timer("round_trip"):
+            writer.write(data)
+            await writer.drain()
+            line = await reader.readline()
+        stats.increment("bytes_sent", len(data))
+        stats.increment("bytes_received", len(line))
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        with stats.timer("json_decode"):
+            return decode_response(line.decode(Config.DEFAULT_ENCODING), validate)
+
+    async def _get_solver(self) -> Game:
+        """
+        Get the shared solver, creating it on the solver thread on first use.
+
+        The opening guess is worked out there too, so games only read it.
+
+        Returns:
+            Game: The solver; callers pass it their own GameState.
+        """
+        async with self._solver_lock:
+            if self._solver is None:
+                loop = asyncio.get_running_loop()
+                self._solver = await loop.run_in_executor(self.executor, self._create_solver)
+        return self._solver
+
+    def _create_solver(self) -> Game:
+        """
+        Create the shared solver and its opening guess, on the solver thread.
+
+        Returns:
+            Game: The solver.
+        """
+        solver = Game(None, self.username, log_level=Config.LOG_LEVEL, strategy=self.strategy)
+        solver._get_initial_guess()
+        return solver
+
+
+def summarize(results: List[GameResult], elapsed: float) -> Dict:
+    """
+    Aggregate game results into throughput and latency statistics.
+
+    Args:
+        results (List[GameResult]): The results of the games played.
+        elapsed (float): Wall-clock seconds taken to play all games.
+
+    Returns:
+        Dict: Counts, games/sec, average guesses and latency percentiles (in seconds).
+    """
+    successes = [result for result in results if result.error is None]
+    latencies = sorted(result.latency for result in successes)
+    summary = {
+        "games": len(results),
+        "succeeded": len(successes),
+        "failed": len(results) - len(successes),
+        "elapsed": elapsed,
+        "games_per_sec": len(successes) / elapsed if elapsed > 0 else 0.0,
+        "avg_guesses": statistics.mean(result.guesses for result in successes) if successes else 0.0,
+    }
+    if latencies:
+        summary["latency"] = {
+            "mean": statistics.mean(latencies),
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1],
+        }
+    return summary
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Get a percentile of already sorted values using the nearest-rank method.
+
+    Args:
+        sorted_values (List[float]): The values, in ascending order (must not be empty).
+        pct (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The value at the requested percentile.
+    """
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def format_report(summary: Dict) -> str:
+    """
+    Format a summary produced by `summarize` for the terminal.
+
+    Args:
+        summary (Dict): The summary to format.
+
+    Returns:
+        str: A human-readable multi-line report.
+    """
+    lines = [
+        f"Games played: {summary['games']} ({summary['succeeded']} succeeded, {summary['failed']} failed)",
+        f"Elapsed: {summary['elapsed']:.2f}s - {summary['games_per_sec']:.2f} games/sec",
+        f"Average guesses: {summary['avg_guesses']:.2f}",
+    ]
+    if "latency" in summary:
+        latency = {name: value * 1000 for name, value in summary["latency"].items()}
+        lines.append(f"Per-game latency (ms): mean {latency['mean']:.1f}, p50 {latency['p50']:.1f}, "
+                     f"p95 {latency['p95']:.1f}, p99 {latency['p99']:.1f}, max {latency['max']:.1f}")
+    return '\n'.join(lines)
+
+
+def run_games(host: str, port: int, username: str, use_tls: bool, games: int,
+              concurrency: int, strategy: str = Config.STRATEGY) -> Dict:
+    """
+    Play several games concurrently and summarize them.
+
+    Args:
+        host (str): The server hostname.
+        port (int): The server port.
+        username (str): The username sent in the hello message.
+        use_tls (bool): Whether to use TLS connections.
+        games (int): The number of games to play.
+        concurrency (int): The maximum number of simultaneous connections.
+        strategy (str): The guess selection strategy.
+
+    Returns:
+        Dict: The summary produced by `summarize`.
+    """
+    client = MultiGameClient(host, port, username, use_tls=use_tls, concurrency=concurrency, strategy=strategy)
+    start = time.perf_counter()
+    results = asyncio.run(client.run(games))
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result.error is not None:
+            logging.warning(f"Game failed after {result.guesses} guesses: {result.error}")
+    return summarize(results, elapsed)
@@ -1,6 +1,9 @@
 import logging
 import os
 
+# The repository root, which default data paths are relative to (not the current directory).
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 class Config:
     """
@@ -15,10 +18,50 @@ class Config:
         TLS_PORT (int): The default port for TLS connections.
         MAX_RETRIES (int): Maximum number of retry attempts for game operations.
         INITIAL_GUESS (str): The initial guess word for the Wordle game.
-        BUFFER_SIZE (int): Size of the buffer for network operations.
+        BUFFER_SIZE (int): Initial size of the receive buffer for network operations.
+        MAX_MESSAGE_SIZE (int): Largest message, in bytes, accepted from the server.
+        TLS_CA_FILE (str): Optional CA bundle trusted, in addition to the system CAs, to verify the server certificate
+            (e.g. a self-signed cert).
+        TCP_NODELAY (bool): Whether to disable Nagle's algorithm, so small messages are sent immediately.
+        TCP_KEEPALIVE (bool): Whether to enable TCP keepalive probes on idle connections.
+        CONNECT_TIMEOUT (float): Seconds to wait for a connection and TLS handshake (0 to wait indefinitely).
+        READ_TIMEOUT (float): Seconds to wait for data from the server (0 to wait indefinitely).
+        DNS_CACHE_TTL (float): Seconds a resolved hostname is reused before resolving it again (0 disables).
+        HAPPY_EYEBALLS_DELAY (float): Seconds to wait for one address before also trying the next.
         LOG_LEVEL (str): The logging level for the application.
         LOG_FILE (str): The file path for logging.
         DEFAULT_ENCODING (str): The default character encoding for string operations.
+        WORD_LIST (str): Path of the dictionary, as a text word list or a packed binary word file (.bin);
+            defaults to the repository's word_list.txt, wherever the client is run from.
+        ANSWER_LIST (str): Path of the words that can be answers, in the same formats (unset: every word in
+            WORD_LIST); every answer must also be in WORD_LIST, which holds the allowed guesses.
+        ALPHABET (str): The letters words are made of; the word length is that of the words in WORD_LIST.
+        CACHE_DIR (str): Directory for precomputed data such as the pattern matrix (defaults to the
+            repository's .cache directory).
+        USE_PATTERN_MATRIX (bool): Whether to filter words using the precomputed pattern matrix.
+        STRATEGY (str): The guess selection strategy ('frequency', 'entropy' or 'ranked').
+        GUESS_FROM_ALL_WORDS (bool): Whether the entropy strategy may guess words that are no longer possible.
+        USE_OPENING_BOOK (bool): Whether to look up early guesses in a prebuilt opening book, if one exists.
+        RANK_SHORTLIST_SIZE (int): Number of guesses the 'ranked' strategy shortlists by letter frequency.
+        RERANK_SCORER (str): Score the 'ranked' strategy reranks its shortlist with
+            ('entropy' or 'expected_remaining').
+        TURN_TIME_BUDGET (float): Seconds the 'ranked' strategy may spend reranking per turn (0 for no limit).
+        SCORING_WORKERS (int): Worker processes the 'entropy' strategy scores guesses with
+            (0 or 1 to score in-process, negative for one per CPU).
+        PARALLEL_SCORING_THRESHOLD (int): Fewest guesses x candidates worth scoring with the workers.
+        SPECULATIVE_PATTERNS (int): Number of the likeliest replies to a guess in flight whose follow-up guess
+            is computed in the background while waiting for the server (0 disables).
+        GUESS_CACHE_SIZE (int): Most candidate sets whose best guess is memoized per process (0 disables).
+        PERSIST_GUESS_CACHE (bool): Whether to save the guess cache under CACHE_DIR at exit and reload it.
+        VALIDATE_RESPONSES (bool): Whether to fully decode every server reply instead of only the fields used.
+        TRANSCRIPT_FILE (str): File every connection's sent and received messages are appended to (unset disables).
+        STATS (str): Record hot-path timers and counters and dump them at exit in this format
+            ('json' or 'prometheus'); empty to disable.
+        STATS_FILE (str): File the stats are written to (stderr if unset).
+        SOLVER_SOCKET (str): Unix domain socket of the optional solver daemon, which the client asks for
+            guesses when it is running (empty, the default, always solves in-process).
+        SOLVER_TIMEOUT (float): Seconds to wait for the solver daemon before solving in-process (0 to wait
+            indefinitely).
     """
 
     DEFAULT_PORT: int = int(os.getenv('DEFAULT_PORT', 27993))
@@ -26,6 +69,36 @@ class Config:
     MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', 500))
     INITIAL_GUESS: str = os.getenv('INITIAL_GUESS', "salet")
     BUFFER_SIZE: int = int(os.getenv('BUFFER_SIZE', 1024))
+    MAX_MESSAGE_SIZE: int = int(os.getenv('MAX_MESSAGE_SIZE', 1024 * 1024))
+    TLS_CA_FILE: str = os.getenv('TLS_CA_FILE')
+    TCP_NODELAY: bool = bool(int(os.getenv('TCP_NODELAY', 1)))
+    TCP_KEEPALIVE: bool = bool(int(os.getenv('TCP_KEEPALIVE', 0)))
+    CONNECT_TIMEOUT: float = float(os.getenv('CONNECT_TIMEOUT', 10))
+    READ_TIMEOUT: float = float(os.getenv('READ_TIMEOUT', 0))
+    DNS_CACHE_TTL: float = float(os.getenv('DNS_CACHE_TTL', 300))
+    HAPPY_EYEBALLS_DELAY: float = float(os.getenv('HAPPY_EYEBALLS_DELAY', 0.25))
     LOG_LEVEL: int = int(os.getenv('LOG_LEVEL', logging.WARN))
     LOG_FILE: str = os.getenv('LOG_FILE', 'app.log')
     DEFAULT_ENCODING: str = 'ascii'
+    WORD_LIST: str = os.getenv('WORD_LIST', os.path.join(_ROOT_DIR, 'word_list.txt'))
+    ANSWER_LIST: str = os.getenv('ANSWER_LIST')
+    ALPHABET: str = os.getenv('ALPHABET', 'abcdefghijklmnopqrstuvwxyz')
+    CACHE_DIR: str = os.getenv('CACHE_DIR', os.path.join(_ROOT_DIR, '.cache'))
+    USE_PATTERN_MATRIX: bool = bool(int(os.getenv('USE_PATTERN_MATRIX', 0)))
+    STRATEGY: str = os.getenv('STRATEGY', 'frequency')
+    GUESS_FROM_ALL_WORDS: bool = bool(int(os.getenv('GUESS_FROM_ALL_WORDS', 1)))
+    USE_OPENING_BOOK: bool = bool(int(os.getenv('USE_OPENING_BOOK', 1)))
+    RANK_SHORTLIST_SIZE: int = int(os.getenv('RANK_SHORTLIST_SIZE', 100))
+    RERANK_SCORER: str = os.getenv('RERANK_SCORER', 'entropy')
+    TURN_TIME_BUDGET: float = float(os.getenv('TURN_TIME_BUDGET', 0.05))
+    SCORING_WORKERS: int = int(os.getenv('SCORING_WORKERS', 0))
+    PARALLEL_SCORING_THRESHOLD: int = int(os.getenv('PARALLEL_SCORING_THRESHOLD', 4_000_000))
+    SPECULATIVE_PATTERNS: int = int(os.getenv('SPECULATIVE_PATTERNS', 0))
+    GUESS_CACHE_SIZE: int = int(os.getenv('GUESS_CACHE_SIZE', 65536))
+    PERSIST_GUESS_CACHE: bool = bool(int(os.getenv('PERSIST_GUESS_CACHE', 0)))
+    VALIDATE_RESPONSES: bool = bool(int(os.getenv('VALIDATE_RESPONSES', 0)))
+    TRANSCRIPT_FILE: str = os.getenv('TRANSCRIPT_FILE')
+    STATS: str = os.getenv('STATS', '')
+    STATS_FILE: str = os.getenv('STATS_FILE')
+    SOLVER_SOCKET: str = os.getenv('SOLVER_SOCKET', '')
+    SOLVER_TIMEOUT: float = float(os.getenv('SOLVER_TIMEOUT', 30))
@@ -0,0 +1,98 @@
+"""
+The dictionary a game is played with.
+
+A Dictionary bundles the words allowed as guesses, the subset of them that can
+be answers and the alphabet their letters come from; the word length is that
+of the words. Its content hash covers all three, and everything derived from
+a dictionary (the word index, the pattern matrix, opening books and guess
+caches) is cached in Config.CACHE_DIR under a key derived from its content, so
+each is built once per dictionary, on first use, and reused by later runs and
+by any process switching back to the same dictionary.
+"""
+
+import hashlib
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.patterns import pattern_dtype
+from src.word_bank import WordBank, get_word_bank, validate_alphabet
+
+# Dictionaries already loaded in this process, keyed by word list, answer list and alphabet.
+_loaded_dictionaries: Dict[Tuple[str, Optional[str], str], "Dictionary"] = {}
+
+
+class Dictionary:
+    """
+    Allowed guesses, possible answers and alphabet of a game.
+
+    Word IDs are those of the allowed guesses, which include every answer.
+
+    Attributes:
+        words (WordBank): The words allowed as guesses, in word ID order.
+        answers (WordBank): The words that can be answers (words itself when every word can be).
+        answer_ids (Optional[np.ndarray]): Sorted word IDs of the answers, or None when every word can be one.
+        alphabet (str): The letters words are made of.
+        word_length (int): The number of letters in every word.
+        content_hash (str): Hex SHA-256 of the alphabet, the words and the answers.
+    """
+
+    def __init__(self, words: WordBank, answers: Optional[WordBank] = None):
+        validate_alphabet(words.alphabet)
+        pattern_dtype(words.word_length)
+        self.words = words
+        self.answers = words if answers is None else answers
+        self.alphabet = words.alphabet
+        self.word_length = words.word_length
+        self.answer_ids: Optional[np.ndarray] = None
+        self.content_hash = words.content_hash
+        if self.answers is not words:
+            if self.answers.word_length != words.word_length:
+                raise ValueError(f"Answers have {self.answers.word_length} letters, "
+                                 f"guesses have {words.word_length}")
+            missing = [answer for answer in self.answers if answer not in words]
+            if missing:
+                raise ValueError(f"{len(missing)} answers are not allowed guesses, e.g. {missing[0]!r}")
+            self.answer_ids = np.unique([words.word_ids[answer] for answer in self.answers]).astype(np.int32)
+            key = f"{words.content_hash}:{self.answers.content_hash}"
+            self.content_hash = hashlib.sha256(key.encode(Config.DEFAULT_ENCODING)).hexdigest()
+
+    def answer_mask(self) -> np.ndarray:
+        """
+        Get the words that can be answers as a bitset.
+
+        Returns:
+            np.ndarray: A new bool array, True for the word IDs of the answers.
+        """
+        if self.answer_ids is None:
+            return np.ones(len(self.words), dtype=bool)
+        mask = np.zeros(len(self.words), dtype=bool)
+        mask[self.answer_ids] = True
+        return mask
+
+
+def get_dictionary(word_list: str = None, answer_list: str = None, alphabet: str = None) -> Dictionary:
+    """
+    Get the shared dictionary for word list files, loading it on first use in this process.
+
+    Args:
+        word_list (str): The allowed guesses (defaults to Config.WORD_LIST).
+        answer_list (str): The possible answers (defaults to Config.ANSWER_LIST; unset for every word).
+        alphabet (str): The letters words are made of (defaults to Config.ALPHABET).
+
+    Returns:
+        Dictionary: The dictionary.
+
+    Raises:
+        ValueError: If the lists are invalid, of different lengths, or an answer is not an allowed guess.
+    """
+    word_list = word_list or Config.WORD_LIST
+    answer_list = answer_list or Config.ANSWER_LIST
+    alphabet = alphabet or Config.ALPHABET
+    key = (word_list, answer_list, alphabet)
+    if key not in _loaded_dictionaries:
+        words = get_word_bank(word_list, alphabet)
+        answers = get_word_bank(answer_list, alphabet) if answer_list else None
+        _loaded_dictionaries[key] = Dictionary(words, answers)
+    return _loaded_dictionaries[key]
@@ -1,9 +1,27 @@
-import json
 import logging
 import sys
-from collections import Counter
-from typing import List, Set, Dict
+import time
+from typing import List, Set, Dict, Optional
+
+import numpy as np
+
+from src import stats
 from src.config import Config
+from src.dictionary import Dictionary, get_dictionary
+from src.game_state import GameState, letters_of
+from src.guess_cache import GuessCache, candidate_fingerprint, get_guess_cache
+from src.opening_book import OpeningBook, load_opening_book
+from src.parallel_scoring import get_scoring_pool
+from src.patterns import PatternMatrix, load_pattern_matrix
+from src.protocol import GuessEncoder, decode_response, encode_hello
+from src.speculation import Speculation, likely_patterns
+from src.strategy import (ENTROPY, RANKED, STRATEGIES, choose_entropy_guess, choose_frequency_guess,
+                          choose_ranked_guess)
+from src.word_bank import WordBank
+from src.word_index import WordIndex, get_word_index
+
+# The handler writing the 'App' logger to Config.LOG_FILE, added once per process.
+_log_handler: Optional[logging.Handler] = None
 
 
 class Game:
@@ -17,52 +35,315 @@ class Game:
     Attributes:
         sock: The socket connection to the game server.
         username (str): The username for the game.
+        strategy (str): The guess selection strategy ('frequency', 'entropy' or 'ranked').
         game_id (str): The unique identifier for the current game.
-        word_list (List[str]): A list of all possible Wordle words.
+        state (GameState): The compact per-game solver state; everything else is shared between games.
+        history (List[Dict]): The guesses processed so far in this game, each with a "word" and its "marks".
+        dictionary (Dictionary): The allowed guesses, possible answers and alphabet, shared by every Game using them.
+        word_list (WordBank): The words allowed as guesses (the dictionary's words), by word ID.
+        index (WordIndex): Shared letter index over word_list, loaded on first use.
+        possible_mask (np.ndarray): Bitset (by word ID) of the words that are still possible solutions.
         possible_words (Set[str]): The set of words that are still possible solutions.
-        must_contain (Set[str]): Set of letters that must be in the solution.
-        position_constraints (List[Set[str]]): Constraints for each position in the word.
+        must_contain (Set[str]): Set of letters that must be in the solution (read-only view of state).
+        position_constraints (List[Set[str]]): Constraints for each position in the word (read-only view of state).
+        min_counts (Dict[str, int]): Least number of copies of each letter known to be in the solution.
+        max_counts (Dict[str, int]): Most number of copies of each letter, once known exactly.
+        patterns (Optional[PatternMatrix]): Precomputed feedback patterns, if enabled in Config (loaded on first use).
+        opening_book (Optional[OpeningBook]): Precomputed early guesses, loaded on first use.
+        guess_cache (Optional[GuessCache]): Process-wide memo of the best guess per candidate set.
+        possible_ids (np.ndarray): Word IDs of the words that are still possible solutions.
         logger (logging.Logger): Logger for the game.
+        config (type): The configuration the solver settings are read from: Config, or a subclass overriding some
+            of them (see Game._solver_settings).
     """
-    def __init__(self, sock, username: str, log_level: int = logging.DEBUG):
+    def __init__(self, sock, username: str, log_level: int = logging.DEBUG, strategy: str = Config.STRATEGY,
+                 dictionary: Optional[Dictionary] = None, config: type = Config):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}', expected one of {STRATEGIES}")
         self.sock = sock
         self.username = username
+        self.strategy = strategy
+        self.config = config
         self.game_id = ""
-        self.word_list = self._load_word_list()
-        self.possible_words = set(self.word_list)
-        self.must_contain: Set[str] = set()
-        self.position_constraints: List[Set[str]] = [set('abcdefghijklmnopqrstuvwxyz') for _ in range(5)]
+        self.dictionary = dictionary or get_dictionary()
+        self.word_list: WordBank = self.dictionary.words
+        self._initial_state: Optional[GameState] = None
+        self.state = self.new_state()
+        self._guess_encoder: Optional[GuessEncoder] = None
+        self._index: Optional[WordIndex] = None
+        self._patterns: Optional[PatternMatrix] = None
+        self._patterns_loaded = False
+        self._initial_guess: Optional[str] = None
+        self._opening_book: Optional[OpeningBook] = None
+        self._opening_book_loaded = not Config.USE_OPENING_BOOK
+        self._guess_cache: Optional[GuessCache] = None
+        self._guess_cache_loaded = False
+        self._speculator: Optional[Game] = None
+        self._speculation: Optional[Speculation] = None
         self.logger = self._setup_logger(log_level)
 
-    def _setup_logger(self, level: int = logging.DEBUG) -> logging.Logger:
+    def reset(self) -> None:
         """
-        Set up and configure the logger.
+        Reset the per-game state so this instance can play a new game.
+
+        The loaded dictionary, index and pattern matrix are kept.
+        """
+        self.game_id = ""
+        self.state = self.new_state()
+        self._cancel_speculation()
+
+    def new_game(self, sock) -> None:
+        """
+        Prepare this instance to play another game over a new connection.
+
+        This is much cheaper than constructing a new Game: only the per-game
+        state is reset, and the dictionary, indexes and logger are reused.
 
         Args:
-            level (int): The logging level.
+            sock: The connected socket to play the next game on.
+        """
+        self.reset()
+        self.sock = sock
+
+    def new_state(self) -> GameState:
+        """
+        Create the solver state of a game that has not started, with every answer still possible.
 
         Returns:
-            logging.Logger: Configured logger instance.
+            GameState: A new state, to keep (and pass to next_guess_for) per game.
         """
-        logger = logging.getLogger('App')
-        logger.setLevel(level)
-        file_handler = logging.FileHandler(Config.LOG_FILE, 'w')
-        file_handler.setLevel(level)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        return logger
+        if self._initial_state is None:
+            state = GameState(self.dictionary.word_length, self.dictionary.alphabet)
+            if self.dictionary.answer_ids is not None:
+                state.set_mask(self.dictionary.answer_mask())
+            self._initial_state = state
+        return self._initial_state.copy()
+
+    @property
+    def index(self) -> WordIndex:
+        """
+        Get the shared letter index of the dictionary, loading it on first use.
+
+        Returns:
+            WordIndex: The index over word_list.
+        """
+        if self._index is None:
+            self._index = get_word_index(self.word_list)
+        return self._index
+
+    @index.setter
+    def index(self, index: WordIndex) -> None:
+        self._index = index
+
+    @property
+    def patterns(self) -> Optional[PatternMatrix]:
+        """
+        Get the shared pattern matrix of the dictionary, loading it on first use.
+
+        Returns:
+            Optional[PatternMatrix]: The matrix, or None unless Config.USE_PATTERN_MATRIX is set or
+            the strategy is 'entropy'.
+        """
+        if not self._patterns_loaded:
+            if self.config.USE_PATTERN_MATRIX or self.strategy == ENTROPY:
+                self._patterns = load_pattern_matrix(self.word_list)
+            self._patterns_loaded = True
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, patterns: Optional[PatternMatrix]) -> None:
+        self._patterns = patterns
+        self._patterns_loaded = True
+
+    @property
+    def opening_book(self) -> Optional[OpeningBook]:
+        """
+        Get the opening book for this dictionary and solver, loading it on first use.
+
+        Returns:
+            Optional[OpeningBook]: The book, or None if disabled or not built.
+        """
+        if not self._opening_book_loaded:
+            self._opening_book = load_opening_book(self.dictionary, self._solver_settings())
+            self._opening_book_loaded = True
+        return self._opening_book
+
+    @property
+    def guess_cache(self) -> Optional[GuessCache]:
+        """
+        Get the shared guess cache for this dictionary and solver, creating it on first use.
+
+        Returns:
+            Optional[GuessCache]: The cache, or None if disabled.
+        """
+        if not self._guess_cache_loaded:
+            self._guess_cache = get_guess_cache(self.word_list, self._solver_settings())
+            self._guess_cache_loaded = True
+        return self._guess_cache
+
+    def _solver_settings(self) -> Dict:
+        """
+        Get the settings that determine which guesses the solver picks.
+
+        Returns:
+            Dict: Settings that an opening book must have been built with to be used.
+        """
+        settings = {
+            "strategy": self.strategy,
+            "initial_guess": self.config.INITIAL_GUESS if self.config.INITIAL_GUESS in self.word_list else None,
+            "use_pattern_matrix": self.patterns is not None,
+            "guess_from_all_words": self.config.GUESS_FROM_ALL_WORDS,
+        }
+        if self.strategy == RANKED:
+            settings.update(shortlist_size=self.config.RANK_SHORTLIST_SIZE, rerank_scorer=self.config.RERANK_SCORER,
+                            turn_time_budget=self.config.TURN_TIME_BUDGET)
+        return settings
+
+    def _snapshot_state(self) -> GameState:
+        """
+        Copy the per-game solver state.
+
+        Returns:
+            GameState: A snapshot that can be passed to _restore_state.
+        """
+        return self.state.copy()
+
+    def _restore_state(self, state: GameState) -> None:
+        """
+        Restore the per-game solver state from a snapshot.
+
+        Args:
+            state (GameState): A snapshot taken by _snapshot_state.
+        """
+        self.state = state.copy()
+
+    def next_guess_for(self, state: GameState, response: Dict) -> str:
+        """
+        Determine the next guess of a game whose state is kept outside this solver.
+
+        This lets one solver play many games at once: each game only keeps its
+        own GameState, which is updated in place.
+
+        Args:
+            state (GameState): The game's state.
+            response (Dict): The game's response to the previous guess.
+
+        Returns:
+            str: The next word to guess.
+        """
+        self.state = state
+        return self._get_next_guess(response)
+
+    @property
+    def history(self) -> List[Dict]:
+        """
+        Get the guesses processed so far in this game.
+
+        Returns:
+            List[Dict]: The guesses, each with a "word" and its "marks".
+        """
+        return self.state.history
+
+    @property
+    def possible_mask(self) -> np.ndarray:
+        """
+        Get the words that are still possible solutions as a bitset.
+
+        Returns:
+            np.ndarray: A new bitset (by word ID) built from the state's candidate IDs.
+        """
+        return self.state.mask(len(self.word_list))
+
+    @possible_mask.setter
+    def possible_mask(self, mask: np.ndarray) -> None:
+        self.state.set_mask(mask)
+
+    @property
+    def must_contain(self) -> Set[str]:
+        """
+        Get the letters that must be in the solution.
+
+        Returns:
+            Set[str]: The letters, decoded from the state's bitmask.
+        """
+        return letters_of(self.state.must_contain, self.state.alphabet)
+
+    @property
+    def position_constraints(self) -> List[Set[str]]:
+        """
+        Get the letters allowed at each position.
+
+        Returns:
+            List[Set[str]]: The allowed letters per position, decoded from the state's bitmasks.
+        """
+        return [letters_of(allowed, self.state.alphabet) for allowed in self.state.positions]
+
+    @property
+    def min_counts(self) -> Dict[str, int]:
+        """
+        Get the least number of copies of each letter known to be in the solution.
+
+        Returns:
+            Dict[str, int]: The lower bounds, decoded from the state.
+        """
+        return self.state.min_count_map()
+
+    @property
+    def max_counts(self) -> Dict[str, int]:
+        """
+        Get the exact number of copies of each letter whose count is known.
+
+        Returns:
+            Dict[str, int]: The exact counts, decoded from the state.
+        """
+        return self.state.max_count_map()
+
+    @property
+    def possible_words(self) -> Set[str]:
+        """
+        Get the words that are still possible solutions.
+
+        Returns:
+            Set[str]: The possible words, looked up from the candidate bitset.
+        """
+        return set(self.index.words_of(self.possible_mask))
+
+    @possible_words.setter
+    def possible_words(self, words: Set[str]) -> None:
+        self.possible_mask = self.index.mask_of(words)
+
+    @property
+    def possible_ids(self) -> np.ndarray:
+        """
+        Get the word IDs of the words that are still possible solutions.
+
+        Returns:
+            np.ndarray: Sorted word IDs of the candidates.
+        """
+        return self.state.candidate_ids(len(self.word_list))
 
     @staticmethod
-    def _load_word_list() -> List[str]:
+    def _setup_logger(level: int = logging.DEBUG) -> logging.Logger:
         """
-        Load the word list from a file.
+        Set up and configure the logger.
+
+        The file handler is only added the first time this is called in a
+        process; later calls just set the level of the shared 'App' logger.
+
+        Args:
+            level (int): The logging level.
 
         Returns:
-            List[str]: List of words loaded from the file.
+            logging.Logger: Configured logger instance.
         """
-        with open('word_list.txt', 'r') as f:
-            return [word.strip() for word in f]
+        global _log_handler
+        logger = logging.getLogger('App')
+        logger.setLevel(level)
+        if _log_handler is None:
+            _log_handler = logging.FileHandler(Config.LOG_FILE, 'w', delay=True)
+            _log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+            logger.addHandler(_log_handler)
+        return logger
 
     def start_game(self) -> None:
         """
@@ -83,6 +364,9 @@ class Game:
         """
         Determine the next guess based on the game's response.
 
+        Only the last entry of the response's guess history is read: the earlier
+        guesses were processed on previous turns and are kept in self.history.
+
         Args:
             response (Dict): The game's response to the previous guess.
 
@@ -93,76 +377,164 @@ class Game:
         marks = last_guess["marks"]
         guess = last_guess["word"]
 
-        self.logger.info(f"Processing guess: {guess} with marks: {marks}")
-        self._update_constraints(guess, marks)
-        self._filter_possible_words()
+        speculation, self._speculation = self._speculation, None
+        if speculation is not None and speculation.base is self.state:
+            speculated = speculation.result(guess, marks)
+            if speculated is not None:
+                self.state, next_guess = speculated
+                stats.increment("speculation_hits")
+                self.logger.info("Chose next guess: %s computed while %s was in flight", next_guess, guess)
+                return next_guess
+            stats.increment("speculation_misses")
+
+        self.history.append(last_guess)
+
+        self.logger.info("Processing guess: %s with marks: %s", guess, marks)
+        with stats.timer("update_constraints"):
+            self._update_constraints(guess, marks)
+        with stats.timer("filter"):
+            self._filter_possible_words(guess, marks)
+        stats.observe("candidates_remaining", self.state.count(len(self.word_list)))
+
+        if self.opening_book is not None:
+            with stats.timer("opening_book"):
+                next_guess = self.opening_book.lookup(self.history)
+            if next_guess is not None:
+                self.logger.info("Chose next guess: %s from the opening book", next_guess)
+                return next_guess
+
+        return self._compute_next_guess()
+
+    def _compute_next_guess(self) -> str:
+        """
+        Compute the next guess from the current constraints.
+
+        The best guess for a candidate set already solved in this process is
+        taken from the guess cache.
 
-        if len(self.possible_words) <= 2:
-            next_guess = next(iter(self.possible_words))
-            self.logger.info(f"Only {len(self.possible_words)} words left. Choosing {next_guess}")
+        Returns:
+            str: The next word to guess.
+        """
+        remaining = self.state.count(len(self.word_list))
+        if remaining <= 2:
+            next_guess = self.word_list[int(self.possible_ids[0])]
+            self.logger.info("Only %d words left. Choosing %s", remaining, next_guess)
             return next_guess
 
-        next_guess = self._choose_best_guess()
-        self.logger.info(f"Chose next guess: {next_guess} based on letter frequency")
+        cache = self.guess_cache
+        if cache is not None:
+            key = candidate_fingerprint(self.possible_mask)
+            next_guess = cache.get(key)
+            if next_guess is not None:
+                self.logger.info("Chose next guess: %s from the guess cache", next_guess)
+                return next_guess
+
+        with stats.timer("choose_guess"):
+            next_guess = self._choose_best_guess()
+        if cache is not None:
+            cache.put(key, next_guess)
+        self.logger.info("Chose next guess: %s based on %s", next_guess, self.strategy)
         return next_guess
 
     def _update_constraints(self, guess: str, marks: List[int]) -> None:
         """
         Update the game constraints based on the latest guess and its marks.
 
+        See GameState.apply_feedback for how the marks constrain each position
+        and the letter counts.
+
         Args:
             guess (str): The last guessed word.
             marks (List[int]): The marks received for the last guess.
         """
-        for i, (letter, mark) in enumerate(zip(guess, marks)):
-            if mark == 2:  # Correct letter and position
-                self.position_constraints[i] = {letter}
-                self.must_contain.add(letter)
-            elif mark == 1:  # Correct letter, wrong position
-                self.position_constraints[i].discard(letter)
-                self.must_contain.add(letter)
-            elif mark == 0:  # Letter not in word
-                self.position_constraints[i].discard(letter)
-
+        self.state.apply_feedback(guess, marks)
         self._log_current_state(guess)
 
     def _log_current_state(self, guess: str) -> None:
         """
         Log the current state of the game after processing a guess.
 
+        Nothing is formatted unless INFO logging is enabled.
+
         Args:
             guess (str): The last guessed word.
         """
-        self.logger.info(f"Current state after processing guess {guess}:")
-        self.logger.info(f"Must contain letters: {self.must_contain}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Current state after processing guess %s:", guess)
+        self.logger.info("Must contain letters: %s", self.must_contain)
         for i, constraint in enumerate(self.position_constraints):
-            self.logger.info(f"Position {i} can have letters: {constraint}")
+            self.logger.info("Position %d can have letters: %s", i, constraint)
+        self.logger.info("Letter counts: at least %s, at most %s", self.min_counts, self.max_counts)
 
-    def _filter_possible_words(self) -> None:
+    def _filter_possible_words(self, guess: Optional[str] = None, marks: Optional[List[int]] = None) -> None:
         """
         Filter the possible words based on current constraints.
-        """
-        old_possible_words = set(self.possible_words)
-        self.possible_words = {
-            word for word in self.possible_words
-            if all(letter in word for letter in self.must_contain) and
-               all(word[i] in constraint for i, constraint in enumerate(self.position_constraints))
-        }
-        removed_words = old_possible_words - self.possible_words
-        self.logger.debug(f"Removed words: {removed_words}")
 
-        if not self.possible_words:
+        Earlier guesses have already been applied to the candidates, so only the
+        last guess and its marks are checked, as bitwise ANDs over the shared word
+        index (or, when the pattern matrix is enabled and the guess is in the
+        dictionary, by keeping the words whose feedback pattern for the guess
+        equals the observed marks). Once only a few candidates are left, just
+        their own bits are read. Without a guess, every accumulated constraint
+        is re-applied.
+
+        Args:
+            guess (Optional[str]): The last guessed word.
+            marks (Optional[List[int]]): The marks received for the last guess.
+        """
+        old_state = self.state.copy() if self.logger.isEnabledFor(logging.DEBUG) else None
+        old_ids = self.state.ids
+        use_patterns = self.patterns is not None and guess in self.patterns.words
+        if guess is None or marks is None:
+            self.possible_mask = self.index.filter(self.possible_mask, self.must_contain, self.position_constraints,
+                                                   self.min_counts, self.max_counts)
+        elif old_ids is not None:
+            if use_patterns:
+                self.state.set_ids(self.patterns.filter(old_ids, guess, marks))
+            else:
+                self.state.set_ids(self.index.filter_feedback_ids(old_ids, guess, marks))
+        elif use_patterns:
+            self.possible_mask = self.possible_mask & self.patterns.matches(guess, marks)
+        else:
+            self.possible_mask = self.index.filter_feedback(self.possible_mask, guess, marks)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            removed = np.setdiff1d(old_state.candidate_ids(len(self.word_list)), self.possible_ids)
+            self.logger.debug("Removed words: %s", {self.word_list[int(i)] for i in removed})
+
+        if self.state.count(len(self.word_list)) == 0:
             self.logger.error("No possible words left! Current constraints may be too restrictive.")
 
     def _choose_best_guess(self) -> str:
         """
-        Choose the best next guess based on letter frequency.
+        Choose the best next guess using the configured strategy.
+
+        The 'frequency' strategy scores possible words by letter frequency. The
+        'entropy' strategy picks the guess with the highest expected information
+        gain, optionally considering every word in the dictionary as a guess;
+        large candidate sets are scored by worker processes if
+        Config.SCORING_WORKERS is set. The 'ranked' strategy shortlists guesses
+        by letter frequency and reranks the shortlist by expected information
+        (or expected candidates left) until Config.TURN_TIME_BUDGET runs out.
 
         Returns:
             str: The best word to guess next.
         """
-        letter_freq = Counter(letter for word in self.possible_words for letter in set(word))
-        return max(self.possible_words, key=lambda word: sum(letter_freq[letter] for letter in set(word)))
+        guess_ids = np.arange(len(self.word_list)) if self.config.GUESS_FROM_ALL_WORDS else None
+        if self.strategy == ENTROPY:
+            pool_size = len(self.word_list) if guess_ids is not None else len(self.possible_ids)
+            if pool_size * len(self.possible_ids) >= Config.PARALLEL_SCORING_THRESHOLD:
+                pool = get_scoring_pool(self.patterns)
+                if pool is not None:
+                    return pool.choose_entropy_guess(self.possible_mask, guess_ids is not None)
+            return choose_entropy_guess(self.patterns, self.possible_ids, guess_ids)
+        if self.strategy == RANKED:
+            budget = self.config.TURN_TIME_BUDGET
+            deadline = time.perf_counter() + budget if budget > 0 else None
+            return choose_ranked_guess(self.index, self.possible_mask, guess_ids, self.config.RANK_SHORTLIST_SIZE,
+                                       deadline, self.config.RERANK_SCORER, self.patterns)
+        return choose_frequency_guess([self.word_list[int(i)] for i in self.possible_ids])
 
     def _send_recv_hello_message(self) -> None:
         """
@@ -170,11 +542,13 @@ class Game:
         If an error occurs, close the connection and exit the program.
         """
         try:
-            msg = json.dumps({"type": "hello", "northeastern_username": self.username}) + '\n'
-            encoded_msg = msg.encode(Config.DEFAULT_ENCODING)
-            self.sock.send_msg(encoded_msg)
-            msg_recv = self.sock.recv_msg()
-            response_dict = json.loads(msg_recv)
+            with stats.timer("json_encode"):
+                encoded_msg = encode_hello(self.username)
+            with stats.timer("round_trip"):
+                self.sock.send_msg(encoded_msg)
+                msg_recv = self.sock.recv_msg()
+            with stats.timer("json_decode"):
+                response_dict = decode_response(msg_recv, validate=True)
 
             if response_dict['type'] == "error":
                 print(f"Error from server: {response_dict['message']}")
@@ -192,17 +566,79 @@ class Game:
             sys.exit(1)
 
     def _guess_word(self, word: str = "salet") -> Dict:
-        msg = json.dumps({"type": "guess", "id": self.game_id, "word": word}) + '\n'
-        encoded_msg = msg.encode(Config.DEFAULT_ENCODING)
-        self.sock.send_msg(encoded_msg)
-        msg_recv = self.sock.recv_msg()
-        return json.loads(msg_recv)
+        """
+        Send a guess to the game server and receive its reply.
+
+        The guess message is built from parts encoded once per game, and a retry
+        reply is decoded down to its type and last guess (see src.protocol),
+        unless Config.VALIDATE_RESPONSES asks for full decoding.
+
+        Args:
+            word (str): The word to guess.
+
+        Returns:
+            Dict: The server's reply.
+        """
+        with stats.timer("json_encode"):
+            if self._guess_encoder is None or self._guess_encoder.game_id != self.game_id:
+                self._guess_encoder = GuessEncoder(self.game_id)
+            encoded_msg = self._guess_encoder.encode(word)
+        with stats.timer("round_trip"):
+            self.sock.send_msg(encoded_msg)
+            if Config.SPECULATIVE_PATTERNS > 0:
+                self._start_speculation(word)
+            msg_recv = self.sock.recv_msg()
+        with stats.timer("json_decode"):
+            response = decode_response(msg_recv, Config.VALIDATE_RESPONSES)
+        if response["type"] != "retry":
+            self._cancel_speculation()
+        return response
 
-    def _get_initial_guess(self):
+    def _start_speculation(self, guess: str) -> None:
+        """
+        Start computing the follow-ups to a guess in flight for its likeliest replies.
+
+        The follow-ups are computed on a background thread by a second solver
+        sharing this one's dictionary, indexes and caches (see src.speculation).
+
+        Args:
+            guess (str): The guess just sent.
+        """
+        self._cancel_speculation()
+        codes = likely_patterns(self, guess, Config.SPECULATIVE_PATTERNS)
+        if not codes:
+            return
+        if self._speculator is None:
+            self._speculator = Game(None, self.username, log_level=self.logger.level, strategy=self.strategy,
+                                    dictionary=self.dictionary, config=self.config)
+        self._speculation = Speculation(self.state, guess, codes)
+        self._speculation.start(self._speculator)
+
+    def _cancel_speculation(self) -> None:
+        """
+        Stop the speculation for the guess in flight, if any, and discard its results.
+        """
+        if self._speculation is not None:
+            self._speculation.cancel()
+            self._speculation = None
+
+    def _get_initial_guess(self) -> str:
         """
         Get the initial guess for the game.
 
+        Config.INITIAL_GUESS is used when it is a word of the dictionary. For
+        other dictionaries the strategy's best guess over every answer is
+        computed once (and kept in the guess cache like any other guess).
+
         Returns:
             str: The initial guess word.
         """
-        return Config.INITIAL_GUESS
+        if self.config.INITIAL_GUESS in self.word_list:
+            return self.config.INITIAL_GUESS
+        if self._initial_guess is None:
+            state, self.state = self.state, self.new_state()
+            try:
+                self._initial_guess = self._compute_next_guess()
+            finally:
+                self.state = state
+        return self._initial_guess
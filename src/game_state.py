@@ -0,0 +1,257 @@
+"""
+Compact per-game solver state.
+
+Everything a solver knows about one game (the remaining candidates and the
+letter constraints learned so far) lives in a GameState, apart from the
+dictionary, indexes and caches that every game in a process shares. Letter
+sets are bitmasks (bit i is ALPHABET[i]), letter counts are one byte per
+letter, and the candidates are a packed bitset (one bit per word) that turns
+into an int32 array of word IDs once that is smaller. A game's state takes at
+most about 2.5 KB for a 16,000-word dictionary (a few hundred bytes once few
+candidates are left), so one process can keep tens of thousands of games alive.
+The alphabet's lookup tables are shared by every state using it.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from src.word_index import ALPHABET
+
+# Count stored in max_counts for a letter whose exact count is not known yet.
+UNKNOWN_COUNT = 255
+
+# Candidates are stored as word IDs (4 bytes each) rather than a packed bitset
+# (1 bit per word) once at most 1 / _SPARSE_RATIO of the words are left.
+_SPARSE_RATIO = 32
+
+
+class _Letters(NamedTuple):
+    """The lookup tables of one alphabet."""
+    index: Dict[str, int]
+    bits: Dict[str, int]
+    all_letters: int
+    no_min_counts: bytes
+    no_max_counts: bytes
+
+
+# Lookup tables already built in this process, keyed by alphabet.
+_letter_tables: Dict[str, _Letters] = {}
+
+
+def _letters(alphabet: str) -> _Letters:
+    """
+    Get the lookup tables of an alphabet, building them on first use.
+
+    Args:
+        alphabet (str): The alphabet.
+
+    Returns:
+        _Letters: The letter indexes and bits, and the initial count tables.
+    """
+    if alphabet not in _letter_tables:
+        _letter_tables[alphabet] = _Letters({letter: i for i, letter in enumerate(alphabet)},
+                                            {letter: 1 << i for i, letter in enumerate(alphabet)},
+                                            (1 << len(alphabet)) - 1, bytes(len(alphabet)),
+                                            bytes([UNKNOWN_COUNT]) * len(alphabet))
+    return _letter_tables[alphabet]
+
+
+def letters_of(bits: int, alphabet: str = ALPHABET) -> Set[str]:
+    """
+    Get the letters in a letter bitmask.
+
+    Args:
+        bits (int): The bitmask.
+        alphabet (str): The alphabet the bits stand for.
+
+    Returns:
+        Set[str]: The letters whose bits are set.
+    """
+    return {letter for letter, bit in _letters(alphabet).bits.items() if bits & bit}
+
+
+class GameState:
+    """
+    The solver state of one game.
+
+    Candidate arrays are never modified in place, so copies share them.
+
+    Attributes:
+        alphabet (str): The letters words are made of; bit i of a letter bitmask is alphabet[i].
+        size (int): The number of words still possible (-1 until the first filter, when every word is).
+        bitset (Optional[np.ndarray]): The words still possible as a packed bitset, while there are many.
+        ids (Optional[np.ndarray]): Sorted int32 word IDs of the words still possible, once there are few.
+        must_contain (int): Bitmask of the letters that must be in the solution.
+        positions (Tuple[int, ...]): Bitmask of the letters allowed at each position.
+        min_counts (bytes): Least number of copies of each letter known to be in the solution.
+        max_counts (bytes): Most number of copies of each letter, or UNKNOWN_COUNT until known exactly.
+        history (List[Dict]): The guesses processed so far, each with a "word" and its "marks".
+    """
+
+    __slots__ = ('alphabet', 'size', 'bitset', 'ids', 'must_contain', 'positions', 'min_counts', 'max_counts',
+                 'history')
+
+    def __init__(self, word_length: int = 5, alphabet: str = ALPHABET):
+        letters = _letters(alphabet)
+        self.alphabet = alphabet
+        self.size = -1
+        self.bitset: Optional[np.ndarray] = None
+        self.ids: Optional[np.ndarray] = None
+        self.must_contain = 0
+        self.positions: Tuple[int, ...] = (letters.all_letters,) * word_length
+        self.min_counts = letters.no_min_counts
+        self.max_counts = letters.no_max_counts
+        self.history: List[Dict] = []
+
+    def copy(self) -> "GameState":
+        """
+        Copy the state.
+
+        Returns:
+            GameState: An independent state sharing the (immutable) candidate arrays.
+        """
+        state = GameState.__new__(GameState)
+        state.alphabet = self.alphabet
+        state.size = self.size
+        state.bitset = self.bitset
+        state.ids = self.ids
+        state.must_contain = self.must_contain
+        state.positions = self.positions
+        state.min_counts = self.min_counts
+        state.max_counts = self.max_counts
+        state.history = list(self.history)
+        return state
+
+    def mask(self, word_count: int) -> np.ndarray:
+        """
+        Get the candidates as a bitset.
+
+        Args:
+            word_count (int): The number of words in the dictionary.
+
+        Returns:
+            np.ndarray: A new boolean array, True for the word IDs still possible.
+        """
+        if self.ids is not None:
+            mask = np.zeros(word_count, dtype=bool)
+            mask[self.ids] = True
+            return mask
+        if self.bitset is not None:
+            return np.unpackbits(self.bitset, count=word_count).view(bool)
+        return np.ones(word_count, dtype=bool)
+
+    def set_mask(self, mask: np.ndarray) -> None:
+        """
+        Set the candidates from a bitset.
+
+        Args:
+            mask (np.ndarray): Boolean array, True for the word IDs still possible.
+        """
+        self.size = int(np.count_nonzero(mask))
+        if self.size == len(mask):
+            self.size, self.bitset, self.ids = -1, None, None
+        elif self.size * _SPARSE_RATIO <= len(mask):
+            self.bitset, self.ids = None, np.flatnonzero(mask).astype(np.int32)
+        else:
+            self.bitset, self.ids = np.packbits(mask), None
+
+    def set_ids(self, ids: np.ndarray) -> None:
+        """
+        Set the candidates from word IDs, when only a few are left.
+
+        Args:
+            ids (np.ndarray): Sorted word IDs of the words still possible.
+        """
+        self.size = len(ids)
+        self.bitset, self.ids = None, ids.astype(np.int32, copy=False)
+
+    def candidate_ids(self, word_count: int) -> np.ndarray:
+        """
+        Get the word IDs of the candidates.
+
+        Args:
+            word_count (int): The number of words in the dictionary.
+
+        Returns:
+            np.ndarray: Sorted word IDs of the words still possible.
+        """
+        if self.ids is not None:
+            return self.ids
+        if self.bitset is not None:
+            return np.flatnonzero(self.mask(word_count))
+        return np.arange(word_count)
+
+    def count(self, word_count: int) -> int:
+        """
+        Get the number of candidates.
+
+        Args:
+            word_count (int): The number of words in the dictionary.
+
+        Returns:
+            int: The number of words still possible.
+        """
+        return word_count if self.size < 0 else self.size
+
+    def apply_feedback(self, guess: str, marks: List[int]) -> None:
+        """
+        Update the letter constraints with a guess and its marks.
+
+        Besides the per-position constraints, the number of 1s and 2s a letter
+        gets is a lower bound on its count in the solution; if the same letter
+        also gets a 0, that number is its exact count (a letter with only 0s is
+        excluded from every position). The candidates are not filtered here.
+
+        Args:
+            guess (str): The guessed word.
+            marks (List[int]): The marks received for the guess.
+        """
+        letters = _letters(self.alphabet)
+        positions = list(self.positions)
+        found: Dict[str, int] = {}
+        for i, (letter, mark) in enumerate(zip(guess, marks)):
+            bit = letters.bits[letter]
+            if mark == 2:  # Correct letter and position
+                positions[i] = bit
+                self.must_contain |= bit
+            elif mark == 1:  # Correct letter, wrong position
+                positions[i] &= ~bit
+                self.must_contain |= bit
+            elif mark == 0:  # No more copies of this letter in the word
+                positions[i] &= ~bit
+            if mark in (1, 2):
+                found[letter] = found.get(letter, 0) + 1
+
+        min_counts = bytearray(self.min_counts)
+        max_counts = bytearray(self.max_counts)
+        excluded = 0
+        for letter, count in found.items():
+            index = letters.index[letter]
+            min_counts[index] = max(min_counts[index], count)
+        for letter, mark in zip(guess, marks):
+            if mark == 0:
+                max_counts[letters.index[letter]] = found.get(letter, 0)
+                if letter not in found:
+                    excluded |= letters.bits[letter]
+        self.positions = tuple(allowed & ~excluded for allowed in positions)
+        self.min_counts = bytes(min_counts)
+        self.max_counts = bytes(max_counts)
+
+    def min_count_map(self) -> Dict[str, int]:
+        """
+        Get the known lower bounds on letter counts.
+
+        Returns:
+            Dict[str, int]: Least number of copies of each letter with a known lower bound.
+        """
+        return {letter: count for letter, count in zip(self.alphabet, self.min_counts) if count}
+
+    def max_count_map(self) -> Dict[str, int]:
+        """
+        Get the known exact letter counts.
+
+        Returns:
+            Dict[str, int]: Most number of copies of each letter whose count is known.
+        """
+        return {letter: count for letter, count in zip(self.alphabet, self.max_counts) if count != UNKNOWN_COUNT}
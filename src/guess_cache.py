@@ -0,0 +1,199 @@
+"""
+Process-wide memo of the solver's best guess for a candidate set.
+
+The guess a strategy picks depends only on the set of words still possible
+(and the solver settings), so a long-running process that plays many games
+keeps meeting states it has already solved. GuessCache is a size-bounded LRU
+keyed by a fingerprint of the candidate bitset; it can optionally be saved to
+Config.CACHE_DIR at exit and reloaded by the next run.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from src.config import Config
+from src.word_bank import word_list_hash
+
+CACHE_VERSION = 1
+
+# Caches already created in this process, keyed by file path.
+_guess_caches: Dict[str, "GuessCache"] = {}
+
+
+def candidate_fingerprint(mask: np.ndarray) -> bytes:
+    """
+    Compute a canonical fingerprint of a candidate set.
+
+    Args:
+        mask (np.ndarray): Bitset (by word ID) of the candidates.
+
+    Returns:
+        bytes: A 16-byte BLAKE2b digest of the packed bitset.
+    """
+    return hashlib.blake2b(np.packbits(mask).tobytes(), digest_size=16).digest()
+
+
+class GuessCache:
+    """
+    A size-bounded LRU mapping from candidate-set fingerprints to the best guess.
+
+    Lookups and updates are serialized by a lock, so one cache can be shared by
+    solvers running on several threads.
+
+    Attributes:
+        max_entries (int): Most entries kept; the least recently used entry is evicted beyond this.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found in the cache.
+        evictions (int): Number of entries evicted to stay within max_entries.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Look up the best guess for a candidate set, marking it as recently used.
+
+        Args:
+            key (bytes): The candidate-set fingerprint.
+
+        Returns:
+            Optional[str]: The cached guess, or None on a miss.
+        """
+        with self._lock:
+            guess = self._entries.get(key)
+            if guess is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return guess
+
+    def put(self, key: bytes, guess: str) -> None:
+        """
+        Store the best guess for a candidate set, evicting the least recently used entries if full.
+
+        Args:
+            key (bytes): The candidate-set fingerprint.
+            guess (str): The guess to remember.
+        """
+        with self._lock:
+            self._entries[key] = guess
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def counters(self) -> Dict[str, int]:
+        """
+        Get the cache's size and its hit, miss and eviction counters.
+
+        Returns:
+            Dict[str, int]: The counters.
+        """
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+    def save(self, path: str, solver: Dict, word_list_hash: str) -> None:
+        """
+        Write the entries to a JSON file, least recently used first, replacing it atomically.
+
+        Args:
+            path (str): The file to write.
+            solver (Dict): The solver settings the guesses were computed with.
+            word_list_hash (str): Hash of the dictionary the guesses were computed with.
+        """
+        with self._lock:
+            entries = {key.hex(): guess for key, guess in self._entries.items()}
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": CACHE_VERSION, "solver": solver, "word_list_hash": word_list_hash,
+                       "entries": entries}, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def load(self, path: str, solver: Dict, word_list_hash: str) -> None:
+        """
+        Add the entries of a file written by save.
+
+        Args:
+            path (str): The file to read.
+            solver (Dict): The solver settings the entries must have been computed with.
+            word_list_hash (str): Hash of the dictionary the entries must have been computed with.
+
+        Raises:
+            ValueError: If the file was written by another version, solver or dictionary.
+        """
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION:
+            raise ValueError(f"Guess cache {path} has version {data.get('version')}, expected {CACHE_VERSION}")
+        if data["solver"] != solver or data["word_list_hash"] != word_list_hash:
+            raise ValueError(f"Guess cache {path} was built for a different dictionary or solver")
+        for key, guess in data["entries"].items():
+            self.put(bytes.fromhex(key), guess)
+
+
+def guess_cache_path(words: Sequence[str], solver: Dict, cache_dir: str = None) -> str:
+    """
+    Get the file path of the guess cache for a dictionary and solver settings.
+
+    Args:
+        words (Sequence[str]): The dictionary.
+        solver (Dict): The solver settings (see Game._solver_settings).
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        str: Path of the cache file.
+    """
+    key = f"{CACHE_VERSION}:{word_list_hash(words)}{json.dumps(solver, sort_keys=True)}"
+    key = hashlib.sha256(key.encode()).hexdigest()
+    return os.path.join(cache_dir or Config.CACHE_DIR, f"guesses-{key[:16]}.json")
+
+
+def get_guess_cache(words: Sequence[str], solver: Dict) -> Optional[GuessCache]:
+    """
+    Get the shared guess cache for a dictionary and solver settings, creating it on first use.
+
+    With Config.PERSIST_GUESS_CACHE, the cache is filled from its file (if any)
+    when created and written back when the process exits.
+
+    Args:
+        words (Sequence[str]): The dictionary.
+        solver (Dict): The solver settings (see Game._solver_settings).
+
+    Returns:
+        Optional[GuessCache]: The cache, or None if Config.GUESS_CACHE_SIZE is 0.
+    """
+    if Config.GUESS_CACHE_SIZE <= 0:
+        return None
+    path = guess_cache_path(words, solver)
+    if path not in _guess_caches:
+        cache = GuessCache(Config.GUESS_CACHE_SIZE)
+        if Config.PERSIST_GUESS_CACHE:
+            content_hash = word_list_hash(words)
+            if os.path.exists(path):
+                try:
+                    cache.load(path, solver, content_hash)
+                except (ValueError, KeyError) as e:
+                    logging.getLogger('App').warning(f"Ignoring guess cache: {e}")
+            atexit.register(cache.save, path, solver, content_hash)
+        _guess_caches[path] = cache
+    return _guess_caches[path]
@@ -0,0 +1,216 @@
+"""
+End-to-end load test of the client stack against the local Wordle server.
+
+Plays many games through MySocket and Game, one after another, and reports
+throughput, per-guess round-trip latency and how the client's CPU time splits
+between the network layer and the solver. By default the local server is
+started in a background thread, so the test runs offline.
+
+Usage:
+    python -m src.load_test [--games N] [--tls] [--strategy NAME] [--host HOST --port PORT] [--json]
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from src.async_client import percentile
+from src.config import Config
+from src.game import Game
+from src.local_server import (ServerThread, WordleServer, generate_self_signed_cert, load_answers, load_words,
+                              make_server_ssl_context)
+from src.my_socket import MySocket
+from src.strategy import STRATEGIES
+
+
+class LoadTestStats:
+    """
+    Timings collected while playing games.
+
+    Attributes:
+        games (int): Number of games finished.
+        guesses (int): Number of guesses sent.
+        round_trips (List[float]): Wall-clock seconds of each guess request/response.
+        network_cpu (float): Client thread CPU seconds spent connecting, encoding, sending and receiving.
+        solver_cpu (float): Client thread CPU seconds spent choosing guesses.
+        elapsed (float): Wall-clock seconds for the whole run.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.guesses = 0
+        self.round_trips: List[float] = []
+        self.network_cpu = 0.0
+        self.solver_cpu = 0.0
+        self.elapsed = 0.0
+
+    def summary(self) -> Dict:
+        """
+        Summarize the collected timings.
+
+        Returns:
+            Dict: Throughput, per-guess latency percentiles (in ms) and the CPU split.
+        """
+        round_trips = sorted(self.round_trips)
+        return {
+            "games": self.games,
+            "guesses": self.guesses,
+            "elapsed": self.elapsed,
+            "games_per_sec": self.games / self.elapsed if self.elapsed > 0 else 0.0,
+            "avg_guesses": self.guesses / self.games if self.games else 0.0,
+            "round_trip_ms": {
+                "p50": percentile(round_trips, 50) * 1000,
+                "p95": percentile(round_trips, 95) * 1000,
+                "p99": percentile(round_trips, 99) * 1000,
+            } if round_trips else {},
+            "cpu_seconds": {"network": self.network_cpu, "solver": self.solver_cpu},
+        }
+
+
+def play_game(game: Game, host: str, port: int, use_tls: bool, stats: LoadTestStats) -> str:
+    """
+    Play one game over a new MySocket connection, recording timings.
+
+    This follows the same steps as Game.start_game, timing the network and
+    solver phases separately.
+
+    Args:
+        game (Game): The solver to use; it is reset before the game starts.
+        host (str): The server hostname.
+        port (int): The server port.
+        use_tls (bool): Whether to connect with TLS.
+        stats (LoadTestStats): Collected timings, updated in place.
+
+    Returns:
+        str: The flag sent by the server.
+    """
+    cpu_start = time.thread_time()
+    game.new_game(MySocket())
+    game.sock.connect(host=host, port=port, use_tls=use_tls)
+    game._send_recv_hello_message()
+    stats.network_cpu += time.thread_time() - cpu_start
+
+    guess = game._get_initial_guess()
+    while True:
+        cpu_start, wall_start = time.thread_time(), time.perf_counter()
+        response = game._guess_word(word=guess)
+        stats.round_trips.append(time.perf_counter() - wall_start)
+        stats.network_cpu += time.thread_time() - cpu_start
+        stats.guesses += 1
+
+        if response["type"] == "bye":
+            game.sock.disconnect()
+            stats.games += 1
+            return response["flag"]
+        if response["type"] == "error":
+            game.sock.disconnect()
+            raise RuntimeError(f"Server error: {response['message']}")
+
+        cpu_start = time.thread_time()
+        guess = game._get_next_guess(response)
+        stats.solver_cpu += time.thread_time() - cpu_start
+
+
+def run_load_test(games: int, host: Optional[str] = None, port: Optional[int] = None, use_tls: bool = False,
+                  strategy: str = Config.STRATEGY, seed: Optional[int] = None) -> Dict:
+    """
+    Play games against a server and summarize the timings.
+
+    If no host is given, a local server is started in a background thread
+    (with a freshly generated self-signed certificate when use_tls is set).
+
+    Args:
+        games (int): The number of games to play.
+        host (Optional[str]): The server hostname, or None to start a local server.
+        port (Optional[int]): The server port (required with host).
+        use_tls (bool): Whether to connect with TLS.
+        strategy (str): The guess selection strategy.
+        seed (Optional[int]): Seed for the local server's choice of target words.
+
+    Returns:
+        Dict: The summary produced by LoadTestStats.summary.
+    """
+    if host is not None:
+        return _play_games(games, host, port, use_tls, strategy)
+
+    with tempfile.TemporaryDirectory(prefix='wordle-tls-') as cert_dir:
+        ssl_context, ca_file = None, Config.TLS_CA_FILE
+        if use_tls:
+            certfile, keyfile = generate_self_signed_cert(cert_dir)
+            ssl_context = make_server_ssl_context(certfile, keyfile)
+            Config.TLS_CA_FILE = certfile
+        server = WordleServer(load_words(), ssl_context=ssl_context, answers=load_answers(), seed=seed)
+        try:
+            with ServerThread(server):
+                return _play_games(games, server.host, server.port, use_tls, strategy)
+        finally:
+            Config.TLS_CA_FILE = ca_file
+
+
+def _play_games(games: int, host: str, port: int, use_tls: bool, strategy: str) -> Dict:
+    """
+    Play games one after another with a single reused solver.
+
+    Returns:
+        Dict: The summary produced by LoadTestStats.summary.
+    """
+    stats = LoadTestStats()
+    game = Game(None, "load_test", log_level=Config.LOG_LEVEL, strategy=strategy)
+    start = time.perf_counter()
+    for _ in range(games):
+        play_game(game, host, port, use_tls, stats)
+    stats.elapsed = time.perf_counter() - start
+    return stats.summary()
+
+
+def format_summary(summary: Dict) -> str:
+    """
+    Format a load test summary for the terminal.
+
+    Args:
+        summary (Dict): The summary to format.
+
+    Returns:
+        str: A human-readable multi-line report.
+    """
+    lines = [
+        f"Games played: {summary['games']} in {summary['elapsed']:.2f}s - {summary['games_per_sec']:.2f} games/sec",
+        f"Average guesses: {summary['avg_guesses']:.2f}",
+    ]
+    if summary["round_trip_ms"]:
+        rtt = summary["round_trip_ms"]
+        lines.append(f"Per-guess round trip (ms): p50 {rtt['p50']:.3f}, p95 {rtt['p95']:.3f}, p99 {rtt['p99']:.3f}")
+    cpu = summary["cpu_seconds"]
+    lines.append(f"Client CPU (s): network {cpu['network']:.3f}, solver {cpu['solver']:.3f}")
+    return '\n'.join(lines)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Run the load test from the command line.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(description="Load test the Wordle client against a local server.")
+    parser.add_argument('--games', type=int, default=1000, help="number of games to play (default: %(default)s)")
+    parser.add_argument('--tls', action='store_true', help="use TLS connections")
+    parser.add_argument('--strategy', choices=STRATEGIES, default=Config.STRATEGY,
+                        help="guess selection strategy (default: %(default)s)")
+    parser.add_argument('--host', help="use an already running server instead of starting a local one")
+    parser.add_argument('--port', type=int, default=Config.DEFAULT_PORT, help="port of the server given by --host")
+    parser.add_argument('--seed', type=int, help="seed for the local server's choice of target words")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    parsed_args = parser.parse_args(args)
+
+    logging.basicConfig(level=logging.WARN)
+    summary = run_load_test(parsed_args.games, host=parsed_args.host, port=parsed_args.port,
+                            use_tls=parsed_args.tls, strategy=parsed_args.strategy, seed=parsed_args.seed)
+    print(json.dumps(summary, indent=2) if parsed_args.json else format_summary(summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+"""
+Local stand-in for the Wordle game server.
+
+Implements the JSON-lines hello/guess/retry/bye protocol spoken by Game, so the
+client stack can be exercised and load-tested without the course server.
+
+Usage:
+    python -m src.local_server [--host HOST] [--port PORT] [--tls [--certfile CERT --keyfile KEY]]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import secrets
+import ssl
+import subprocess
+import tempfile
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.config import Config
+from src.dictionary import get_dictionary
+from src.patterns import compute_marks
+from src.word_bank import get_word_bank
+
+
+def generate_self_signed_cert(directory: str, hostname: str = 'localhost') -> Tuple[str, str]:
+    """
+    Generate a self-signed certificate and key with the openssl command-line tool.
+
+    The certificate is valid for `hostname`, 'localhost' and 127.0.0.1, and can be
+    passed to the client as its CA file (Config.TLS_CA_FILE).
+
+    Args:
+        directory (str): Directory to write cert.pem and key.pem into.
+        hostname (str): The common name of the certificate.
+
+    Returns:
+        Tuple[str, str]: Paths of the certificate and private key files.
+
+    Raises:
+        RuntimeError: If openssl is not available or fails.
+    """
+    certfile = os.path.join(directory, 'cert.pem')
+    keyfile = os.path.join(directory, 'key.pem')
+    command = [
+        'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+        '-keyout', keyfile, '-out', certfile, '-subj', f'/CN={hostname}',
+        '-addext', f'subjectAltName=DNS:{hostname},DNS:localhost,IP:127.0.0.1',
+    ]
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise RuntimeError(f"Failed to generate a self-signed certificate: {e}")
+    return certfile, keyfile
+
+
+class WordleServer:
+    """
+    An asyncio Wordle server that plays one game per connection.
+
+    Each connection is assigned a random target word. Guesses that are not in
+    the dictionary, or that use the wrong game ID, get an error and the
+    connection is closed, like the real server.
+
+    Attributes:
+        words (List[str]): Words accepted as guesses.
+        answers (List[str]): Words chosen from as targets.
+        host (str): The address to listen on.
+        port (int): The port to listen on (0 picks a free port; updated once started).
+        ssl_context (Optional[ssl.SSLContext]): Server-side TLS context, or None for plain TCP.
+        games_played (int): Number of games won by clients so far.
+    """
+
+    def __init__(self, words: Sequence[str], host: str = '127.0.0.1', port: int = 0,
+                 ssl_context: Optional[ssl.SSLContext] = None, answers: Optional[Sequence[str]] = None,
+                 seed: Optional[int] = None):
+        self.words = list(words)
+        self._word_set = set(self.words)
+        self.answers = list(answers) if answers is not None else self.words
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.games_played = 0
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """
+        Start listening for connections.
+        """
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  ssl=self.ssl_context, limit=Config.MAX_MESSAGE_SIZE)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Stop accepting connections and wait for the listening socket to close.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        """
+        Start the server (if needed) and serve until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Play one game with a connected client.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+        """
+        game_id = None
+        target = self._random.choice(self.answers)
+        guesses: List[Dict] = []
+        try:
+            while line := await reader.readline():
+                reply = self._handle_message(json.loads(line), game_id, target, guesses)
+                if reply["type"] == "start":
+                    game_id = reply["id"]
+                writer.write((json.dumps(reply) + '\n').encode(Config.DEFAULT_ENCODING))
+                await writer.drain()
+                if reply["type"] in ("bye", "error"):
+                    break
+        except (ConnectionError, ssl.SSLError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _handle_message(self, message: Dict, game_id: Optional[str], target: str, guesses: List[Dict]) -> Dict:
+        """
+        Build the reply to one client message.
+
+        Args:
+            message (Dict): The decoded client message.
+            game_id (Optional[str]): The ID of the game on this connection, once started.
+            target (str): The word the client has to guess.
+            guesses (List[Dict]): The guesses made so far; updated in place.
+
+        Returns:
+            Dict: The reply to send.
+        """
+        if message.get("type") == "hello" and game_id is None:
+            return {"type": "start", "id": secrets.token_hex(8)}
+        if message.get("type") != "guess" or message.get("id") != game_id:
+            return {"type": "error", "message": "Unexpected message"}
+
+        word = message.get("word")
+        if word not in self._word_set:
+            return {"type": "error", "message": f"Invalid guess: {word}"}
+        if word == target:
+            self.games_played += 1
+            return {"type": "bye", "id": game_id, "flag": secrets.token_hex(32)}
+        if len(guesses) + 1 >= Config.MAX_RETRIES:
+            return {"type": "error", "message": "Too many guesses"}
+
+        guesses.append({"word": word, "marks": compute_marks(word, target)})
+        return {"type": "retry", "id": game_id, "guesses": guesses}
+
+
+class ServerThread:
+    """
+    Run a WordleServer (or another asyncio server with start and close, such as
+    the solver daemon) on its own event loop in a background thread.
+
+    This lets blocking clients such as MySocket play against the server from
+    the same process. Use it as a context manager, or call start() and stop().
+    """
+
+    def __init__(self, server: WordleServer):
+        self.server = server
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='wordle-server', daemon=True)
+
+    def start(self) -> 'ServerThread':
+        """
+        Start the event loop thread and wait until the server is listening.
+
+        Returns:
+            ServerThread: This instance.
+        """
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self
+
+    def stop(self) -> None:
+        """
+        Close the server and stop the event loop thread.
+        """
+        asyncio.run_coroutine_threadsafe(self.server.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> 'ServerThread':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def make_server_ssl_context(certfile: str, keyfile: str) -> ssl.SSLContext:
+    """
+    Create a server-side TLS context from a certificate and key.
+
+    Args:
+        certfile (str): Path of the PEM certificate.
+        keyfile (str): Path of the PEM private key.
+
+    Returns:
+        ssl.SSLContext: The server TLS context.
+    """
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+def load_words(path: str = None) -> Sequence[str]:
+    """
+    Load the dictionary used by the server.
+
+    Args:
+        path (str): Path of the word list file (defaults to Config.WORD_LIST).
+
+    Returns:
+        Sequence[str]: The words in the file.
+    """
+    return get_word_bank(path)
+
+
+def load_answers() -> Sequence[str]:
+    """
+    Load the words the server picks targets from.
+
+    Returns:
+        Sequence[str]: The answers of the dictionary (every word unless Config.ANSWER_LIST is set).
+    """
+    return get_dictionary().answers
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Run the local server until interrupted.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(description="Local stand-in for the Wordle game server.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=Config.DEFAULT_PORT, help="port to listen on (default: %(default)s)")
+    parser.add_argument('--tls', action='store_true', help="serve TLS, generating a self-signed cert if none is given")
+    parser.add_argument('--certfile', help="PEM certificate for --tls")
+    parser.add_argument('--keyfile', help="PEM private key for --tls")
+    parser.add_argument('--seed', type=int, help="seed for choosing target words")
+    parsed_args = parser.parse_args(args)
+
+    ssl_context = None
+    if parsed_args.tls:
+        certfile, keyfile = parsed_args.certfile, parsed_args.keyfile
+        if not certfile:
+            certfile, keyfile = generate_self_signed_cert(tempfile.mkdtemp(prefix='wordle-tls-'))
+            print(f"Generated self-signed certificate {certfile} (use it as TLS_CA_FILE for the client)")
+        ssl_context = make_server_ssl_context(certfile, keyfile)
+
+    server = WordleServer(load_words(), host=parsed_args.host, port=parsed_args.port,
+                          ssl_context=ssl_context, answers=load_answers(), seed=parsed_args.seed)
+    print(f"Serving Wordle on {parsed_args.host}:{parsed_args.port}{' (TLS)' if ssl_context else ''}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,343 @@
+"""
+Microbenchmarks of the client's hot functions.
+
+Times Game._update_constraints, Game._filter_possible_words and
+Game._choose_best_guess on fixed game states, MySocket.recv_msg on retry
+replies fed through a socketpair, and the JSON encoding and decoding done by
+Game._guess_word. Each benchmark reports operations per second (the best of
+several timed runs) and the memory allocated by one call, measured
+separately with tracemalloc. With --output the results are saved as a JSON
+baseline; with --compare the run fails if any benchmark regresses against one.
+
+Usage:
+    python -m src.microbench [--filter TEXT] [--strategy NAME] [--min-time S] [--repeats N]
+                             [--output baseline.json] [--compare baseline.json]
+                             [--max-time-regression F] [--max-memory-regression F]
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import platform
+import socket
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from src.config import Config
+from src.dictionary import get_dictionary
+from src.game import Game
+from src.game_state import GameState
+from src.my_socket import MySocket
+from src.patterns import compute_marks
+from src.protocol import GuessEncoder, decode_response
+from src.strategy import STRATEGIES
+
+# Game states to benchmark the solver on, as (target word, guesses made). They
+# were captured from games of the default solver on the default dictionary:
+# the last guess leaves 1185, 61 and 25 candidates.
+STATES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "opening": ("vivid", ("salet",)),
+    "midgame": ("vivid", ("salet", "irony")),
+    "endgame": ("joker", ("salet", "diner", "mower")),
+}
+
+# Guess history lengths of the retry replies benchmarked: a typical game, and
+# the longest one Config.MAX_RETRIES allows by default.
+REPLY_SIZES = (6, 500)
+
+# Peak allocations within this many bytes of the baseline are never regressions.
+_MEMORY_SLACK = 1024
+
+
+class Benchmark(NamedTuple):
+    """
+    A function to time.
+
+    Attributes:
+        name (str): Name of the benchmark in reports.
+        run (Callable[[], object]): The function timed.
+        setup (Optional[Callable[[], object]]): Untimed function run before every call of run, if any.
+    """
+    name: str
+    run: Callable[[], object]
+    setup: Optional[Callable[[], object]] = None
+
+
+def capture_state(game: Game, target: str, guesses: Tuple[str, ...]) -> Tuple[GameState, str, List[int]]:
+    """
+    Replay the guesses of a game up to its last one.
+
+    Args:
+        game (Game): The solver; its state is replaced.
+        target (str): The word being guessed.
+        guesses (Tuple[str, ...]): The guesses made.
+
+    Returns:
+        Tuple[GameState, str, List[int]]: The state before the last guess, the last guess and its marks.
+    """
+    game.reset()
+    for guess in guesses[:-1]:
+        marks = compute_marks(guess, target)
+        game._update_constraints(guess, marks)
+        game._filter_possible_words(guess, marks)
+    return game.state.copy(), guesses[-1], compute_marks(guesses[-1], target)
+
+
+def retry_reply(game: Game, size: int) -> str:
+    """
+    Build a retry reply like the server sends after a number of guesses.
+
+    Args:
+        game (Game): The solver whose dictionary the guesses are taken from.
+        size (int): The number of guesses in the history.
+
+    Returns:
+        str: The newline-terminated message.
+    """
+    words = game.word_list[::len(game.word_list) // size][:size]
+    guesses = [{"word": word, "marks": compute_marks(word, "vivid")} for word in words]
+    return json.dumps({"type": "retry", "id": "microbench", "guesses": guesses}) + '\n'
+
+
+def build_benchmarks(game: Game, stack: contextlib.ExitStack) -> List[Benchmark]:
+    """
+    Set up every benchmark.
+
+    Args:
+        game (Game): The solver to benchmark; its state is replaced by each call.
+        stack (contextlib.ExitStack): Closes the sockets used by the benchmarks when exited.
+
+    Returns:
+        List[Benchmark]: The benchmarks, in report order.
+    """
+    benchmarks = []
+    for name, (target, guesses) in STATES.items():
+        before, guess, marks = capture_state(game, target, guesses)
+        game.state = before.copy()
+        game._update_constraints(guess, marks)
+        game._filter_possible_words(guess, marks)
+        after = game.state
+
+        def restore(state=before):
+            game.state = state.copy()
+
+        def choose(state=after):
+            game.state = state
+            return game._choose_best_guess()
+
+        benchmarks += [
+            Benchmark(f"update_constraints[{name}]", lambda g=guess, m=marks: game._update_constraints(g, m), restore),
+            Benchmark(f"filter_possible_words[{name}]", lambda g=guess, m=marks: game._filter_possible_words(g, m),
+                      restore),
+            Benchmark(f"choose_best_guess[{game.strategy}/{name}]", choose),
+        ]
+
+    encoder = GuessEncoder("microbench")
+    benchmarks.append(Benchmark("encode_guess", lambda: encoder.encode("salet")))
+    for size in REPLY_SIZES:
+        msg = retry_reply(game, size)
+        benchmarks += [
+            Benchmark(f"decode_response[retry-{size}]", lambda m=msg: decode_response(m)),
+            Benchmark(f"decode_response[retry-{size}/validated]", lambda m=msg: decode_response(m, validate=True)),
+        ]
+
+        peer, local = socket.socketpair()
+        stack.callback(peer.close)
+        stack.callback(local.close)
+        sock = MySocket()
+        sock.sock = local
+        data = msg.encode(Config.DEFAULT_ENCODING)
+        benchmarks.append(Benchmark(f"recv_msg[retry-{size}]", sock.recv_msg, lambda p=peer, d=data: p.sendall(d)))
+    return benchmarks
+
+
+def _timed_calls(benchmark: Benchmark, calls: int) -> float:
+    """
+    Call a benchmark's function a number of times.
+
+    Args:
+        benchmark (Benchmark): The benchmark.
+        calls (int): The number of calls.
+
+    Returns:
+        float: The seconds spent in the function, excluding the setup.
+    """
+    if benchmark.setup is None:
+        start = time.perf_counter()
+        for _ in range(calls):
+            benchmark.run()
+        return time.perf_counter() - start
+
+    elapsed = 0.0
+    for _ in range(calls):
+        benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run()
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def time_benchmark(benchmark: Benchmark, min_time: float, repeats: int) -> Tuple[float, int]:
+    """
+    Measure the throughput of a benchmark.
+
+    The number of calls per run is doubled until a run takes min_time, and
+    the fastest of repeats runs of that many calls is kept, since slower runs
+    measure interference rather than the code.
+
+    Args:
+        benchmark (Benchmark): The benchmark.
+        min_time (float): Least number of seconds per timed run.
+        repeats (int): Number of timed runs.
+
+    Returns:
+        Tuple[float, int]: The best operations per second, and the number of calls per run.
+    """
+    calls = 1
+    elapsed = _timed_calls(benchmark, calls)
+    while elapsed < min_time:
+        calls *= 2
+        elapsed = _timed_calls(benchmark, calls)
+    best = elapsed
+    for _ in range(repeats - 1):
+        best = min(best, _timed_calls(benchmark, calls))
+    return calls / max(best, 1e-9), calls
+
+
+def measure_memory(benchmark: Benchmark) -> Tuple[int, int]:
+    """
+    Measure the memory allocated by one call of a benchmark with tracemalloc.
+
+    Args:
+        benchmark (Benchmark): The benchmark; it should already have been called once, so
+            lazily loaded data is not counted.
+
+    Returns:
+        Tuple[int, int]: The peak bytes allocated during the call, and the bytes still allocated after it.
+    """
+    if benchmark.setup is not None:
+        benchmark.setup()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        result = benchmark.run()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - start, current - start
+
+
+def run_benchmarks(strategy: str = Config.STRATEGY, name_filter: Optional[str] = None, min_time: float = 0.2,
+                   repeats: int = 5) -> Dict:
+    """
+    Run the benchmarks and build a report.
+
+    Args:
+        strategy (str): The guess selection strategy of the solver.
+        name_filter (Optional[str]): Only run benchmarks whose name contains this text.
+        min_time (float): Least number of seconds per timed run.
+        repeats (int): Number of timed runs per benchmark.
+
+    Returns:
+        Dict: The report, with the results of each benchmark under "benchmarks".
+    """
+    game = Game(None, "microbench", log_level=logging.WARN, strategy=strategy, dictionary=get_dictionary())
+    results = {}
+    with contextlib.ExitStack() as stack:
+        for benchmark in build_benchmarks(game, stack):
+            if name_filter and name_filter not in benchmark.name:
+                continue
+            ops_per_sec, calls = time_benchmark(benchmark, min_time, repeats)
+            peak_bytes, retained_bytes = measure_memory(benchmark)
+            results[benchmark.name] = {
+                "ops_per_sec": ops_per_sec,
+                "calls": calls,
+                "peak_bytes": peak_bytes,
+                "retained_bytes": retained_bytes,
+            }
+    return {
+        "python": platform.python_version(),
+        "strategy": strategy,
+        "min_time": min_time,
+        "repeats": repeats,
+        "benchmarks": results,
+    }
+
+
+def compare_results(report: Dict, baseline: Dict, max_time_regression: float,
+                    max_memory_regression: float) -> List[str]:
+    """
+    Compare a report against a baseline report.
+
+    Only benchmarks present in both reports are compared.
+
+    Args:
+        report (Dict): The new report.
+        baseline (Dict): The baseline report.
+        max_time_regression (float): Allowed relative decrease of operations per second.
+        max_memory_regression (float): Allowed relative increase of the peak bytes allocated per call.
+
+    Returns:
+        List[str]: A description of each regression found (empty if none).
+    """
+    regressions = []
+    for name, result in report["benchmarks"].items():
+        expected = baseline["benchmarks"].get(name)
+        if expected is None:
+            continue
+        if result["ops_per_sec"] < expected["ops_per_sec"] * (1 - max_time_regression):
+            regressions.append(f"{name}: {result['ops_per_sec']:.1f} ops/sec is below baseline "
+                               f"{expected['ops_per_sec']:.1f} by more than {max_time_regression:.1%}")
+        if result["peak_bytes"] > expected["peak_bytes"] * (1 + max_memory_regression) + _MEMORY_SLACK:
+            regressions.append(f"{name}: peak {result['peak_bytes']} bytes exceeds baseline "
+                               f"{expected['peak_bytes']} by more than {max_memory_regression:.1%}")
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Run the microbenchmarks from the command line.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(description="Time the client's hot functions.")
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--strategy', choices=STRATEGIES, default=Config.STRATEGY,
+                        help="guess selection strategy (default: %(default)s)")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="least seconds per timed run (default: %(default)s)")
+    parser.add_argument('--repeats', type=int, default=5, help="timed runs per benchmark (default: %(default)s)")
+    parser.add_argument('--output', help="save the results to this JSON baseline")
+    parser.add_argument('--compare', metavar='BASELINE', help="fail if any benchmark regresses against this baseline")
+    parser.add_argument('--max-time-regression', type=float, default=0.25,
+                        help="allowed relative decrease of ops/sec (default: %(default)s)")
+    parser.add_argument('--max-memory-regression', type=float, default=0.10,
+                        help="allowed relative increase of peak bytes per call (default: %(default)s)")
+    parsed_args = parser.parse_args(args)
+
+    report = run_benchmarks(parsed_args.strategy, parsed_args.filter, parsed_args.min_time, parsed_args.repeats)
+
+    if parsed_args.output:
+        with open(parsed_args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    for name, result in report["benchmarks"].items():
+        print(f"{name:<45} {result['ops_per_sec']:>14,.1f} ops/sec {result['peak_bytes'] / 1024:>10,.1f} KiB peak")
+
+    if parsed_args.compare:
+        with open(parsed_args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_results(report, baseline, parsed_args.max_time_regression,
+                                      parsed_args.max_memory_regression)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,191 @@
+import errno
+import os
+import selectors
 import socket
 import ssl
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
+from src import stats
 from src.config import Config
+from src.transcript import CLOSED, RECEIVED, SENT, SessionRecorder, get_recorder
+
+# Resolved addresses, keyed by (host, port), with the time they expire.
+_resolved: Dict[Tuple[str, int], Tuple[float, List[Tuple]]] = {}
+
+# Client TLS contexts, keyed by CA file, so certificates are loaded once per process.
+_tls_contexts: Dict[Optional[str], ssl.SSLContext] = {}
+
+# The last TLS session of each server, keyed by (host, port), offered when reconnecting.
+_tls_sessions: Dict[Tuple[str, int], ssl.SSLSession] = {}
+
+_lock = threading.Lock()
+
+
+def resolve(host: str, port: int) -> List[Tuple]:
+    """
+    Resolve a host to the addresses to connect to, caching the answer for Config.DNS_CACHE_TTL seconds.
+
+    Args:
+        host (str): The hostname or IP address.
+        port (int): The port number.
+
+    Returns:
+        List[Tuple]: The getaddrinfo entries (family, type, proto, canonname, sockaddr) for TCP.
+
+    Raises:
+        socket.gaierror: If the host cannot be resolved.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _lock:
+        cached = _resolved.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    if Config.DNS_CACHE_TTL > 0:
+        with _lock:
+            _resolved[key] = (now + Config.DNS_CACHE_TTL, addresses)
+    return addresses
+
+
+def tls_context(cafile: Optional[str] = None) -> ssl.SSLContext:
+    """
+    Get the process-wide client TLS context for a CA file, creating it on first use.
+
+    Args:
+        cafile (Optional[str]): CA certificates to trust, in addition to the system ones.
+
+    Returns:
+        ssl.SSLContext: The shared context.
+    """
+    with _lock:
+        if cafile not in _tls_contexts:
+            context = ssl.create_default_context()
+            if cafile:
+                context.load_verify_locations(cafile)
+            _tls_contexts[cafile] = context
+        return _tls_contexts[cafile]
+
+
+def _interleave(addresses: List[Tuple]) -> List[Tuple]:
+    """
+    Order addresses so that address families alternate, starting with the resolver's first choice.
+
+    Args:
+        addresses (List[Tuple]): getaddrinfo entries.
+
+    Returns:
+        List[Tuple]: The same entries, interleaved by family.
+    """
+    by_family: Dict[int, List[Tuple]] = {}
+    for address in addresses:
+        by_family.setdefault(address[0], []).append(address)
+    queues = list(by_family.values())
+    ordered = []
+    while queues:
+        ordered.extend(queue.pop(0) for queue in queues)
+        queues = [queue for queue in queues if queue]
+    return ordered
+
+
+def _configure(sock: socket.socket) -> None:
+    """
+    Apply the configured socket options to a TCP socket.
+
+    Args:
+        sock (socket.socket): The socket to configure.
+    """
+    if Config.TCP_NODELAY:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if Config.TCP_KEEPALIVE:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+def open_connection(addresses: List[Tuple], timeout: Optional[float] = None,
+                    delay: float = 0.25) -> socket.socket:
+    """
+    Connect to the first of several addresses to accept, racing them Happy Eyeballs style (RFC 8305).
+
+    Attempts start `delay` seconds apart (or as soon as the previous one
+    fails), alternating between IPv6 and IPv4, and the first attempt to
+    connect wins; the others are closed.
+
+    Args:
+        addresses (List[Tuple]): getaddrinfo entries to try.
+        timeout (Optional[float]): Seconds to wait for any connection (None to wait indefinitely).
+        delay (float): Seconds to wait for an attempt before starting the next one.
+
+    Returns:
+        socket.socket: The connected, blocking socket.
+
+    Raises:
+        OSError: If no address accepts the connection in time.
+    """
+    pending = _interleave(addresses)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    selector = selectors.DefaultSelector()
+    next_start = time.monotonic()
+    error: OSError = OSError("No addresses to connect to")
+    try:
+        while True:
+            now = time.monotonic()
+            if pending and (now >= next_start or not selector.get_map()):
+                family, type_, proto, _, sockaddr = pending.pop(0)
+                try:
+                    sock = socket.socket(family, type_, proto)
+                except OSError as e:
+                    error = e
+                    continue
+                _configure(sock)
+                sock.setblocking(False)
+                result = sock.connect_ex(sockaddr)
+                if result == 0:
+                    return _finish(selector, sock)
+                if result not in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    error = OSError(result, os.strerror(result))
+                    sock.close()
+                    continue
+                selector.register(sock, selectors.EVENT_WRITE)
+                next_start = now + delay
+            if not selector.get_map():
+                raise error
+            if deadline is not None and now >= deadline:
+                raise TimeoutError(f"Timed out connecting after {timeout} seconds")
+
+            wait = None if deadline is None else deadline - now
+            if pending:
+                wait = next_start - now if wait is None else min(wait, next_start - now)
+            for key, _ in selector.select(wait):
+                sock = key.fileobj
+                result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if result == 0:
+                    return _finish(selector, sock)
+                error = OSError(result, os.strerror(result))
+                selector.unregister(sock)
+                sock.close()
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+
+def _finish(selector: selectors.BaseSelector, sock: socket.socket) -> socket.socket:
+    """
+    Take the winning socket out of the race and make it blocking again.
+
+    Args:
+        selector (selectors.BaseSelector): The selector holding the attempts still in progress.
+        sock (socket.socket): The connected socket.
+
+    Returns:
+        socket.socket: The connected socket.
+    """
+    if sock in selector.get_map():
+        selector.unregister(sock)
+    sock.setblocking(True)
+    return sock
 
 
 class MySocket:
@@ -18,14 +202,28 @@ class MySocket:
         Initialize the MySocket instance.
 
         The socket object (self.sock) is initially set to None and will be
-        created when the connect method is called.
+        created when the connect method is called. Incoming data is read into a
+        reusable receive buffer; bytes that arrive after a message's newline
+        are kept there for the next call to recv_msg.
         """
         self.sock = None
+        self._address: Optional[Tuple[str, int]] = None
+        self._transcript: Optional[SessionRecorder] = None
+        self._buffer = bytearray(Config.BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # Start of the buffered bytes not yet returned
+        self._end = 0  # End of the buffered bytes
+        self._scanned = 0  # Buffered bytes before this offset are known not to contain a newline
 
     def connect(self, host, port, use_tls=False):
         """
         Establish a connection to the specified host and port.
 
+        The host is resolved through a cache, IPv6 and IPv4 addresses are raced
+        (see open_connection), and the configured socket options are applied.
+        TLS connections share one context per process and offer the server's
+        previous session, so reconnecting can skip the full handshake.
+
         Args:
             host (str): The hostname or IP address to connect to.
             port (int): The port number to connect to.
@@ -34,14 +232,24 @@ class MySocket:
         Raises:
             ConnectionError: If the connection attempt fails.
         """
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        if use_tls:
-            context = ssl.create_default_context()
-            self.sock = context.wrap_socket(self.sock, server_hostname=host)
+        self._clear_buffer()
+        connect_timeout = Config.CONNECT_TIMEOUT if Config.CONNECT_TIMEOUT > 0 else None
         try:
-            self.sock.connect((host, port))
+            with stats.timer("connect"):
+                sock = open_connection(resolve(host, port), connect_timeout, Config.HAPPY_EYEBALLS_DELAY)
+                if use_tls:
+                    sock.settimeout(connect_timeout)
+                    sock = tls_context(Config.TLS_CA_FILE).wrap_socket(
+                        sock, server_hostname=host, session=_tls_sessions.get((host, port)))
+                    if sock.session_reused:
+                        stats.increment("tls_sessions_reused")
         except (ssl.SSLError, socket.error) as e:
             raise ConnectionError(f"Failed to connect to {host}:{port}. Error: {e}")
+        sock.settimeout(Config.READ_TIMEOUT if Config.READ_TIMEOUT > 0 else None)
+        self.sock = sock
+        self._address = (host, port)
+        recorder = get_recorder()
+        self._transcript = recorder.start_session(f"{host}:{port}") if recorder is not None else None
 
     def send_msg(self, msg):
         """
@@ -58,34 +266,89 @@ class MySocket:
         sent = self.sock.send(msg)
         if sent == 0:
             raise RuntimeError("Socket connection broken")
+        stats.increment("bytes_sent", sent)
+        if self._transcript is not None:
+            self._transcript.record(SENT, msg[:sent].decode(Config.DEFAULT_ENCODING))
 
     def recv_msg(self):
         """
         Receive a message from the socket.
 
         This method reads data from the socket until a newline character is
-        encountered or the connection is closed.
+        encountered or the connection is closed. Data is received with recv_into
+        into a reusable buffer, only newly received bytes are searched for the
+        newline, and any bytes after it are kept for the next message.
 
         Returns:
-            str: The received message, decoded using the default encoding.
+            str: The received message (including its newline), decoded using the default encoding.
+            If the connection is closed, whatever was buffered is returned (possibly an empty string).
 
         Raises:
-            RuntimeError: If the socket is not connected.
+            RuntimeError: If the socket is not connected or a message exceeds Config.MAX_MESSAGE_SIZE.
+            TimeoutError: If no data arrives within Config.READ_TIMEOUT seconds.
         """
         if not self.sock:
             raise RuntimeError("Socket is not connected")
-        chunks = []
         while True:
-            part = self.sock.recv(Config.BUFFER_SIZE)
-            if not part:
+            newline = self._buffer.find(b'\n', self._scanned, self._end)
+            if newline != -1:
+                return self._take(newline + 1)
+            self._scanned = self._end
+
+            if self._end - self._start >= Config.MAX_MESSAGE_SIZE:
+                raise RuntimeError(f"Message exceeds maximum size of {Config.MAX_MESSAGE_SIZE} bytes")
+            if self._end == len(self._buffer):
+                self._make_room()
+
+            received = self.sock.recv_into(self._view[self._end:])
+            if not received:
                 # Connection closed
-                break
-            chunks.append(part)
-            if b'\n' in part:
-                # This would tell us when to close the connection and stop receiving
-                break
+                return self._take(self._end)
+            self._end += received
+            stats.increment("bytes_received", received)
+
+    def _take(self, stop):
+        """
+        Remove the buffered bytes up to an offset and return them as a message.
 
-        return b''.join(chunks).decode(Config.DEFAULT_ENCODING)
+        Args:
+            stop (int): Offset in the buffer just past the end of the message.
+
+        Returns:
+            str: The message, decoded using the default encoding.
+        """
+        msg = self._buffer[self._start:stop].decode(Config.DEFAULT_ENCODING)
+        self._start = stop
+        self._scanned = max(self._scanned, stop)
+        if self._start == self._end:
+            self._start = self._end = self._scanned = 0
+        if self._transcript is not None and msg:
+            self._transcript.record(RECEIVED, msg)
+        return msg
+
+    def _make_room(self):
+        """
+        Make space at the end of the receive buffer.
+
+        Unread bytes are moved to the front of the buffer; if the buffer is full
+        of unread bytes, it is doubled in size (up to Config.MAX_MESSAGE_SIZE).
+        """
+        pending = self._end - self._start
+        if self._start > 0:
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+        else:
+            new_size = min(2 * len(self._buffer), Config.MAX_MESSAGE_SIZE)
+            self._view.release()
+            self._buffer.extend(bytes(new_size - len(self._buffer)))
+            self._view = memoryview(self._buffer)
+        self._scanned -= self._start
+        self._start, self._end = 0, pending
+
+    def _clear_buffer(self):
+        """
+        Discard any buffered bytes.
+        """
+        self._start = self._end = self._scanned = 0
 
     def disconnect(self):
         """
@@ -93,8 +356,16 @@ class MySocket:
         """
         if self.sock:
             try:
+                if isinstance(self.sock, ssl.SSLSocket) and self.sock.session is not None:
+                    # Remember the session (TLS 1.3 tickets arrive after the handshake) for the next connection
+                    with _lock:
+                        _tls_sessions[self._address] = self.sock.session
                 self.sock.close()
             except Exception as e:
                 print(f"Error closing socket: {e}")
             finally:
+                if self._transcript is not None:
+                    self._transcript.record(CLOSED)
+                    self._transcript = None
                 self.sock = None
+                self._clear_buffer()
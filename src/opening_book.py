@@ -0,0 +1,233 @@
+"""
+Offline-computed opening book.
+
+The first guess is fixed, so the early game states are the same in every game.
+The builder walks the solver over every state reachable from the opening (down
+to a maximum depth, or the whole tree) and records the guess it picks for each;
+Game then answers those states with a dictionary lookup.
+
+Usage:
+    python -m src.opening_book [--depth N | --full] [--strategy NAME]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.config import Config
+from src.patterns import compute_pattern_block, decode_pattern, encode_marks, num_patterns, words_to_array
+from src.strategy import STRATEGIES
+from src.word_bank import word_list_hash
+
+BOOK_VERSION = 2
+
+# Books already loaded in this process (None when there is no usable book), keyed by file path.
+_loaded_books: Dict[str, Optional["OpeningBook"]] = {}
+
+
+def history_key(guesses: Sequence[Dict]) -> str:
+    """
+    Build the book key of a game state from its guess history.
+
+    Args:
+        guesses (Sequence[Dict]): The guesses so far, each with a "word" and its "marks".
+
+    Returns:
+        str: The key, e.g. 'salet:12,crane:200'.
+    """
+    return ','.join(f"{guess['word']}:{encode_marks(guess['marks'])}" for guess in guesses)
+
+
+class OpeningBook:
+    """
+    A mapping from early game states to the solver's next guess.
+
+    Attributes:
+        solver (Dict): The solver settings the book was built with.
+        word_list_hash (str): Content hash of the dictionary the book was built with.
+        max_depth (Optional[int]): The deepest history length stored (None for the whole tree).
+        entries (Dict[str, str]): Next guess for each history key.
+    """
+
+    def __init__(self, solver: Dict, word_list_hash: str, max_depth: Optional[int], entries: Dict[str, str]):
+        self.solver = solver
+        self.word_list_hash = word_list_hash
+        self.max_depth = max_depth
+        self.entries = entries
+
+    def lookup(self, guesses: Sequence[Dict]) -> Optional[str]:
+        """
+        Look up the next guess for a game state.
+
+        Args:
+            guesses (Sequence[Dict]): The guesses so far, each with a "word" and its "marks".
+
+        Returns:
+            Optional[str]: The book guess, or None if the state is not in the book.
+        """
+        if self.max_depth is not None and len(guesses) > self.max_depth:
+            return None
+        return self.entries.get(history_key(guesses))
+
+    def save(self, path: str) -> None:
+        """
+        Write the book to a JSON file, replacing it atomically.
+
+        Args:
+            path (str): The file to write.
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                "version": BOOK_VERSION,
+                "solver": self.solver,
+                "word_list_hash": self.word_list_hash,
+                "max_depth": self.max_depth,
+                "entries": self.entries,
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "OpeningBook":
+        """
+        Read a book from a JSON file.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            OpeningBook: The loaded book.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get("version") != BOOK_VERSION:
+            raise ValueError(f"Opening book {path} has version {data.get('version')}, expected {BOOK_VERSION}")
+        return cls(data["solver"], data["word_list_hash"], data["max_depth"], data["entries"])
+
+
+def opening_book_path(words: Sequence[str], solver: Dict, cache_dir: str = None) -> str:
+    """
+    Get the cache file path of the opening book for a dictionary and solver settings.
+
+    Args:
+        words (Sequence[str]): The dictionary (a Dictionary, so the key covers its answers).
+        solver (Dict): The solver settings (see Game._solver_settings).
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        str: Path of the book file.
+    """
+    cache_dir = cache_dir or Config.CACHE_DIR
+    key = f"{BOOK_VERSION}:{word_list_hash(words)}{json.dumps(solver, sort_keys=True)}"
+    key = hashlib.sha256(key.encode()).hexdigest()
+    return os.path.join(cache_dir, f"opening-{key[:16]}.json")
+
+
+def load_opening_book(words: Sequence[str], solver: Dict, cache_dir: str = None) -> Optional[OpeningBook]:
+    """
+    Load the opening book for a dictionary and solver settings, if one has been built.
+
+    The result (including the absence of a book) is cached for the process.
+
+    Args:
+        words (Sequence[str]): The dictionary (a Dictionary, so the key covers its answers).
+        solver (Dict): The solver settings (see Game._solver_settings).
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        Optional[OpeningBook]: The book, or None if there is no usable book.
+    """
+    path = opening_book_path(words, solver, cache_dir)
+    if path not in _loaded_books:
+        book = None
+        if os.path.exists(path):
+            try:
+                book = OpeningBook.load(path)
+                if book.solver != solver or book.word_list_hash != word_list_hash(words):
+                    raise ValueError(f"Opening book {path} was built for a different dictionary or solver")
+            except (ValueError, KeyError) as e:
+                logging.getLogger('App').warning(f"Ignoring opening book: {e}")
+                book = None
+        _loaded_books[path] = book
+    return _loaded_books[path]
+
+
+def build_opening_book(game, max_depth: Optional[int] = 2) -> OpeningBook:
+    """
+    Walk the solver over every state reachable from the opening guess.
+
+    At each state the possible answers are split by the feedback pattern of the
+    state's guess, and the solver is asked for its next guess once per pattern.
+
+    Args:
+        game (Game): The solver to walk; its state is overwritten.
+        max_depth (Optional[int]): The deepest history length to store (None for the whole tree).
+
+    Returns:
+        OpeningBook: The book of every visited state.
+    """
+    dictionary = game.dictionary
+    letters = words_to_array(game.word_list)
+    solved = num_patterns(dictionary.word_length) - 1
+    entries: Dict[str, str] = {}
+
+    game.reset()
+    answers = dictionary.answer_ids if dictionary.answer_ids is not None else np.arange(len(game.word_list))
+    stack = [([], answers, game._snapshot_state(), game._get_initial_guess())]
+    while stack:
+        history, answers, state, guess = stack.pop()
+        codes = compute_pattern_block(words_to_array([guess], dictionary.alphabet), letters[answers])[0]
+        for code in np.unique(codes):
+            if code == solved:
+                continue
+            marks = decode_pattern(int(code), dictionary.word_length)
+            child_history = history + [{"word": guess, "marks": marks}]
+
+            game._restore_state(state)
+            game._update_constraints(guess, marks)
+            game._filter_possible_words(guess, marks)
+            next_guess = game._compute_next_guess()
+            entries[history_key(child_history)] = next_guess
+
+            if max_depth is None or len(child_history) < max_depth:
+                stack.append((child_history, answers[codes == code], game._snapshot_state(), next_guess))
+
+    return OpeningBook(game._solver_settings(), word_list_hash(dictionary), max_depth, entries)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Build the opening book from the command line.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    from src.game import Game
+
+    parser = argparse.ArgumentParser(description="Build the opening book for the current solver settings.")
+    depth = parser.add_mutually_exclusive_group()
+    depth.add_argument('--depth', type=int, default=2, help="number of guesses after the opening to store "
+                                                             "(default: %(default)s)")
+    depth.add_argument('--full', action='store_true', help="store every reachable state")
+    parser.add_argument('--strategy', choices=STRATEGIES, default=Config.STRATEGY,
+                        help="guess selection strategy (default: %(default)s)")
+    parsed_args = parser.parse_args(args)
+
+    game = Game(None, "opening_book", log_level=logging.WARN, strategy=parsed_args.strategy)
+    book = build_opening_book(game, max_depth=None if parsed_args.full else parsed_args.depth)
+    path = opening_book_path(game.dictionary, book.solver)
+    book.save(path)
+    print(f"Wrote {len(book.entries)} states to {path}")
+
+
+if __name__ == '__main__':
+    main()
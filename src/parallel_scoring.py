@@ -0,0 +1,206 @@
+"""
+Multi-core entropy scoring over shared pattern data.
+
+On the first turns the entropy strategy scores every guess against thousands
+of candidates, which splits cleanly into slices of the guess pool. A
+ScoringPool keeps worker processes that map the pattern matrix (the cached
+.npy file, or a shared-memory copy of an in-memory matrix) and read the
+candidate bitset from a shared-memory block, so a request only sends each
+worker the bounds of its slice. Each worker returns its best guess and the
+best of those is kept, which is exactly the guess the single-process scorer
+picks.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.patterns import NUM_PATTERNS, PatternMatrix
+from src.strategy import entropy_scores
+
+# Pools already started in this process, keyed by the id of their pattern matrix.
+_scoring_pools: Dict[int, "ScoringPool"] = {}
+
+# Shared data attached by each worker process in _init_worker.
+_worker_matrix: Optional[np.ndarray] = None
+_worker_mask: Optional[np.ndarray] = None
+_worker_pattern_count = NUM_PATTERNS
+_worker_segments: List[shared_memory.SharedMemory] = []
+
+
+def _attach(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """
+    Map an array stored in a shared-memory block, in a worker process.
+
+    Args:
+        name (str): The name of the block.
+        shape (Tuple[int, ...]): The array's shape.
+        dtype: The array's dtype.
+
+    Returns:
+        np.ndarray: The array, backed by the block.
+    """
+    segment = shared_memory.SharedMemory(name=name)
+    _worker_segments.append(segment)
+    return np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+
+
+def _init_worker(matrix_source: Tuple, mask_name: str, word_count: int, dtype: str, pattern_count: int) -> None:
+    """
+    Attach the pattern matrix and the candidate bitset once per worker process.
+
+    Args:
+        matrix_source (Tuple): ('file', path, offset) for a memory-mapped .npy file,
+            or ('shm', name) for a matrix copied into shared memory.
+        mask_name (str): The shared-memory block holding the candidate bitset.
+        word_count (int): The number of words in the dictionary.
+        dtype (str): The dtype of the pattern codes.
+        pattern_count (int): The number of pattern codes.
+    """
+    global _worker_matrix, _worker_mask, _worker_pattern_count
+    shape = (word_count, word_count)
+    if matrix_source[0] == 'file':
+        _worker_matrix = np.memmap(matrix_source[1], dtype=dtype, mode='r', offset=matrix_source[2], shape=shape)
+    else:
+        _worker_matrix = _attach(matrix_source[1], shape, dtype)
+    _worker_mask = _attach(mask_name, (word_count,), bool)
+    _worker_pattern_count = pattern_count
+
+
+def _score_slice(task: Tuple[int, int, bool]) -> Tuple[float, int]:
+    """
+    Find the best guess in one slice of the guess pool, in a worker process.
+
+    Args:
+        task (Tuple[int, int, bool]): Start and stop of the slice, and whether the
+            guess pool is every word (otherwise it is the candidates).
+
+    Returns:
+        Tuple[float, int]: The best score in the slice and the word ID of its guess.
+    """
+    start, stop, all_words = task
+    candidate_ids = np.flatnonzero(_worker_mask)
+    guess_ids = np.arange(start, stop) if all_words else candidate_ids[start:stop]
+    rows = _worker_matrix[start:stop] if all_words else _worker_matrix[guess_ids]
+    scores = entropy_scores(rows[:, candidate_ids], np.arange(len(guess_ids)), candidate_ids, guess_ids,
+                            _worker_pattern_count)
+    best = int(np.argmax(scores))
+    return float(scores[best]), int(guess_ids[best])
+
+
+class ScoringPool:
+    """
+    Worker processes that score slices of the guess pool in parallel.
+
+    Attributes:
+        patterns (PatternMatrix): The pattern matrix the workers score with.
+        workers (int): The number of worker processes.
+    """
+
+    def __init__(self, patterns: PatternMatrix, workers: int):
+        self.patterns = patterns
+        self.workers = workers
+        word_count = len(patterns.words)
+        self._segments: List[shared_memory.SharedMemory] = []
+        self._mask = self._share(np.zeros(word_count, dtype=bool))
+
+        matrix = patterns.matrix
+        if isinstance(matrix, np.memmap) and matrix.filename and matrix.shape == (word_count, word_count):
+            matrix_source = ('file', matrix.filename, matrix.offset)
+        else:
+            self._share(np.ascontiguousarray(matrix))
+            matrix_source = ('shm', self._segments[-1].name)
+        self._lock = threading.Lock()
+        self._pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                          initargs=(matrix_source, self._segments[0].name, word_count,
+                                                    matrix.dtype.str, patterns.num_patterns))
+
+    def _share(self, array: np.ndarray) -> np.ndarray:
+        """
+        Copy an array into a new shared-memory block.
+
+        Args:
+            array (np.ndarray): The array to copy.
+
+        Returns:
+            np.ndarray: The copy, backed by the block.
+        """
+        segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._segments.append(segment)
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+        shared[...] = array
+        return shared
+
+    def choose_entropy_guess(self, candidate_mask: np.ndarray, all_words: bool) -> str:
+        """
+        Choose the guess with the highest expected information gain, like strategy.choose_entropy_guess.
+
+        Args:
+            candidate_mask (np.ndarray): Bitset of the remaining candidates.
+            all_words (bool): Whether every word may be guessed (otherwise only the candidates).
+
+        Returns:
+            str: The best word to guess next.
+        """
+        with self._lock:
+            self._mask[:] = candidate_mask
+            pool_size = len(self._mask) if all_words else int(np.count_nonzero(candidate_mask))
+            bounds = np.linspace(0, pool_size, self.workers + 1, dtype=int)
+            tasks = [(int(start), int(stop), all_words) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+            results = self._pool.map(_score_slice, tasks)
+        # Slices are in guess order, so taking the first maximum matches np.argmax over the whole pool
+        _, best_id = max(results, key=lambda result: result[0])
+        return self.patterns.words[best_id]
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared-memory blocks.
+        """
+        self._pool.terminate()
+        self._pool.join()
+        del self._mask
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+
+def scoring_workers() -> int:
+    """
+    Get the number of scoring worker processes configured.
+
+    Returns:
+        int: Config.SCORING_WORKERS, or one per CPU if it is negative.
+    """
+    if Config.SCORING_WORKERS < 0:
+        return os.cpu_count() or 1
+    return Config.SCORING_WORKERS
+
+
+def get_scoring_pool(patterns: PatternMatrix) -> Optional[ScoringPool]:
+    """
+    Get the shared scoring pool for a pattern matrix, starting it on first use.
+
+    The pool is closed when the process exits.
+
+    Args:
+        patterns (PatternMatrix): The pattern matrix to score with.
+
+    Returns:
+        Optional[ScoringPool]: The pool, or None if fewer than two workers are configured.
+    """
+    workers = scoring_workers()
+    if workers < 2:
+        return None
+    key = id(patterns)
+    if key not in _scoring_pools:
+        pool = ScoringPool(patterns, workers)
+        atexit.register(pool.close)
+        _scoring_pools[key] = pool
+    return _scoring_pools[key]
@@ -0,0 +1,316 @@
+import os
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from src.config import Config
+from src.word_bank import DEFAULT_ALPHABET, WordBank, letter_indices, word_list_hash
+
+# Pattern constants of the classic five-letter game; see num_patterns for other word lengths.
+WORD_LENGTH = 5
+NUM_PATTERNS = 3 ** WORD_LENGTH
+SOLVED_PATTERN = NUM_PATTERNS - 1
+
+# Longest words whose pattern codes fit in a uint16.
+MAX_WORD_LENGTH = 10
+
+# Number of guesses processed together when building the matrix.
+_BUILD_BATCH_SIZE = 64
+
+# Matrices already loaded in this process, keyed by the word list hash.
+_loaded_matrices: Dict[str, "PatternMatrix"] = {}
+
+
+def compute_marks(guess: str, answer: str) -> List[int]:
+    """
+    Compute the marks the server returns for a guess against an answer.
+
+    Args:
+        guess (str): The guessed word.
+        answer (str): The target word.
+
+    Returns:
+        List[int]: An array of marks (0, 1, or 2) for each letter in the guess.
+    """
+    marks = [0] * len(guess)
+    remaining: Dict[str, int] = {}
+
+    # Mark correct positions
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            marks[i] = 2
+        else:
+            remaining[a] = remaining.get(a, 0) + 1
+
+    # Mark correct letters in wrong positions
+    for i, g in enumerate(guess):
+        if marks[i] == 0 and remaining.get(g, 0) > 0:
+            marks[i] = 1
+            remaining[g] -= 1
+
+    return marks
+
+
+def num_patterns(word_length: int = WORD_LENGTH) -> int:
+    """
+    Get the number of feedback patterns for a word length.
+
+    The solved pattern (every mark a 2) is always the last one, num_patterns(n) - 1.
+
+    Args:
+        word_length (int): The number of letters in a word.
+
+    Returns:
+        int: The number of pattern codes.
+    """
+    return 3 ** word_length
+
+
+def pattern_dtype(word_length: int = WORD_LENGTH) -> np.dtype:
+    """
+    Get the smallest unsigned integer type that holds every pattern code of a word length.
+
+    Args:
+        word_length (int): The number of letters in a word.
+
+    Returns:
+        np.dtype: uint8 for words of up to five letters, uint16 up to MAX_WORD_LENGTH.
+
+    Raises:
+        ValueError: If the words are longer than MAX_WORD_LENGTH.
+    """
+    if word_length > MAX_WORD_LENGTH:
+        raise ValueError(f"Words of {word_length} letters are longer than the supported {MAX_WORD_LENGTH}")
+    return np.dtype(np.uint8 if num_patterns(word_length) <= 256 else np.uint16)
+
+
+def encode_marks(marks: Sequence[int]) -> int:
+    """
+    Encode a marks array as a base-3 integer (position 0 is the least significant digit).
+
+    Args:
+        marks (Sequence[int]): The marks for each letter of a guess.
+
+    Returns:
+        int: The pattern code in the range [0, 3 ** len(marks)).
+    """
+    code = 0
+    for mark in reversed(marks):
+        code = code * 3 + mark
+    return code
+
+
+def decode_pattern(code: int, length: int = WORD_LENGTH) -> List[int]:
+    """
+    Decode a base-3 pattern code back into a marks array.
+
+    Args:
+        code (int): The pattern code.
+        length (int): The number of letters in the word.
+
+    Returns:
+        List[int]: The marks array encoded by the code.
+    """
+    marks = []
+    for _ in range(length):
+        code, mark = divmod(code, 3)
+        marks.append(mark)
+    return marks
+
+
+def compute_pattern(guess: str, answer: str) -> int:
+    """
+    Compute the base-3 pattern code for a guess against an answer.
+
+    Args:
+        guess (str): The guessed word.
+        answer (str): The target word.
+
+    Returns:
+        int: The encoded feedback pattern.
+    """
+    return encode_marks(compute_marks(guess, answer))
+
+
+def words_to_array(words: Sequence[str], alphabet: str = DEFAULT_ALPHABET) -> np.ndarray:
+    """
+    Convert a list of words into an (N, word length) array of letter indices in an alphabet.
+
+    Args:
+        words (Sequence[str]): The words to convert.
+        alphabet (str): The alphabet numbering the letters (a WordBank uses its own).
+
+    Returns:
+        np.ndarray: A uint8 array of letter indices.
+    """
+    if isinstance(words, WordBank):
+        return words.letters
+    raw = np.frombuffer(''.join(words).encode(Config.DEFAULT_ENCODING), dtype=np.uint8)
+    return letter_indices(raw, alphabet).reshape(len(words), len(words[0]) if len(words) else WORD_LENGTH)
+
+
+def compute_pattern_block(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """
+    Compute pattern codes for every (guess, answer) pair of two word arrays.
+
+    Args:
+        guesses (np.ndarray): (G, L) letter indices of the guesses.
+        answers (np.ndarray): (A, L) letter indices of the answers.
+
+    Returns:
+        np.ndarray: A (G, A) array of pattern codes, of pattern_dtype(L).
+    """
+    word_length = guesses.shape[1]
+    dtype = pattern_dtype(word_length)
+    powers = (3 ** np.arange(word_length)).astype(dtype)
+
+    # Occurrences of each letter in each answer: (alphabet size, A)
+    alphabet_size = int(max(guesses.max(initial=0), answers.max(initial=0))) + 1
+    letter_counts = np.zeros((alphabet_size, len(answers)), dtype=np.uint8)
+    for i in range(word_length):
+        np.add.at(letter_counts, (answers[:, i], np.arange(len(answers))), 1)
+
+    green = [(guesses[:, i, None] == answers[None, :, i]).view(np.uint8) for i in range(word_length)]
+    same_letter = (guesses[:, :, None] == guesses[:, None, :]).view(np.uint8)
+    yellow = []
+    codes = np.zeros((len(guesses), len(answers)), dtype=dtype)
+
+    for i in range(word_length):
+        # Copies of guess letter i in the answer that are not matched by a green,
+        # minus the copies already claimed by yellows at earlier positions.
+        available = letter_counts[guesses[:, i]]
+        for j in range(word_length):
+            available = available - green[j] * same_letter[:, i, j, None]
+        for j in range(i):
+            available = available - yellow[j] * same_letter[:, i, j, None]
+        yellow.append((available > 0).view(np.uint8) & (green[i] ^ 1))
+        codes += (green[i] * np.uint8(2) + yellow[i]).astype(dtype, copy=False) * powers[i]
+
+    return codes
+
+
+def build_pattern_matrix(words: Sequence[str]) -> np.ndarray:
+    """
+    Build the full guess x answer pattern matrix for a word list.
+
+    Args:
+        words (Sequence[str]): The dictionary, used both as guesses and answers.
+
+    Returns:
+        np.ndarray: An (N, N) array (of pattern_dtype) where entry [g, a] is the pattern code of
+        guessing words[g] when the answer is words[a].
+    """
+    letters = words_to_array(words)
+    matrix = np.empty((len(words), len(words)), dtype=pattern_dtype(letters.shape[1]))
+    for start in range(0, len(words), _BUILD_BATCH_SIZE):
+        stop = start + _BUILD_BATCH_SIZE
+        matrix[start:stop] = compute_pattern_block(letters[start:stop], letters)
+    return matrix
+
+
+class PatternMatrix:
+    """
+    A guess x answer feedback-pattern matrix for a fixed word list.
+
+    Attributes:
+        words (WordBank): The dictionary the matrix was built for.
+        matrix (np.ndarray): The (N, N) pattern codes, usually memory-mapped.
+        num_patterns (int): The number of pattern codes for the dictionary's word length.
+    """
+
+    def __init__(self, words: Sequence[str], matrix: np.ndarray):
+        self.words = words if isinstance(words, WordBank) else WordBank.from_words(words)
+        self.matrix = matrix
+        self.num_patterns = num_patterns(self.words.word_length)
+
+    def pattern(self, guess: str, answer: str) -> int:
+        """
+        Look up the pattern code for a guess against an answer.
+
+        Args:
+            guess (str): The guessed word.
+            answer (str): The target word.
+
+        Returns:
+            int: The encoded feedback pattern.
+        """
+        return int(self.matrix[self.words.word_ids[guess], self.words.word_ids[answer]])
+
+    def matches(self, guess: str, marks: Sequence[int]) -> np.ndarray:
+        """
+        Get the bitset of answers that would have produced the observed marks for a guess.
+
+        Args:
+            guess (str): The guessed word (must be in the dictionary).
+            marks (Sequence[int]): The marks received for the guess.
+
+        Returns:
+            np.ndarray: A bool array indexed by word ID.
+        """
+        return self.matrix[self.words.word_ids[guess]] == encode_marks(marks)
+
+    def filter(self, candidate_ids: np.ndarray, guess: str, marks: Sequence[int]) -> np.ndarray:
+        """
+        Keep the candidates that would have produced the observed marks for a guess.
+
+        Args:
+            candidate_ids (np.ndarray): Word IDs of the current candidates.
+            guess (str): The guessed word (must be in the dictionary).
+            marks (Sequence[int]): The marks received for the guess.
+
+        Returns:
+            np.ndarray: The word IDs of the remaining candidates.
+        """
+        row = self.matrix[self.words.word_ids[guess]]
+        return candidate_ids[row[candidate_ids] == encode_marks(marks)]
+
+
+def pattern_matrix_path(words: Sequence[str], cache_dir: str = None) -> str:
+    """
+    Get the cache file path for the pattern matrix of a word list.
+
+    Args:
+        words (Sequence[str]): The dictionary.
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        str: Path of the .npy file keyed by the word list hash.
+    """
+    cache_dir = cache_dir or Config.CACHE_DIR
+    return os.path.join(cache_dir, f"patterns-{word_list_hash(words)[:16]}.npy")
+
+
+def load_pattern_matrix(words: Sequence[str], cache_dir: str = None) -> PatternMatrix:
+    """
+    Load the pattern matrix for a word list, building and caching it on first use.
+
+    The matrix is memory-mapped from disk, so later runs (and other processes)
+    share the page cache instead of recomputing it. The cache file is keyed by
+    a hash of the word list and is rebuilt whenever the dictionary changes.
+
+    Args:
+        words (Sequence[str]): The dictionary.
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        PatternMatrix: The loaded pattern matrix.
+    """
+    key = word_list_hash(words)
+    if key in _loaded_matrices:
+        return _loaded_matrices[key]
+
+    path = pattern_matrix_path(words, cache_dir)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, build_pattern_matrix(words))
+        os.replace(tmp_path, path)
+
+    matrix = np.load(path, mmap_mode='r')
+    if matrix.shape != (len(words), len(words)):
+        raise ValueError(f"Pattern matrix at {path} has shape {matrix.shape}, expected {(len(words), len(words))}")
+
+    patterns = PatternMatrix(words, matrix)
+    _loaded_matrices[key] = patterns
+    return patterns
@@ -0,0 +1,125 @@
+"""
+Encoding and decoding of the game server's JSON-lines messages.
+
+Every guess message of a game differs only in the guessed word, so its fixed
+parts are encoded once per game. Every retry reply repeats the whole guess
+history, but the client only needs the newest entry, so decode_response reads
+the message type and the last guess without building the rest; anything it
+does not recognize (and every message when validating) goes through a full
+json.loads instead.
+"""
+
+import json
+import re
+from typing import Dict, Optional
+
+from src.config import Config
+
+# The message type, when "type" is the first key (as the server sends it).
+_TYPE_PATTERN = re.compile(r'\s*\{\s*"type"\s*:\s*"([a-z]+)"')
+
+# The flag of a bye message.
+_FLAG_PATTERN = re.compile(r'"flag"\s*:\s*"([^"\\]*)"')
+
+_decoder = json.JSONDecoder()
+
+
+def encode_hello(username: str) -> bytes:
+    """
+    Encode the hello message that starts a game.
+
+    Args:
+        username (str): The player's username.
+
+    Returns:
+        bytes: The newline-terminated message.
+    """
+    return (json.dumps({"type": "hello", "northeastern_username": username}) + '\n').encode(Config.DEFAULT_ENCODING)
+
+
+class GuessEncoder:
+    """
+    Encodes the guess messages of one game.
+
+    The bytes before and after the word are built once, so encoding a guess
+    is two concatenations. The output is byte-for-byte what json.dumps would
+    produce.
+    """
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self._prefix = ('{"type": "guess", "id": ' + json.dumps(game_id) + ', "word": "').encode(
+            Config.DEFAULT_ENCODING)
+
+    def encode(self, word: str) -> bytes:
+        """
+        Encode a guess message.
+
+        Args:
+            word (str): The guessed word.
+
+        Returns:
+            bytes: The newline-terminated message.
+        """
+        if not (word.isascii() and word.isalnum()):
+            # Needs escaping; let json do it
+            return (json.dumps({"type": "guess", "id": self.game_id, "word": word}) + '\n').encode(
+                Config.DEFAULT_ENCODING)
+        return self._prefix + word.encode(Config.DEFAULT_ENCODING) + b'"}\n'
+
+
+def decode_response(msg: str, validate: bool = False) -> Dict:
+    """
+    Decode a reply from the server.
+
+    For 'retry' replies only the last entry of the guess history is decoded:
+    the result is {"type": "retry", "guesses": [last_guess]}. For 'bye'
+    replies the result is {"type": "bye", "flag": flag}. Every other reply, or
+    one that does not have the expected layout, is decoded in full.
+
+    Args:
+        msg (str): The received message.
+        validate (bool): Always decode (and so validate) the whole message.
+
+    Returns:
+        Dict: The decoded reply.
+
+    Raises:
+        ValueError: If the message is not valid JSON.
+    """
+    if not validate:
+        match = _TYPE_PATTERN.match(msg)
+        if match is not None:
+            if match.group(1) == "retry":
+                last_guess = _decode_last_guess(msg)
+                if last_guess is not None:
+                    return {"type": "retry", "guesses": [last_guess]}
+            elif match.group(1) == "bye":
+                flag = _FLAG_PATTERN.search(msg)
+                if flag is not None:
+                    return {"type": "bye", "flag": flag.group(1)}
+    return json.loads(msg)
+
+
+def _decode_last_guess(msg: str) -> Optional[Dict]:
+    """
+    Decode the last object of the guess history in a retry reply.
+
+    Args:
+        msg (str): The received message.
+
+    Returns:
+        Optional[Dict]: The last guess with its "word" and "marks", or None if
+        the message is not laid out as expected.
+    """
+    word_key = msg.rfind('"word"')
+    start = msg.rfind('{', 0, word_key)
+    if word_key == -1 or start <= 0:
+        return None
+    try:
+        guess, end = _decoder.raw_decode(msg, start)
+    except ValueError:
+        return None
+    if not (isinstance(guess, dict) and "word" in guess and "marks" in guess and msg[end:].lstrip()[:1] == ']'):
+        return None
+    return guess
@@ -0,0 +1,254 @@
+"""
+Client side of the solver daemon (see src.solver_daemon).
+
+A client that plays one game per process spends most of its startup
+importing NumPy and loading the dictionary and its indexes. When a daemon is
+listening on Config.SOLVER_SOCKET, the client asks it for its guesses
+instead. This module only imports the standard library and the network
+layer, so that path never loads the solver. Without a daemon, or if the
+daemon fails mid-game, the game is solved in-process.
+
+Each connection to the daemon plays one game. Queries and replies are JSON
+lines: a query holds the guesses made (with their marks) since the previous
+query, starting with none, and the reply holds the next guess, as
+{"word": guess}, or {"error": message}. The first query also carries the
+solver settings (strategy, dictionary and the Config values that pick the
+guesses) the client would have used itself; a daemon that cannot solve with
+them replies with an error, and the game is solved in-process.
+"""
+
+import json
+import logging
+import os
+import socket
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from src import stats
+from src.config import Config
+from src.protocol import GuessEncoder, decode_response, encode_hello
+from src.strategy_names import RANKED
+
+if TYPE_CHECKING:
+    from src.game import Game
+    from src.my_socket import MySocket
+
+
+# The Config attributes that determine which guesses a solver picks, by their name in the solver settings
+# (see Game._solver_settings), and the type of their values.
+SOLVER_CONFIG = {
+    "initial_guess": ("INITIAL_GUESS", str),
+    "use_pattern_matrix": ("USE_PATTERN_MATRIX", bool),
+    "guess_from_all_words": ("GUESS_FROM_ALL_WORDS", bool),
+    "shortlist_size": ("RANK_SHORTLIST_SIZE", int),
+    "rerank_scorer": ("RERANK_SCORER", str),
+    "turn_time_budget": ("TURN_TIME_BUDGET", float),
+}
+# The solver settings that only apply to the 'ranked' strategy.
+RANKED_SETTINGS = ("shortlist_size", "rerank_scorer", "turn_time_budget")
+# The solver settings naming the dictionary.
+DICTIONARY_SETTINGS = ("word_list", "answer_list", "alphabet")
+
+
+def solver_settings(strategy: str) -> Dict:
+    """
+    Get the settings a daemon must solve with to guess like an in-process Game.
+
+    These are the Config values behind Game._solver_settings, as configured
+    in this process, plus the dictionary.
+
+    Args:
+        strategy (str): The guess selection strategy.
+
+    Returns:
+        Dict: The strategy, the Config values in SOLVER_CONFIG it uses, and the dictionary's files (as absolute
+        paths) and alphabet.
+    """
+    settings = {
+        "strategy": strategy,
+        "word_list": os.path.abspath(Config.WORD_LIST),
+        "answer_list": os.path.abspath(Config.ANSWER_LIST) if Config.ANSWER_LIST else None,
+        "alphabet": Config.ALPHABET,
+    }
+    for name, (attribute, _) in SOLVER_CONFIG.items():
+        if strategy == RANKED or name not in RANKED_SETTINGS:
+            settings[name] = getattr(Config, attribute)
+    return settings
+
+
+class LocalSolver:
+    """
+    Solves one game with a Game in this process.
+
+    The Game may be shared with other games: this only keeps the game's own
+    GameState (see Game.next_guess_for).
+    """
+
+    def __init__(self, game: "Game"):
+        self.game = game
+        self.state = game.new_state()
+
+    @classmethod
+    def create(cls, strategy: str) -> "LocalSolver":
+        """
+        Load a solver in this process.
+
+        Args:
+            strategy (str): The guess selection strategy.
+
+        Returns:
+            LocalSolver: A solver for a new game.
+        """
+        # Imported here: loading the solver is what asking a daemon avoids
+        from src.game import Game
+        return cls(Game(None, "local", log_level=Config.LOG_LEVEL, strategy=strategy))
+
+    def next_guess(self, guesses: List[Dict]) -> str:
+        """
+        Apply the guesses made since the previous call and get the next guess.
+
+        Args:
+            guesses (List[Dict]): The new guesses, each with a "word" and its "marks" (none before the first guess).
+
+        Returns:
+            str: The next word to guess.
+        """
+        if not guesses:
+            return self.game._get_initial_guess()
+        for entry in guesses:
+            guess = self.game.next_guess_for(self.state, {"guesses": [entry]})
+        return guess
+
+    def close(self) -> None:
+        """
+        Release the solver (nothing to do in-process).
+        """
+
+
+class RemoteSolver:
+    """
+    Asks a solver daemon for the guesses of one game.
+
+    Attributes:
+        sock (socket.socket): The connection to the daemon.
+        strategy (str): The guess selection strategy requested.
+    """
+
+    def __init__(self, sock: socket.socket, strategy: str):
+        self.sock = sock
+        self.strategy = strategy
+        self._reader = sock.makefile('rb')
+        self._started = False
+
+    @classmethod
+    def connect(cls, strategy: str, path: Optional[str] = None) -> Optional["RemoteSolver"]:
+        """
+        Connect to the solver daemon, if one is running.
+
+        Args:
+            strategy (str): The guess selection strategy.
+            path (Optional[str]): The daemon's socket (defaults to Config.SOLVER_SOCKET; empty disables).
+
+        Returns:
+            Optional[RemoteSolver]: A solver for a new game, or None if no daemon is listening.
+        """
+        path = Config.SOLVER_SOCKET if path is None else path
+        if not path or not hasattr(socket, 'AF_UNIX'):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(Config.SOLVER_TIMEOUT if Config.SOLVER_TIMEOUT > 0 else None)
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            return None
+        return cls(sock, strategy)
+
+    def next_guess(self, guesses: List[Dict]) -> str:
+        """
+        Send the guesses made since the previous call and get the next guess from the daemon.
+
+        Args:
+            guesses (List[Dict]): The new guesses, each with a "word" and its "marks" (none before the first guess).
+
+        Returns:
+            str: The next word to guess.
+
+        Raises:
+            OSError: If the daemon cannot be reached or does not answer in time.
+            RuntimeError: If the daemon replies with an error.
+            ValueError: If the reply is not valid JSON.
+        """
+        query: Dict = {"guesses": guesses}
+        if not self._started:
+            query["settings"] = solver_settings(self.strategy)
+        self.sock.sendall((json.dumps(query) + '\n').encode(Config.DEFAULT_ENCODING))
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Solver daemon closed the connection")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(f"Solver daemon error: {reply['error']}")
+        self._started = True
+        return reply["word"]
+
+    def close(self) -> None:
+        """
+        Close the connection to the daemon.
+        """
+        self._reader.close()
+        self.sock.close()
+
+
+def play_game(sock: "MySocket", username: str, solver: Union[RemoteSolver, LocalSolver]) -> str:
+    """
+    Play one game like Game.start_game, with the guesses computed by a solver daemon.
+
+    If the daemon fails, the game goes on with a LocalSolver, which replays the
+    guesses made so far.
+
+    Args:
+        sock (MySocket): The connected socket to the game server; it is disconnected at the end.
+        username (str): The player's username.
+        solver (Union[RemoteSolver, LocalSolver]): The solver to start with.
+
+    Returns:
+        str: The secret flag, which is also printed.
+
+    Raises:
+        ValueError: If the server replies with an error.
+    """
+    try:
+        sock.send_msg(encode_hello(username))
+        reply = decode_response(sock.recv_msg(), validate=True)
+        if reply["type"] == "error":
+            raise ValueError(reply["message"])
+        encoder = GuessEncoder(reply["id"])
+
+        history: List[Dict] = []
+        new_guesses: List[Dict] = []
+        while True:
+            try:
+                guess = solver.next_guess(new_guesses)
+            except (OSError, RuntimeError, ValueError) as e:
+                if not isinstance(solver, RemoteSolver):
+                    raise
+                logging.warning("Solving in-process after the solver daemon failed: %s", e)
+                stats.increment("solver_daemon_failures")
+                solver.close()
+                solver = LocalSolver.create(solver.strategy)
+                guess = solver.next_guess(history)
+
+            with stats.timer("round_trip"):
+                sock.send_msg(encoder.encode(guess))
+                msg = sock.recv_msg()
+            reply = decode_response(msg, Config.VALIDATE_RESPONSES)
+            if reply["type"] == "bye":
+                print(reply["flag"])
+                return reply["flag"]
+            if reply["type"] != "retry":
+                raise ValueError(reply.get("message", f"Unexpected reply: {reply['type']}"))
+            new_guesses = reply["guesses"][-1:]
+            history += new_guesses
+    finally:
+        solver.close()
+        sock.disconnect()
@@ -0,0 +1,190 @@
+"""
+Offline replay of recorded client traffic.
+
+Plays each session of a transcript (see src.transcript) through Game over a
+ReplaySocket, which answers with the recorded replies instead of a server,
+either as fast as possible or waiting as long as the server took. Solver and
+codec changes can then be timed against real traffic without a network.
+
+Usage:
+    python -m src.replay TRANSCRIPT [--realtime] [--strategy NAME] [--json]
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+
+from src.config import Config
+from src.game import Game
+from src.load_test import LoadTestStats, format_summary
+from src.strategy import STRATEGIES
+from src.transcript import RECEIVED, SENT, Event, load_sessions
+
+
+class ReplaySocket:
+    """
+    A stand-in for MySocket that answers with the replies recorded in one session.
+
+    Sent messages are compared with the recorded ones (a solver change may
+    guess differently), but the recorded replies are returned either way, so
+    every replayed game takes the same turns as the recorded one.
+
+    Attributes:
+        events (List[Event]): The recorded events of the session.
+        realtime (bool): Whether each reply waits for as long as the server took to send it.
+        divergences (int): Number of sent messages that differ from the recording.
+    """
+
+    def __init__(self, events: List[Event], realtime: bool = False):
+        self.events = events
+        self.realtime = realtime
+        self.divergences = 0
+        self._sent = [event for event in events if event.direction == SENT]
+        self._received = [event for event in events if event.direction == RECEIVED]
+        self._send_index = 0
+        self._recv_index = 0
+        self._last_send: Optional[Event] = None
+        self._last_send_at = 0.0
+
+    def send_msg(self, msg: bytes) -> None:
+        """
+        Accept a message, counting it as a divergence if it differs from the recording.
+
+        Args:
+            msg (bytes): The message to send.
+        """
+        recorded = self._sent[self._send_index] if self._send_index < len(self._sent) else None
+        if recorded is None or recorded.message != msg.decode(Config.DEFAULT_ENCODING):
+            self.divergences += 1
+        self._send_index += 1
+        self._last_send, self._last_send_at = recorded, time.perf_counter()
+
+    def recv_msg(self) -> str:
+        """
+        Return the next recorded reply.
+
+        Returns:
+            str: The reply.
+
+        Raises:
+            RuntimeError: If the recording has no more replies.
+        """
+        if self._recv_index >= len(self._received):
+            raise RuntimeError("The recording ended before the game did")
+        reply = self._received[self._recv_index]
+        self._recv_index += 1
+        if self.realtime and self._last_send is not None:
+            # Wait as long as the server took between the request and this reply
+            delay = reply.time - self._last_send.time - (time.perf_counter() - self._last_send_at)
+            if delay > 0:
+                time.sleep(delay)
+        return reply.message
+
+    def disconnect(self) -> None:
+        """
+        Do nothing; there is no connection to close.
+        """
+
+
+def replay_session(game: Game, events: List[Event], realtime: bool, stats: LoadTestStats) -> int:
+    """
+    Play one recorded session through a solver, recording timings.
+
+    This follows the same steps as load_test.play_game, with the recorded
+    replies standing in for the server.
+
+    Args:
+        game (Game): The solver to use; it is reset before the game starts.
+        events (List[Event]): The recorded events of the session.
+        realtime (bool): Whether replies wait for as long as the server took.
+        stats (LoadTestStats): Collected timings, updated in place.
+
+    Returns:
+        int: Number of sent messages that differ from the recording.
+    """
+    sock = ReplaySocket(events, realtime)
+    hello = next((event for event in events if event.direction == SENT), None)
+    if hello is not None:
+        # Say hello as the recorded user, so only solver and codec changes show up as divergences
+        game.username = json.loads(hello.message).get("northeastern_username", game.username)
+    cpu_start = time.thread_time()
+    game.new_game(sock)
+    game._send_recv_hello_message()
+    stats.network_cpu += time.thread_time() - cpu_start
+
+    guess = game._get_initial_guess()
+    while True:
+        cpu_start, wall_start = time.thread_time(), time.perf_counter()
+        response = game._guess_word(word=guess)
+        stats.round_trips.append(time.perf_counter() - wall_start)
+        stats.network_cpu += time.thread_time() - cpu_start
+        stats.guesses += 1
+
+        if response["type"] in ("bye", "error"):
+            stats.games += 1
+            return sock.divergences
+
+        cpu_start = time.thread_time()
+        guess = game._get_next_guess(response)
+        stats.solver_cpu += time.thread_time() - cpu_start
+
+
+def replay_transcript(path: str, realtime: bool = False, strategy: str = Config.STRATEGY) -> Dict:
+    """
+    Replay every complete session of a transcript with a single reused solver.
+
+    Sessions that were never answered (for example a failed hello) are skipped.
+
+    Args:
+        path (str): The transcript file.
+        realtime (bool): Whether replies wait for as long as the server took.
+        strategy (str): The guess selection strategy.
+
+    Returns:
+        Dict: The summary produced by LoadTestStats.summary, plus the number of
+        sessions and of sent messages that differ from the recording.
+    """
+    stats = LoadTestStats()
+    game = Game(None, "replay", log_level=Config.LOG_LEVEL, strategy=strategy)
+    sessions = [events for events in load_sessions(path).values()
+                if sum(event.direction == RECEIVED for event in events) > 1]
+    divergences = 0
+    start = time.perf_counter()
+    for events in sessions:
+        divergences += replay_session(game, events, realtime, stats)
+    stats.elapsed = time.perf_counter() - start
+    summary = stats.summary()
+    summary.update({"sessions": len(sessions), "divergences": divergences})
+    return summary
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Replay a transcript from the command line.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(description="Replay recorded Wordle sessions through the solver, offline.")
+    parser.add_argument('transcript', help="transcript file recorded with TRANSCRIPT_FILE")
+    parser.add_argument('--realtime', action='store_true',
+                        help="wait for each reply as long as the server took (default: as fast as possible)")
+    parser.add_argument('--strategy', choices=STRATEGIES, default=Config.STRATEGY,
+                        help="guess selection strategy (default: %(default)s)")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    parsed_args = parser.parse_args(args)
+
+    logging.basicConfig(level=logging.WARN)
+    summary = replay_transcript(parsed_args.transcript, parsed_args.realtime, parsed_args.strategy)
+    if parsed_args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_summary(summary))
+        print(f"Sessions: {summary['sessions']}, sent messages differing from the recording: "
+              f"{summary['divergences']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+"""
+Full-dictionary simulation benchmark.
+
+Plays a game against every answer of the dictionary (every word in the word
+list unless Config.ANSWER_LIST is set), sharding the target words across a
+process pool, and writes a JSON report with the guess-count histogram, the
+hardest words, wall time and words/sec. With --tree, all targets are played
+at once by walking the tree of game states instead. With --compare, the run
+fails if it regresses against a previous report.
+
+Usage:
+    python -m src.simulate [--workers N | --tree] [--strategy NAME] [--limit N] [--output report.json]
+                           [--compare baseline.json] [--max-guess-regression F] [--max-time-regression F]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.dictionary import get_dictionary
+from src.game import Game
+from src.patterns import (compute_marks, compute_pattern, compute_pattern_block, decode_pattern, num_patterns,
+                          words_to_array)
+from src.strategy import STRATEGIES
+
+# Number of target words sent to a worker at a time.
+_CHUNK_SIZE = 128
+
+# Largest group of targets whose patterns simulate_tree computes word by word
+# rather than with one NumPy pass (which has a higher fixed cost).
+_SMALL_GROUP_SIZE = 16
+
+# Number of hardest words listed in the report.
+_WORST_WORDS = 20
+
+# The solver used by this worker process, created once by _init_worker.
+_worker_game: Optional[Game] = None
+
+
+def simulate_game(game: Game, target_word: str) -> Optional[int]:
+    """
+    Play one game against a known target word.
+
+    Args:
+        game (Game): The solver; it is reset before the game starts.
+        target_word (str): The word to be guessed.
+
+    Returns:
+        Optional[int]: The number of guesses taken, or None if not guessed within Config.MAX_RETRIES.
+    """
+    game.reset()
+    guesses = []
+    guess = game._get_initial_guess()
+    for _ in range(Config.MAX_RETRIES):
+        guesses.append({"word": guess, "marks": compute_marks(guess, target_word)})
+        if guess == target_word:
+            return len(guesses)
+        guess = game._get_next_guess({"guesses": guesses})
+    return None
+
+
+def simulate_tree(game: Game, targets: Sequence[str]) -> List[Tuple[str, Optional[int]]]:
+    """
+    Play a game against every target at once by walking the tree of game states.
+
+    The solver is deterministic, so targets that received the same marks so
+    far share the rest of their game. Starting from all targets, each state's
+    guess splits its targets by feedback pattern and the solver is asked for
+    the next guess once per pattern, instead of once per target and turn. The
+    guess counts are exactly those simulate_game would produce.
+
+    Args:
+        game (Game): The solver; its state is overwritten.
+        targets (Sequence[str]): The target words.
+
+    Returns:
+        List[Tuple[str, Optional[int]]]: Each target with its guess count (None if not guessed
+        within Config.MAX_RETRIES), in the order of targets.
+    """
+    dictionary = game.dictionary
+    letters = words_to_array(targets, dictionary.alphabet)
+    solved = num_patterns(dictionary.word_length) - 1
+    guess_counts: List[Optional[int]] = [None] * len(targets)
+
+    game.reset()
+    stack = [(1, np.arange(len(targets)), game._snapshot_state(), game._get_initial_guess())]
+    while stack:
+        turn, group, state, guess = stack.pop()
+        if len(group) <= _SMALL_GROUP_SIZE:
+            codes = np.array([compute_pattern(guess, targets[i]) for i in group])
+        else:
+            codes = compute_pattern_block(words_to_array([guess], dictionary.alphabet), letters[group])[0]
+        for code in np.unique(codes):
+            subgroup = group[codes == code]
+            if code == solved:
+                for i in subgroup:
+                    guess_counts[i] = turn
+                continue
+            if turn == Config.MAX_RETRIES:
+                continue
+
+            game._restore_state(state)
+            marks = decode_pattern(int(code), dictionary.word_length)
+            next_guess = game._get_next_guess({"guesses": [{"word": guess, "marks": marks}]})
+            stack.append((turn + 1, subgroup, game._snapshot_state(), next_guess))
+
+    return list(zip(targets, guess_counts))
+
+
+def _init_worker(strategy: str) -> None:
+    """
+    Load the dictionary and build the solver once per worker process.
+
+    Args:
+        strategy (str): The guess selection strategy.
+    """
+    global _worker_game
+    _worker_game = Game(None, "simulation", log_level=logging.WARN, strategy=strategy)
+
+
+def _simulate_chunk(targets: Sequence[str]) -> List[Tuple[str, Optional[int]]]:
+    """
+    Play a game against each target word in a chunk, in a worker process.
+
+    Args:
+        targets (Sequence[str]): The target words.
+
+    Returns:
+        List[Tuple[str, Optional[int]]]: Each word with its guess count (None if failed).
+    """
+    return [(word, simulate_game(_worker_game, word)) for word in targets]
+
+
+def run_simulation(words: Sequence[str], workers: int = 0, strategy: str = Config.STRATEGY,
+                   tree: bool = False) -> Dict:
+    """
+    Simulate a game for every target word and build the report.
+
+    Args:
+        words (Sequence[str]): The target words.
+        workers (int): Number of worker processes (0 uses every CPU); ignored with tree.
+        strategy (str): The guess selection strategy.
+        tree (bool): Play every target at once in this process with simulate_tree.
+
+    Returns:
+        Dict: The report built by build_report.
+    """
+    if tree:
+        game = Game(None, "simulation", log_level=logging.WARN, strategy=strategy)
+        start = time.perf_counter()
+        results = simulate_tree(game, words)
+        elapsed = time.perf_counter() - start
+        workers = 1
+    else:
+        workers = workers or os.cpu_count() or 1
+        chunks = [words[i:i + _CHUNK_SIZE] for i in range(0, len(words), _CHUNK_SIZE)]
+        start = time.perf_counter()
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(strategy,)) as pool:
+            results = [result for chunk in pool.imap_unordered(_simulate_chunk, chunks) for result in chunk]
+        elapsed = time.perf_counter() - start
+
+    report = build_report(results, elapsed)
+    report.update({"strategy": strategy, "workers": workers, "mode": "tree" if tree else "loop"})
+    return report
+
+
+def build_report(results: Sequence[Tuple[str, Optional[int]]], elapsed: float) -> Dict:
+    """
+    Build the machine-readable report of a simulation.
+
+    Args:
+        results (Sequence[Tuple[str, Optional[int]]]): Each target word with its guess count (None if failed).
+        elapsed (float): Wall-clock seconds taken by the simulation.
+
+    Returns:
+        Dict: Totals, average guesses, the guess-count histogram, the worst words, wall time and words/sec.
+    """
+    solved = [(word, guesses) for word, guesses in results if guesses is not None]
+    histogram = Counter(guesses for _, guesses in solved)
+    worst = sorted(solved, key=lambda result: (-result[1], result[0]))[:_WORST_WORDS]
+    return {
+        "total_words": len(results),
+        "solved": len(solved),
+        "failed_words": sorted(word for word, guesses in results if guesses is None),
+        "average_guesses": sum(histogram[n] * n for n in histogram) / len(solved) if solved else 0.0,
+        "histogram": {str(n): histogram[n] for n in sorted(histogram)},
+        "worst_words": [{"word": word, "guesses": guesses} for word, guesses in worst],
+        "wall_time": elapsed,
+        "words_per_sec": len(results) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def compare_reports(report: Dict, baseline: Dict, max_guess_regression: float,
+                    max_time_regression: float) -> List[str]:
+    """
+    Compare a report against a baseline report.
+
+    Args:
+        report (Dict): The new report.
+        baseline (Dict): The baseline report.
+        max_guess_regression (float): Allowed relative increase of the average guess count.
+        max_time_regression (float): Allowed relative increase of the wall time.
+
+    Returns:
+        List[str]: A description of each regression found (empty if none).
+    """
+    regressions = []
+    if report["failed_words"] and not baseline["failed_words"]:
+        regressions.append(f"{len(report['failed_words'])} words failed, baseline had none")
+    if report["average_guesses"] > baseline["average_guesses"] * (1 + max_guess_regression):
+        regressions.append(f"Average guesses {report['average_guesses']:.4f} exceeds baseline "
+                           f"{baseline['average_guesses']:.4f} by more than {max_guess_regression:.1%}")
+    if report["wall_time"] > baseline["wall_time"] * (1 + max_time_regression):
+        regressions.append(f"Wall time {report['wall_time']:.2f}s exceeds baseline "
+                           f"{baseline['wall_time']:.2f}s by more than {max_time_regression:.1%}")
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Run the simulation benchmark from the command line.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(description="Simulate a game for every answer in the dictionary.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--workers', type=int, default=0, help="worker processes (default: one per CPU)")
+    mode.add_argument('--tree', action='store_true',
+                      help="play every target at once by walking the tree of game states, in one process")
+    parser.add_argument('--strategy', choices=STRATEGIES, default=Config.STRATEGY,
+                        help="guess selection strategy (default: %(default)s)")
+    parser.add_argument('--limit', type=int, help="only simulate the first N words")
+    parser.add_argument('--output', help="write the JSON report to this file")
+    parser.add_argument('--compare', metavar='BASELINE', help="fail if the run regresses against this report")
+    parser.add_argument('--max-guess-regression', type=float, default=0.01,
+                        help="allowed relative increase of average guesses (default: %(default)s)")
+    parser.add_argument('--max-time-regression', type=float, default=0.10,
+                        help="allowed relative increase of wall time (default: %(default)s)")
+    parsed_args = parser.parse_args(args)
+
+    words = get_dictionary().answers[:parsed_args.limit]
+    report = run_simulation(words, workers=parsed_args.workers, strategy=parsed_args.strategy, tree=parsed_args.tree)
+
+    if parsed_args.output:
+        with open(parsed_args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    mode = f"{report['mode']} mode"
+    if report['mode'] == 'loop':
+        mode += f", {report['workers']} worker{'s' if report['workers'] != 1 else ''}"
+    print(f"Simulated {report['total_words']} words ({mode}) in {report['wall_time']:.2f}s "
+          f"({report['words_per_sec']:.1f} words/sec)")
+    print(f"Average guesses: {report['average_guesses']:.4f}, failed words: {len(report['failed_words'])}")
+
+    if parsed_args.compare:
+        with open(parsed_args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_reports(report, baseline, parsed_args.max_guess_regression,
+                                      parsed_args.max_time_regression)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,315 @@
+"""
+Solver daemon that keeps solvers warm for clients that play one game per process.
+
+Listens on a Unix domain socket (--socket, or Config.SOLVER_SOCKET) and answers next-guess
+queries (see src.remote_solver for the protocol). The daemon loads each
+dictionary, its index, pattern matrix, opening book and guess cache once, so
+a client run only pays for its own startup and the game's round trips. With
+--benchmark, the client script is timed from launch to its first guess
+reaching a local server, once without the daemon and once with it.
+
+Usage:
+    python -m src.solver_daemon [--socket PATH] [--strategy NAME]
+    python -m src.solver_daemon --benchmark RUNS
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.config import Config
+from src.dictionary import get_dictionary
+from src.game import Game
+from src.local_server import ServerThread, WordleServer, load_answers, load_words
+from src.remote_solver import DICTIONARY_SETTINGS, SOLVER_CONFIG, LocalSolver, solver_settings
+from src.strategy import STRATEGIES
+
+# The client script, launched by the benchmark.
+CLIENT_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'client')
+# Most solvers (one per strategy and solver settings) kept loaded at once.
+MAX_SOLVERS = 4
+
+
+class SolverDaemon:
+    """
+    An asyncio server answering next-guess queries over a Unix domain socket.
+
+    Solvers are created on first use for each strategy and solver settings,
+    with the dictionary the daemon was started with, and shared by every
+    connection; a connection plays one game and only keeps its
+    GameState. Queries are answered one at a time on the event loop thread,
+    since solving is CPU-bound anyway.
+
+    Attributes:
+        path (str): The socket the daemon listens on.
+        strategy (str): The strategy whose solver is loaded when the daemon starts.
+        queries_answered (int): Number of guesses sent to clients so far.
+    """
+
+    def __init__(self, path: Optional[str] = None, strategy: str = Config.STRATEGY):
+        self.path = path or Config.SOLVER_SOCKET
+        if not self.path:
+            raise ValueError("No socket path for the solver daemon (set SOLVER_SOCKET or pass one)")
+        self.strategy = strategy
+        self.queries_answered = 0
+        self._solvers: "OrderedDict[Tuple, Game]" = OrderedDict()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def solver(self, settings: Dict) -> Game:
+        """
+        Get the shared solver for a strategy and solver settings, loading it on first use.
+
+        The daemon only solves with the dictionary it was started with. The
+        other settings are applied to the solver's configuration, so it guesses
+        like the client's own Game would; the MAX_SOLVERS solvers used last are
+        kept loaded.
+
+        Args:
+            settings (Dict): The client's solver settings (see remote_solver.solver_settings); missing
+                entries default to this process's configuration.
+
+        Returns:
+            Game: The solver.
+
+        Raises:
+            ValueError: If the settings are invalid, unknown, or name another dictionary.
+        """
+        own = solver_settings(self.strategy)
+        unknown = set(settings) - set(own) - set(SOLVER_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown solver settings {sorted(unknown)}")
+        for name in DICTIONARY_SETTINGS:
+            if settings.get(name, own[name]) != own[name]:
+                raise ValueError(f"The daemon only solves with its own dictionary ({name} is {own[name]!r})")
+
+        overrides = {}
+        for name, (attribute, kind) in SOLVER_CONFIG.items():
+            value = settings.get(name, getattr(Config, attribute))
+            valid = isinstance(value, kind) or kind is float and isinstance(value, int)
+            if not valid or isinstance(value, bool) and kind is not bool:
+                raise ValueError(f"Invalid solver setting {name}={value!r}")
+            overrides[attribute] = value
+        key = (settings.get("strategy") or self.strategy,) + tuple(overrides.values())
+
+        if key in self._solvers:
+            self._solvers.move_to_end(key)
+            return self._solvers[key]
+        config = type('SolverConfig', (Config,), overrides)
+        solver = Game(None, "solver-daemon", log_level=Config.LOG_LEVEL, strategy=key[0],
+                      dictionary=get_dictionary(), config=config)
+        # Load what a Game loads lazily now, rather than during a client's game
+        for attribute in ('index', 'patterns', 'opening_book', 'guess_cache'):
+            getattr(solver, attribute)
+        solver._get_initial_guess()
+        self._solvers[key] = solver
+        if len(self._solvers) > MAX_SOLVERS:
+            self._solvers.popitem(last=False)
+        return solver
+
+    async def start(self) -> None:
+        """
+        Load the default solver and start listening.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket.
+        """
+        self.solver(solver_settings(self.strategy))
+        _remove_stale_socket(self.path)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle_connection, self.path,
+                                                       limit=Config.MAX_MESSAGE_SIZE)
+
+    async def close(self) -> None:
+        """
+        Stop accepting connections and remove the socket.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def serve_forever(self) -> None:
+        """
+        Start the daemon (if needed) and serve until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Answer the queries of one game.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+        """
+        session: Optional[LocalSolver] = None
+        try:
+            while line := await reader.readline():
+                try:
+                    query = json.loads(line)
+                    if session is None:
+                        session = LocalSolver(self.solver(query.get("settings") or {}))
+                    reply = {"word": session.next_guess(query["guesses"])}
+                    self.queries_answered += 1
+                except (AttributeError, KeyError, TypeError, ValueError, OSError) as e:
+                    reply = {"error": f"Invalid query: {e}"}
+                writer.write((json.dumps(reply) + '\n').encode(Config.DEFAULT_ENCODING))
+                await writer.drain()
+                if "error" in reply:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Remove a socket file left behind by a daemon that is no longer running.
+
+    Args:
+        path (str): The socket path.
+
+    Raises:
+        RuntimeError: If a daemon is still listening on it.
+    """
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A solver daemon is already listening on {path}")
+
+
+class _TimingServer(WordleServer):
+    """
+    A WordleServer that records when the first guess of each game arrives.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.first_guess_times: List[float] = []
+
+    def _handle_message(self, message: Dict, game_id: Optional[str], target: str, guesses: List[Dict]) -> Dict:
+        """
+        Record the arrival of a game's first guess, then reply like WordleServer.
+        """
+        if message.get("type") == "guess" and not guesses:
+            self.first_guess_times.append(time.perf_counter())
+        return super()._handle_message(message, game_id, target, guesses)
+
+
+def _time_client(server: _TimingServer, solver_socket: str) -> Tuple[float, float]:
+    """
+    Run the client script for one game.
+
+    Args:
+        server (_TimingServer): The running server to play against.
+        solver_socket (str): The solver daemon's socket (empty to solve in-process).
+
+    Returns:
+        Tuple[float, float]: Seconds from launch to the first guess reaching the server, and to the end of the game.
+
+    Raises:
+        subprocess.CalledProcessError: If the client fails.
+    """
+    env = dict(os.environ, SOLVER_SOCKET=solver_socket)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, CLIENT_SCRIPT, '-p', str(server.port), server.host, 'benchmark'],
+                   env=env, check=True, capture_output=True, cwd=os.path.dirname(CLIENT_SCRIPT))
+    end = time.perf_counter()
+    return server.first_guess_times[-1] - start, end - start
+
+
+def run_benchmark(runs: int, strategy: str = Config.STRATEGY) -> Dict:
+    """
+    Time client runs that solve in-process (cold) against runs that ask a solver daemon.
+
+    A local server and the daemon run in this process; each mode gets one
+    untimed run first, so neither pays for building cache files.
+
+    Args:
+        runs (int): Timed client runs per mode.
+        strategy (str): The guess selection strategy of the client and the daemon.
+
+    Returns:
+        Dict: For each mode, the median seconds to the first guess and to the end of the game.
+    """
+    report = {"runs": runs, "strategy": strategy}
+    server = _TimingServer(load_words(), answers=load_answers(), seed=0)
+    with tempfile.TemporaryDirectory() as directory, ServerThread(server):
+        path = os.path.join(directory, 'solver.sock')
+        with ServerThread(SolverDaemon(path, strategy)):
+            for mode, solver_socket in (("cold", ''), ("daemon", path)):
+                _time_client(server, solver_socket)
+                times = [_time_client(server, solver_socket) for _ in range(runs)]
+                report[mode] = {
+                    "first_guess": statistics.median(first for first, _ in times),
+                    "game": statistics.median(game for _, game in times),
+                }
+    return report
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Run the solver daemon, or its benchmark, from the command line.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(description="Answer next-guess queries from warm solvers over a Unix socket.")
+    parser.add_argument('--socket', default=Config.SOLVER_SOCKET or None,
+                        help="socket path (default: SOLVER_SOCKET, which clients must also set to use the daemon)")
+    parser.add_argument('--strategy', choices=STRATEGIES, default=Config.STRATEGY,
+                        help="strategy whose solver is loaded at startup (default: %(default)s)")
+    parser.add_argument('--benchmark', type=int, metavar='RUNS',
+                        help="time RUNS client runs with and without a daemon, then exit")
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.benchmark:
+        report = run_benchmark(parsed_args.benchmark, parsed_args.strategy)
+        for mode in ("cold", "daemon"):
+            print(f"{mode:<7} first guess {report[mode]['first_guess'] * 1000:8.1f} ms, "
+                  f"game {report[mode]['game'] * 1000:8.1f} ms (median of {report['runs']} runs)")
+        return
+    if not parsed_args.socket:
+        parser.error("--socket is required when SOLVER_SOCKET is not set")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    daemon = SolverDaemon(parsed_args.socket, parsed_args.strategy)
+
+    async def serve():
+        try:
+            await daemon.start()
+            logging.info("Solver daemon listening on %s", daemon.path)
+            await daemon.serve_forever()
+        finally:
+            await daemon.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
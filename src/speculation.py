@@ -0,0 +1,136 @@
+"""
+Speculative computation of the next guess while a guess is in flight.
+
+After a guess is sent the client would sit idle until the reply arrives. With
+Config.SPECULATIVE_PATTERNS set, Game hands the guess to a background thread
+that works out the follow-up guess for the feedback patterns most likely to
+come back (those shared by the most candidates), most likely first. When the
+reply arrives, a follow-up already computed for its marks is used as is, so
+the solver's time overlaps the round trip.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from src.game_state import GameState
+from src.patterns import compute_pattern_block, decode_pattern, encode_marks, num_patterns, words_to_array
+
+if TYPE_CHECKING:
+    from src.game import Game
+
+# The thread running speculations, shared by every Game in the process.
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def likely_patterns(solver: "Game", guess: str, limit: int) -> List[int]:
+    """
+    Get the feedback patterns a guess is most likely to receive.
+
+    Every candidate is equally likely to be the answer, so a pattern's
+    probability is the share of candidates that would produce it.
+
+    Args:
+        solver (Game): The solver whose candidates the guess is scored against.
+        guess (str): The guess in flight.
+        limit (int): The most patterns to return.
+
+    Returns:
+        List[int]: Pattern codes, most likely first, without the solved pattern.
+    """
+    candidate_ids = solver.possible_ids
+    if solver.patterns is not None and guess in solver.patterns.words:
+        codes = solver.patterns.matrix[solver.patterns.words.word_ids[guess]][candidate_ids]
+    else:
+        guess_letters = words_to_array([guess], solver.dictionary.alphabet)
+        codes = compute_pattern_block(guess_letters, words_to_array(solver.word_list)[candidate_ids])[0]
+    pattern_count = num_patterns(solver.dictionary.word_length)
+    counts = np.bincount(codes, minlength=pattern_count)
+    counts[pattern_count - 1] = 0
+    # Stable sort, so equally likely patterns come in code order
+    order = np.argsort(-counts, kind='stable')[:limit]
+    return [int(code) for code in order if counts[code] > 0]
+
+
+class Speculation:
+    """
+    Follow-up guesses computed in the background for the likely replies to one guess.
+
+    Attributes:
+        base (GameState): The solver state the guess was sent from; follow-ups start from a copy of it.
+        guess (str): The guess in flight.
+        codes (List[int]): The patterns to compute follow-ups for, most likely first.
+        results (Dict[int, Tuple[GameState, str]]): The state after each pattern and its follow-up guess.
+    """
+
+    def __init__(self, base: GameState, guess: str, codes: List[int]):
+        self.base = base
+        self._snapshot = base.copy()
+        self.guess = guess
+        self.codes = codes
+        self.results: Dict[int, Tuple[GameState, str]] = {}
+        self._cancelled = threading.Event()
+        self._in_progress: Optional[int] = None
+        self._future: Optional[Future] = None
+
+    def start(self, speculator: "Game") -> None:
+        """
+        Start computing the follow-ups on the background thread.
+
+        Args:
+            speculator (Game): A solver used only for speculation; its state is overwritten.
+        """
+        global _executor
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='speculation')
+        self._future = _executor.submit(self._run, speculator)
+
+    def _run(self, speculator: "Game") -> None:
+        """
+        Compute the follow-up for each pattern in turn until cancelled.
+
+        Args:
+            speculator (Game): A solver used only for speculation.
+        """
+        for code in self.codes:
+            if self._cancelled.is_set():
+                return
+            self._in_progress = code
+            state = self._snapshot.copy()
+            marks = decode_pattern(code, len(self.guess))
+            guess = speculator.next_guess_for(state, {"guesses": [{"word": self.guess, "marks": marks}]})
+            self.results[code] = (state, guess)
+        self._in_progress = None
+
+    def cancel(self) -> None:
+        """
+        Stop computing follow-ups once the one in progress is done.
+        """
+        self._cancelled.set()
+
+    def result(self, guess: str, marks: List[int]) -> Optional[Tuple[GameState, str]]:
+        """
+        Stop speculating and get the follow-up for the marks that came back, if it was computed.
+
+        If the follow-up for these marks is being computed right now, this
+        waits for it rather than starting over. Since speculating has been
+        cancelled, nothing else is computed after it.
+
+        Args:
+            guess (str): The guess the marks are for.
+            marks (List[int]): The marks received.
+
+        Returns:
+            Optional[Tuple[GameState, str]]: The state after the guess and the next guess, or None.
+        """
+        self.cancel()
+        if guess != self.guess:
+            return None
+        code = encode_marks(marks)
+        if code not in self.results and self._in_progress == code and self._future is not None:
+            wait([self._future])
+        return self.results.get(code)
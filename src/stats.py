@@ -0,0 +1,338 @@
+"""
+Lightweight timers and counters for the client's hot paths.
+
+Instrumentation is disabled by default: timer() then returns a shared no-op
+context manager and observe()/increment() return after one check, so the
+instrumented code pays almost nothing. Call enable() (the client does so for
+--stats or Config.STATS) to record per-phase latency histograms, value
+histograms and counters, and dump_at_exit() to write them as JSON or in the
+Prometheus text exposition format when the process exits.
+"""
+
+import atexit
+import bisect
+import json
+import sys
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+JSON = 'json'
+PROMETHEUS = 'prometheus'
+FORMATS = (JSON, PROMETHEUS)
+
+# Prefix of every metric name in the Prometheus output.
+METRIC_PREFIX = 'wordle_'
+
+# Upper bounds (seconds) of the latency buckets: 1us to 10s in 1-2.5-5 steps.
+TIME_BUCKETS = tuple(float(f"{m}e{e}") for e in range(-6, 1) for m in (1, 2.5, 5)) + (10.0,)
+
+# Upper bounds of the buckets for counts such as the number of remaining candidates.
+COUNT_BUCKETS = tuple(float(2 ** i) for i in range(15))
+
+
+class Histogram:
+    """
+    A fixed-bucket histogram of observed values.
+
+    Attributes:
+        bounds (Sequence[float]): Inclusive upper bound of each bucket; values above the last go to +Inf.
+        counts (List[int]): Number of observations in each bucket (not cumulative), plus the +Inf bucket.
+        count (int): Number of observations.
+        sum (float): Sum of the observed values.
+        min (Optional[float]): Smallest observed value.
+        max (Optional[float]): Largest observed value.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """
+        Record one value.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> Dict:
+        """
+        Summarize the histogram for the JSON report.
+
+        Returns:
+            Dict: Count, sum, mean, min, max and the cumulative count per bucket upper bound.
+        """
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.bounds + (float('inf'),), self.counts):
+            cumulative += count
+            buckets[_format_bound(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "min": self.min,
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+
+class Registry:
+    """
+    The recorded histograms and counters of one process.
+
+    Updates from several threads (the async client's solver thread and the
+    load test's game threads) are serialized by a lock.
+
+    Attributes:
+        histograms (Dict[str, Histogram]): Histograms by metric name.
+        counters (Dict[str, int]): Counters by metric name.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, bounds: Sequence[float] = COUNT_BUCKETS) -> None:
+        """
+        Record a value in a histogram, creating it on first use.
+
+        Args:
+            name (str): The metric name.
+            value (float): The observed value.
+            bounds (Sequence[float]): Bucket upper bounds used if the histogram is new.
+        """
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(bounds)
+            histogram.observe(value)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """
+        Add to a counter, creating it on first use.
+
+        Args:
+            name (str): The metric name.
+            amount (int): The amount to add.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self) -> Dict:
+        """
+        Build the JSON report of every metric.
+
+        Returns:
+            Dict: The counters and the histogram summaries, by metric name.
+        """
+        with self._lock:
+            return {
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {name: self.histograms[name].to_dict() for name in sorted(self.histograms)},
+            }
+
+    def format_json(self) -> str:
+        """
+        Format every metric as JSON.
+
+        Returns:
+            str: The JSON report.
+        """
+        return json.dumps(self.to_dict(), indent=2)
+
+    def format_prometheus(self) -> str:
+        """
+        Format every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: One counter per '<name>_total' sample and one histogram per
+            '<name>_bucket'/'_sum'/'_count' family.
+        """
+        lines = []
+        report = self.to_dict()
+        for name, value in report["counters"].items():
+            metric = METRIC_PREFIX + name
+            lines += [f"# TYPE {metric}_total counter", f"{metric}_total {value}"]
+        for name, histogram in report["histograms"].items():
+            metric = METRIC_PREFIX + name
+            lines.append(f"# TYPE {metric} histogram")
+            lines += [f'{metric}_bucket{{le="{le}"}} {count}' for le, count in histogram["buckets"].items()]
+            lines += [f"{metric}_sum {histogram['sum']!r}", f"{metric}_count {histogram['count']}"]
+        return '\n'.join(lines) + '\n'
+
+
+class _Timer:
+    """
+    A context manager that records the time spent in its block in a latency histogram.
+    """
+
+    __slots__ = ('_registry', '_name', '_start')
+
+    def __init__(self, registry: Registry, name: str):
+        self._registry = registry
+        self._name = name
+
+    def __enter__(self) -> '_Timer':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._registry.observe(self._name, time.perf_counter() - self._start, TIME_BUCKETS)
+
+
+class _NullTimer:
+    """
+    The context manager returned by timer() while instrumentation is disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+# The active registry, or None while instrumentation is disabled.
+_registry: Optional[Registry] = None
+
+
+def enable() -> Registry:
+    """
+    Start recording metrics in this process, keeping anything already recorded.
+
+    Returns:
+        Registry: The active registry.
+    """
+    global _registry
+    if _registry is None:
+        _registry = Registry()
+    return _registry
+
+
+def disable() -> None:
+    """
+    Stop recording metrics and discard what was recorded.
+    """
+    global _registry
+    _registry = None
+
+
+def registry() -> Optional[Registry]:
+    """
+    Get the active registry.
+
+    Returns:
+        Optional[Registry]: The registry, or None while instrumentation is disabled.
+    """
+    return _registry
+
+
+def timer(phase: str):
+    """
+    Time a block of code as one occurrence of a phase.
+
+    The duration is recorded in the '<phase>_seconds' histogram.
+
+    Args:
+        phase (str): The phase name, e.g. 'filter'.
+
+    Returns:
+        A context manager (a shared no-op one while instrumentation is disabled).
+    """
+    if _registry is None:
+        return _NULL_TIMER
+    return _Timer(_registry, phase + '_seconds')
+
+
+def observe(name: str, value: float, bounds: Sequence[float] = COUNT_BUCKETS) -> None:
+    """
+    Record a value in a histogram, if instrumentation is enabled.
+
+    Args:
+        name (str): The metric name, e.g. 'candidates_remaining'.
+        value (float): The observed value.
+        bounds (Sequence[float]): Bucket upper bounds used if the histogram is new.
+    """
+    if _registry is not None:
+        _registry.observe(name, value, bounds)
+
+
+def increment(name: str, amount: int = 1) -> None:
+    """
+    Add to a counter, if instrumentation is enabled.
+
+    Args:
+        name (str): The metric name, e.g. 'bytes_sent'.
+        amount (int): The amount to add.
+    """
+    if _registry is not None:
+        _registry.increment(name, amount)
+
+
+def dump(fmt: str = JSON, path: Optional[str] = None) -> None:
+    """
+    Write the recorded metrics.
+
+    Args:
+        fmt (str): 'json' or 'prometheus'.
+        path (Optional[str]): The file to write, or None for stderr.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown stats format '{fmt}', expected one of {FORMATS}")
+    active = _registry or Registry()
+    text = active.format_json() + '\n' if fmt == JSON else active.format_prometheus()
+    if path:
+        with open(path, 'w') as f:
+            f.write(text)
+    else:
+        sys.stderr.write(text)
+
+
+def dump_at_exit(fmt: str = JSON, path: Optional[str] = None) -> None:
+    """
+    Enable instrumentation and write the metrics when the process exits.
+
+    Args:
+        fmt (str): 'json' or 'prometheus'.
+        path (Optional[str]): The file to write, or None for stderr.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown stats format '{fmt}', expected one of {FORMATS}")
+    enable()
+    atexit.register(dump, fmt, path)
+
+
+def _format_bound(bound: float) -> str:
+    """
+    Format a bucket upper bound as a Prometheus 'le' label value.
+
+    Args:
+        bound (float): The bound.
+
+    Returns:
+        str: E.g. '0.0025', '2.5e-06', '16' or '+Inf'.
+    """
+    if bound == float('inf'):
+        return '+Inf'
+    return f"{bound:g}"
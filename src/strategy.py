@@ -0,0 +1,226 @@
+import time
+from collections import Counter
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.patterns import NUM_PATTERNS, PatternMatrix, compute_pattern_block, num_patterns, words_to_array
+from src.strategy_names import ENTROPY, FREQUENCY, RANKED, STRATEGIES
+from src.word_index import WordIndex
+
+# Scores the ranked strategy can rerank its shortlist with.
+ENTROPY_SCORE = 'entropy'
+EXPECTED_REMAINING = 'expected_remaining'
+RERANK_SCORERS = (ENTROPY_SCORE, EXPECTED_REMAINING)
+
+# Number of guesses whose pattern histograms are computed in one NumPy pass.
+_ENTROPY_BATCH_SIZE = 1024
+
+# Number of shortlisted guesses reranked between two deadline checks.
+_RERANK_BATCH_SIZE = 16
+
+
+def choose_frequency_guess(possible_words: Iterable[str]) -> str:
+    """
+    Choose the word whose unique letters are most frequent among the possible words.
+
+    Args:
+        possible_words (Iterable[str]): The words that are still possible solutions.
+
+    Returns:
+        str: The best word to guess next.
+    """
+    possible_words = list(possible_words)
+    letter_freq = Counter(letter for word in possible_words for letter in set(word))
+    return max(possible_words, key=lambda word: sum(letter_freq[letter] for letter in set(word)))
+
+
+def pattern_histograms(codes: np.ndarray, pattern_count: int = NUM_PATTERNS) -> np.ndarray:
+    """
+    Count how many candidates fall into each feedback pattern, for each guess.
+
+    Args:
+        codes (np.ndarray): A (G, M) array of pattern codes of G guesses against M candidates.
+        pattern_count (int): The number of pattern codes (see patterns.num_patterns).
+
+    Returns:
+        np.ndarray: A (G, pattern_count) array of candidate counts.
+    """
+    # Offset each row into its own block of bins so one bincount covers the whole batch
+    offsets = np.arange(len(codes), dtype=np.intp)[:, None] * pattern_count
+    counts = np.bincount((codes + offsets).ravel(), minlength=len(codes) * pattern_count)
+    return counts.reshape(len(codes), pattern_count)
+
+
+def expected_information(histograms: np.ndarray, total: int) -> np.ndarray:
+    """
+    Compute the expected information gain (entropy in bits) of each histogram row.
+
+    Uses H = log2(n) - sum(c * log2(c)) / n, with c * log2(c) taken from a lookup table.
+
+    Args:
+        histograms (np.ndarray): Candidate counts per feedback pattern, one row per guess.
+        total (int): The number of candidates (the sum of every row).
+
+    Returns:
+        np.ndarray: The entropy of each row's pattern distribution.
+    """
+    counts = np.arange(total + 1, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c_log_c = np.where(counts > 0, counts * np.log2(counts), 0.0)
+    return np.log2(total) - c_log_c[histograms].sum(axis=1) / total
+
+
+def choose_entropy_guess(patterns: PatternMatrix, candidate_ids: np.ndarray,
+                         guess_ids: Optional[np.ndarray] = None) -> str:
+    """
+    Choose the guess with the highest expected information gain over the candidates.
+
+    The candidate columns are gathered once and guesses are then scored in
+    batches; ties are broken in favour of guesses that are themselves
+    candidates, since those can end the game immediately.
+
+    Args:
+        patterns (PatternMatrix): The precomputed pattern matrix.
+        candidate_ids (np.ndarray): Word IDs of the remaining candidates.
+        guess_ids (Optional[np.ndarray]): Word IDs allowed as guesses (defaults to the candidates).
+
+    Returns:
+        str: The best word to guess next.
+    """
+    if guess_ids is None:
+        guess_ids = candidate_ids
+
+    scores = entropy_scores(patterns.matrix[:, candidate_ids], guess_ids, candidate_ids,
+                            pattern_count=patterns.num_patterns)
+    return patterns.words[guess_ids[int(np.argmax(scores))]]
+
+
+def entropy_scores(columns: np.ndarray, rows: np.ndarray, candidate_ids: np.ndarray,
+                   guess_ids: Optional[np.ndarray] = None, pattern_count: int = NUM_PATTERNS) -> np.ndarray:
+    """
+    Score guesses by expected information gain, in batches.
+
+    Args:
+        columns (np.ndarray): Pattern codes of the guesses (rows) against the candidates (columns).
+        rows (np.ndarray): The rows of columns holding the guesses to score.
+        candidate_ids (np.ndarray): Word IDs of the remaining candidates.
+        guess_ids (Optional[np.ndarray]): Word IDs of the scored guesses (defaults to rows).
+        pattern_count (int): The number of pattern codes (see patterns.num_patterns).
+
+    Returns:
+        np.ndarray: The score of each guess, with a small bonus for guesses that are candidates.
+    """
+    scores = np.empty(len(rows))
+    for start in range(0, len(rows), _ENTROPY_BATCH_SIZE):
+        batch = rows[start:start + _ENTROPY_BATCH_SIZE]
+        histograms = pattern_histograms(columns[batch].astype(np.intp), pattern_count)
+        scores[start:start + len(batch)] = expected_information(histograms, len(candidate_ids))
+
+    is_candidate = np.isin(rows if guess_ids is None else guess_ids, candidate_ids)
+    # A guess that might be the answer wins ties (and near-ties) against one that cannot be
+    scores += is_candidate * 1e-6
+    return scores
+
+
+def expected_remaining(histograms: np.ndarray, total: int) -> np.ndarray:
+    """
+    Compute the expected number of candidates left after each guess.
+
+    A candidate lands in a bucket of c candidates with probability c / n and
+    leaves c of them, so the expectation is sum(c ** 2) / n; the solved bucket
+    (the last pattern) leaves none.
+
+    Args:
+        histograms (np.ndarray): Candidate counts per feedback pattern, one row per guess.
+        total (int): The number of candidates (the sum of every row).
+
+    Returns:
+        np.ndarray: The expected number of remaining candidates for each row.
+    """
+    squares = (histograms.astype(np.float64) ** 2).sum(axis=1)
+    return (squares - histograms[:, -1]) / total
+
+
+def frequency_scores(index: WordIndex, candidate_mask: np.ndarray, guess_ids: np.ndarray) -> np.ndarray:
+    """
+    Score guesses by the letter-frequency heuristic of choose_frequency_guess, vectorized.
+
+    Args:
+        index (WordIndex): The index of the dictionary.
+        candidate_mask (np.ndarray): Bitset of the remaining candidates.
+        guess_ids (np.ndarray): Word IDs of the guesses to score.
+
+    Returns:
+        np.ndarray: For each guess, the number of candidates containing each of its distinct letters, summed.
+    """
+    letter_freq = index.contains[:, candidate_mask].sum(axis=1)
+    return letter_freq @ index.contains[:, guess_ids]
+
+
+def choose_ranked_guess(index: WordIndex, candidate_mask: np.ndarray, guess_ids: Optional[np.ndarray] = None,
+                        shortlist_size: int = 100, deadline: Optional[float] = None,
+                        scorer: str = ENTROPY_SCORE, patterns: Optional[PatternMatrix] = None) -> str:
+    """
+    Choose a guess in two stages: shortlist by letter frequency, then rerank the shortlist.
+
+    The top shortlist_size guesses, and the top shortlist_size candidates, by
+    letter-frequency score are scored with the expensive scorer over every
+    remaining candidate, in frequency order and a few guesses at a time. Once
+    the deadline has passed, the best guess scored so far is returned (at
+    least one batch is always scored). As in choose_entropy_guess, a guess that
+    is itself a candidate wins ties.
+
+    Args:
+        index (WordIndex): The index of the dictionary.
+        candidate_mask (np.ndarray): Bitset of the remaining candidates.
+        guess_ids (Optional[np.ndarray]): Word IDs allowed as guesses (defaults to the candidates).
+        shortlist_size (int): Number of guesses kept by the first stage.
+        deadline (Optional[float]): time.perf_counter() value to stop reranking at (None for no limit).
+        scorer (str): 'entropy' (expected information) or 'expected_remaining' (expected candidates left).
+        patterns (Optional[PatternMatrix]): Precomputed pattern matrix; patterns are computed
+            on the fly for the shortlist if not given.
+
+    Returns:
+        str: The best word to guess next.
+
+    Raises:
+        ValueError: If the scorer is unknown.
+    """
+    if scorer not in RERANK_SCORERS:
+        raise ValueError(f"Unknown rerank scorer '{scorer}', expected one of {RERANK_SCORERS}")
+    candidate_ids = np.flatnonzero(candidate_mask)
+    if guess_ids is None:
+        guess_ids = candidate_ids
+
+    # Stage 1: cheap shortlist, best frequency score first (ties in word ID order)
+    scores = frequency_scores(index, candidate_mask, guess_ids)
+    shortlist = guess_ids[np.argsort(-scores, kind='stable')[:shortlist_size]]
+    candidate_scores = frequency_scores(index, candidate_mask, candidate_ids)
+    top_candidates = candidate_ids[np.argsort(-candidate_scores, kind='stable')[:shortlist_size]]
+    shortlist = np.concatenate([shortlist, top_candidates[~np.isin(top_candidates, shortlist)]])
+
+    # Stage 2: rerank with the expensive scorer until the deadline
+    letters = words_to_array(index.words)
+    pattern_count = num_patterns(letters.shape[1])
+    answers = letters[candidate_ids]
+    best_id, best_score = None, -np.inf
+    for start in range(0, len(shortlist), _RERANK_BATCH_SIZE):
+        if deadline is not None and start > 0 and time.perf_counter() >= deadline:
+            break
+        batch = shortlist[start:start + _RERANK_BATCH_SIZE]
+        if patterns is not None:
+            # Only the batch's rows are gathered, not the candidate columns of every guess
+            codes = patterns.matrix[np.ix_(batch, candidate_ids)]
+        else:
+            codes = compute_pattern_block(letters[batch], answers)
+        histograms = pattern_histograms(codes.astype(np.intp), pattern_count)
+        if scorer == ENTROPY_SCORE:
+            batch_scores = expected_information(histograms, len(candidate_ids))
+        else:
+            batch_scores = -expected_remaining(histograms, len(candidate_ids))
+        batch_scores = batch_scores + candidate_mask[batch] * 1e-6
+        i = int(np.argmax(batch_scores))
+        if batch_scores[i] > best_score:
+            best_id, best_score = batch[i], batch_scores[i]
+    return index.words[int(best_id)]
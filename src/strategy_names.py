@@ -0,0 +1,11 @@
+"""
+Names of the guess selection strategies.
+
+They live apart from src.strategy so that code which only parses options
+(such as the client talking to a solver daemon) does not import NumPy.
+"""
+
+FREQUENCY = 'frequency'
+ENTROPY = 'entropy'
+RANKED = 'ranked'
+STRATEGIES = (FREQUENCY, ENTROPY, RANKED)
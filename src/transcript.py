@@ -0,0 +1,170 @@
+"""
+Recording of client traffic.
+
+With Config.TRANSCRIPT_FILE set, every MySocket connection appends what it
+sends and receives to a JSON-lines transcript. Each line is one compact array
+[session, seconds, direction, message]:
+- session is an ID shared by the events of one connection.
+- seconds is the time since the connection was opened.
+- direction is 'o' (opened, the message is "host:port"), 's' (sent), 'r'
+  (received) or 'c' (closed).
+
+Lines are only ever appended, so several clients can record into one file.
+Transcripts are played back offline by src.replay.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Dict, List, NamedTuple, Optional
+
+from src.config import Config
+
+OPENED = 'o'
+SENT = 's'
+RECEIVED = 'r'
+CLOSED = 'c'
+
+# Recorders already opened in this process, keyed by file path.
+_recorders: Dict[str, "TranscriptRecorder"] = {}
+_recorders_lock = threading.Lock()
+
+
+class Event(NamedTuple):
+    """
+    One recorded event of a session.
+
+    Attributes:
+        time (float): Seconds since the session was opened.
+        direction (str): OPENED, SENT, RECEIVED or CLOSED.
+        message (str): The message sent or received (the address for OPENED, empty for CLOSED).
+    """
+    time: float
+    direction: str
+    message: str
+
+
+class TranscriptRecorder:
+    """
+    Appends the events of many sessions to one transcript file.
+
+    Each event is written as a single line with one write call on a file opened
+    for appending, under a lock, so lines from different threads (or processes
+    appending to the same file) never interleave.
+
+    Attributes:
+        path (str): The transcript file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8', buffering=1)
+        self._lock = threading.Lock()
+
+    def start_session(self, address: str) -> "SessionRecorder":
+        """
+        Start recording a new session.
+
+        Args:
+            address (str): The "host:port" the session is connected to.
+
+        Returns:
+            SessionRecorder: The recorder for the session's events.
+        """
+        session = SessionRecorder(self, uuid.uuid4().hex[:12])
+        session.record(OPENED, address)
+        return session
+
+    def write(self, session_id: str, elapsed: float, direction: str, message: str) -> None:
+        """
+        Append one event.
+
+        Args:
+            session_id (str): The session the event belongs to.
+            elapsed (float): Seconds since the session was opened.
+            direction (str): OPENED, SENT, RECEIVED or CLOSED.
+            message (str): The event's message.
+        """
+        line = json.dumps([session_id, round(elapsed, 6), direction, message], separators=(',', ':')) + '\n'
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        """
+        Close the transcript file.
+        """
+        with self._lock:
+            self._file.close()
+
+
+class SessionRecorder:
+    """
+    Records the events of one connection, timestamped from when it was opened.
+
+    Attributes:
+        session_id (str): The session's ID in the transcript.
+    """
+
+    def __init__(self, recorder: TranscriptRecorder, session_id: str):
+        self.session_id = session_id
+        self._recorder = recorder
+        self._start = time.perf_counter()
+
+    def record(self, direction: str, message: str = '') -> None:
+        """
+        Record one event.
+
+        Args:
+            direction (str): OPENED, SENT, RECEIVED or CLOSED.
+            message (str): The event's message.
+        """
+        self._recorder.write(self.session_id, time.perf_counter() - self._start, direction, message)
+
+
+def get_recorder(path: Optional[str] = None) -> Optional[TranscriptRecorder]:
+    """
+    Get the shared recorder for a transcript file, opening it on first use.
+
+    Args:
+        path (Optional[str]): The transcript file (defaults to Config.TRANSCRIPT_FILE).
+
+    Returns:
+        Optional[TranscriptRecorder]: The recorder, or None if recording is disabled.
+    """
+    path = path or Config.TRANSCRIPT_FILE
+    if not path:
+        return None
+    with _recorders_lock:
+        if path not in _recorders:
+            _recorders[path] = TranscriptRecorder(path)
+        return _recorders[path]
+
+
+def load_sessions(path: str) -> Dict[str, List[Event]]:
+    """
+    Read a transcript, grouping its events by session.
+
+    Args:
+        path (str): The transcript file.
+
+    Returns:
+        Dict[str, List[Event]]: The events of each session, in recorded order; sessions
+        appear in the order they were opened.
+
+    Raises:
+        ValueError: If a line is not a valid event.
+    """
+    sessions: Dict[str, List[Event]] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                session_id, elapsed, direction, message = json.loads(line)
+            except ValueError:
+                raise ValueError(f"Invalid transcript line {line_number} in {path}")
+            sessions.setdefault(session_id, []).append(Event(float(elapsed), direction, message))
+    return sessions
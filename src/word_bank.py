@@ -0,0 +1,386 @@
+"""
+Shared, load-once dictionary backed by a packed binary word file.
+
+The binary format is a fixed header followed by one fixed-width ASCII record
+per word, so it can be memory-mapped and split without parsing lines. Text
+word lists are converted once and the binary copy is cached under
+Config.CACHE_DIR. Words are made of the letters of an alphabet (by default
+the lowercase ASCII letters), which numbers them for the letter arrays.
+
+Usage:
+    python -m src.word_bank <word_list.txt> <output.bin>
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.config import Config
+
+MAGIC = b'WBNK'
+FORMAT_VERSION = 1
+
+DEFAULT_ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+# magic, format version, word length, word count, SHA-256 of the word list
+_HEADER = struct.Struct('<4sBBI32s')
+
+# Word banks already loaded in this process, keyed by file path and alphabet.
+_loaded_banks: Dict[Tuple[str, str], "WordBank"] = {}
+
+# Byte -> letter index lookup tables, keyed by alphabet.
+_letter_tables: Dict[str, np.ndarray] = {}
+
+
+def word_list_hash(words: Sequence[str]) -> str:
+    """
+    Compute a content hash of a word list, used to key on-disk caches.
+
+    Word banks (and dictionaries) carry their hash, which also covers a
+    non-default alphabet; a plain list is hashed as a default-alphabet one.
+
+    Args:
+        words (Sequence[str]): The words, in dictionary order.
+
+    Returns:
+        str: Hex-encoded SHA-256 digest of the word list.
+    """
+    content_hash = getattr(words, 'content_hash', None)
+    if content_hash is not None:
+        return content_hash
+    return hashlib.sha256('\n'.join(words).encode(Config.DEFAULT_ENCODING)).hexdigest()
+
+
+def alphabet_hash(content_hash: str, alphabet: str) -> str:
+    """
+    Combine a word list hash with the alphabet its letters are numbered by.
+
+    Args:
+        content_hash (str): Hex SHA-256 of the word list.
+        alphabet (str): The alphabet.
+
+    Returns:
+        str: The word list hash itself for the default alphabet, else a hash of both.
+    """
+    if alphabet == DEFAULT_ALPHABET:
+        return content_hash
+    return hashlib.sha256(f"{alphabet}:{content_hash}".encode(Config.DEFAULT_ENCODING)).hexdigest()
+
+
+def letter_indices(raw: np.ndarray, alphabet: str = DEFAULT_ALPHABET) -> np.ndarray:
+    """
+    Number the letters of encoded words by their position in an alphabet.
+
+    Args:
+        raw (np.ndarray): uint8 array of ASCII letters.
+        alphabet (str): The alphabet.
+
+    Returns:
+        np.ndarray: A uint8 array of the same shape with each letter's index in the alphabet.
+
+    Raises:
+        ValueError: If a letter is not in the alphabet.
+    """
+    if alphabet not in _letter_tables:
+        table = np.full(256, 255, dtype=np.uint8)
+        table[np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)] = np.arange(len(alphabet))
+        _letter_tables[alphabet] = table
+    indices = _letter_tables[alphabet][raw]
+    if indices.size and indices.max() == 255:
+        raise ValueError(f"Word list has letters outside the alphabet {alphabet!r}")
+    return indices
+
+
+class WordBank(Sequence[str]):
+    """
+    An immutable dictionary of fixed-length words.
+
+    A WordBank behaves like a read-only sequence of words indexed by word ID,
+    and adds the word -> ID mapping, a content hash and the packed letters.
+    Word strings and the ID mapping are only decoded from the packed records
+    when first needed. Load it with get_word_bank so every Game in a process
+    shares one instance.
+
+    Attributes:
+        word_length (int): The number of letters in every word.
+        alphabet (str): The letters words are made of, in letter index order.
+        content_hash (str): Hex SHA-256 of the word list and alphabet (see word_list_hash).
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap], word_length: int, content_hash: str, offset: int = 0,
+                 count: Optional[int] = None, alphabet: str = DEFAULT_ALPHABET):
+        self.word_length = word_length
+        self.alphabet = alphabet
+        self.content_hash = alphabet_hash(content_hash, alphabet)
+        self._data = data
+        self._offset = offset
+        self._count = (len(data) - offset) // word_length if count is None else count
+        self._words: Optional[Tuple[str, ...]] = None
+        self._ids: Optional[Dict[str, int]] = None
+        self._letters: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if self._words is None and not isinstance(index, slice):
+            index = range(self._count)[index]
+            start = self._offset + index * self.word_length
+            return self._data[start:start + self.word_length].decode(Config.DEFAULT_ENCODING)
+        return self.words[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.word_ids
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """
+        Get every word, in ID order.
+
+        Returns:
+            Tuple[str, ...]: The words.
+        """
+        if self._words is None:
+            end = self._offset + self._count * self.word_length
+            chars = iter(bytes(self._data[self._offset:end]).decode(Config.DEFAULT_ENCODING))
+            self._words = tuple(map(''.join, zip(*[chars] * self.word_length)))
+        return self._words
+
+    def id_of(self, word: str) -> int:
+        """
+        Get the ID of a word.
+
+        Args:
+            word (str): A word in the bank.
+
+        Returns:
+            int: The word's ID.
+
+        Raises:
+            KeyError: If the word is not in the bank.
+        """
+        return self.word_ids[word]
+
+    @property
+    def word_ids(self) -> Dict[str, int]:
+        """
+        Get the mapping from word to ID (must not be modified).
+
+        Returns:
+            Dict[str, int]: The word -> ID mapping.
+        """
+        if self._ids is None:
+            self._ids = dict(zip(self.words, range(self._count)))
+        return self._ids
+
+    @property
+    def letters(self) -> np.ndarray:
+        """
+        Get the words as an (N, word_length) array of letter indices in the alphabet.
+
+        Returns:
+            np.ndarray: A read-only uint8 array.
+
+        Raises:
+            ValueError: If a word has a letter outside the alphabet.
+        """
+        if self._letters is None:
+            raw = np.frombuffer(self._data, dtype=np.uint8, count=self._count * self.word_length,
+                                offset=self._offset)
+            self._letters = letter_indices(raw, self.alphabet).reshape(self._count, self.word_length)
+            self._letters.flags.writeable = False
+        return self._letters
+
+    @classmethod
+    def from_words(cls, words: Sequence[str], alphabet: str = DEFAULT_ALPHABET) -> "WordBank":
+        """
+        Build a word bank in memory from a list of words.
+
+        Args:
+            words (Sequence[str]): The words, all of the same length.
+            alphabet (str): The letters words are made of.
+
+        Returns:
+            WordBank: The word bank.
+        """
+        words = _validate(words, alphabet)
+        data = ''.join(words).encode(Config.DEFAULT_ENCODING)
+        return cls(data, len(words[0]), word_list_hash(words), alphabet=alphabet)
+
+    @classmethod
+    def open(cls, path: str, alphabet: str = DEFAULT_ALPHABET) -> "WordBank":
+        """
+        Memory-map a packed binary word file.
+
+        Args:
+            path (str): The binary word file.
+            alphabet (str): The letters words are made of.
+
+        Returns:
+            WordBank: The word bank.
+
+        Raises:
+            ValueError: If the file is not a word bank of a supported version.
+        """
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is not a word bank file")
+        magic, version, word_length, count, digest = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} word bank file")
+        if len(data) != _HEADER.size + count * word_length:
+            raise ValueError(f"{path} is truncated")
+        return cls(data, word_length, digest.hex(), offset=_HEADER.size, count=count, alphabet=alphabet)
+
+
+def validate_alphabet(alphabet: str) -> str:
+    """
+    Check that an alphabet is made of distinct ASCII letters.
+
+    Args:
+        alphabet (str): The alphabet to check.
+
+    Returns:
+        str: The alphabet.
+
+    Raises:
+        ValueError: If the alphabet is empty, has repeated or non-ASCII letters, or is too long to index in a byte.
+    """
+    if (not alphabet or len(alphabet) > 255 or len(set(alphabet)) != len(alphabet)
+            or not all(letter.isascii() and letter.isprintable() and not letter.isspace() for letter in alphabet)):
+        raise ValueError(f"Invalid alphabet: {alphabet!r}")
+    return alphabet
+
+
+def _validate(words: Sequence[str], alphabet: str = DEFAULT_ALPHABET) -> List[str]:
+    """
+    Check that a word list is non-empty and made of words of one length over an alphabet.
+
+    Args:
+        words (Sequence[str]): The words to check.
+        alphabet (str): The letters words may be made of.
+
+    Returns:
+        List[str]: The words as a list.
+
+    Raises:
+        ValueError: If the words are empty, of different lengths or have letters outside the alphabet.
+    """
+    words = list(words)
+    if not words:
+        raise ValueError("Word list is empty")
+    letters = set(validate_alphabet(alphabet))
+    for word in words:
+        if len(word) != len(words[0]) or not word or not letters.issuperset(word):
+            raise ValueError(f"Invalid word in word list: {word!r}")
+    return words
+
+
+def write_word_bank(words: Sequence[str], path: str, alphabet: str = DEFAULT_ALPHABET) -> None:
+    """
+    Write words to a packed binary word file, replacing it atomically.
+
+    The file does not record the alphabet: the same file can be opened with
+    any alphabet its letters belong to.
+
+    Args:
+        words (Sequence[str]): The words, all of the same length.
+        path (str): The file to write.
+        alphabet (str): The letters words may be made of.
+    """
+    words = _validate(words, alphabet)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(words[0]), len(words), bytes.fromhex(word_list_hash(words)))
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(''.join(words).encode(Config.DEFAULT_ENCODING))
+    os.replace(tmp_path, path)
+
+
+def read_text_word_list(path: str) -> List[str]:
+    """
+    Read a text word list with one word per line.
+
+    Args:
+        path (str): The text file.
+
+    Returns:
+        List[str]: The words, with surrounding whitespace removed and blank lines skipped.
+    """
+    with open(path, 'r') as f:
+        return [word.strip() for word in f if word.strip()]
+
+
+def binary_cache_path(path: str, cache_dir: str = None) -> str:
+    """
+    Get the path of the binary copy of a text word list.
+
+    The name is derived from the text file's path, size and modification time,
+    so the binary copy is rebuilt whenever the text file changes.
+
+    Args:
+        path (str): The text word list.
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        str: Path of the binary word file.
+    """
+    stat = os.stat(path)
+    key = hashlib.sha256(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()
+    return os.path.join(cache_dir or Config.CACHE_DIR, f"words-{key[:16]}.bin")
+
+
+def get_word_bank(path: str = None, alphabet: str = None) -> WordBank:
+    """
+    Get the shared word bank for a word list file, loading it on first use in this process.
+
+    Binary word files (.bin) are memory-mapped directly. Text word lists are
+    converted to a cached binary copy the first time, and that copy is
+    memory-mapped on later runs.
+
+    Args:
+        path (str): The word list file (defaults to Config.WORD_LIST).
+        alphabet (str): The letters words are made of (defaults to Config.ALPHABET).
+
+    Returns:
+        WordBank: The word bank.
+    """
+    path = path or Config.WORD_LIST
+    alphabet = alphabet or Config.ALPHABET
+    if (path, alphabet) not in _loaded_banks:
+        binary_path = path
+        if not path.endswith('.bin'):
+            binary_path = binary_cache_path(path)
+            if not os.path.exists(binary_path):
+                write_word_bank(read_text_word_list(path), binary_path, alphabet)
+        _loaded_banks[(path, alphabet)] = WordBank.open(binary_path, alphabet)
+    return _loaded_banks[(path, alphabet)]
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Convert a text word list to a packed binary word file.
+
+    Args:
+        args (Optional[List[str]]): Command-line arguments (defaults to sys.argv[1:]).
+    """
+    args = sys.argv[1:] if args is None else args
+    if len(args) != 2:
+        sys.exit("Usage: python -m src.word_bank <word_list.txt> <output.bin>")
+    words = read_text_word_list(args[0])
+    write_word_bank(words, args[1])
+    print(f"Wrote {len(words)} words to {args[1]}")
+
+
+if __name__ == '__main__':
+    main()
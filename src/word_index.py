@@ -0,0 +1,287 @@
+import os
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.patterns import words_to_array
+from src.word_bank import DEFAULT_ALPHABET, WordBank, word_list_hash
+
+# The alphabet of the default dictionary; an index uses its word bank's alphabet.
+ALPHABET = DEFAULT_ALPHABET
+
+# Version of the on-disk index layout, part of the cache file name.
+INDEX_VERSION = 1
+
+# Indexes already loaded in this process, keyed by the word list hash.
+_built_indexes: Dict[str, "WordIndex"] = {}
+
+
+class WordIndex:
+    """
+    An inverted index from letters to the words that contain them.
+
+    Word sets are represented as NumPy bool arrays indexed by word ID, so
+    constraint filtering is a handful of bitwise ANDs instead of per-word
+    string checks. The index is immutable and shared by every Game that uses
+    the same dictionary. An index can also wrap the bitset table of one built
+    earlier for the same words (see get_word_index). Below, words have L
+    letters from an alphabet of K letters.
+
+    Attributes:
+        words (WordBank): The dictionary, in word ID order.
+        alphabet (str): The dictionary's alphabet.
+        position_letter (np.ndarray): (L, K, N) bitsets of words with a letter at a position.
+        count_at_least (np.ndarray): (K, L + 2, N) bitsets of words with at least k copies
+            of a letter (row k); row 0 is every word and row L + 1 is empty.
+        contains (np.ndarray): (K, N) bitsets of words containing a letter anywhere.
+    """
+
+    def __init__(self, words: Sequence[str], bitsets: Optional[np.ndarray] = None):
+        self.words = words if isinstance(words, WordBank) else WordBank.from_words(words)
+        self.alphabet = self.words.alphabet
+        self._letter_index: Dict[str, int] = {letter: i for i, letter in enumerate(self.alphabet)}
+        word_length, letter_count, word_count = self.words.word_length, len(self.alphabet), len(self.words)
+        # Both tables are views of one array, so any mix of their rows can be gathered at once
+        position_rows = word_length * letter_count
+        self._count_rows = word_length + 2
+        shape = (position_rows + letter_count * self._count_rows, word_count)
+        if bitsets is None:
+            bitsets = np.zeros(shape, dtype=bool)
+            self._build(bitsets, position_rows)
+        elif bitsets.shape != shape:
+            raise ValueError(f"Word index table has shape {bitsets.shape}, expected {shape}")
+        self._bitsets = bitsets
+        self.position_letter = bitsets[:position_rows].reshape(word_length, letter_count, word_count)
+        self.count_at_least = bitsets[position_rows:].reshape(letter_count, self._count_rows, word_count)
+        self.contains = self.count_at_least[:, 1]
+
+    def _build(self, bitsets: np.ndarray, position_rows: int) -> None:
+        """
+        Fill the bitset table from the dictionary's letters.
+
+        Args:
+            bitsets (np.ndarray): The zeroed table.
+            position_rows (int): The number of rows of position_letter.
+        """
+        letters = words_to_array(self.words)
+        word_length, word_count = letters.shape[1], len(self.words)
+        position_letter = bitsets[:position_rows].reshape(word_length, len(self.alphabet), word_count)
+        for i in range(word_length):
+            position_letter[i, letters[:, i], np.arange(word_count)] = True
+        counts = position_letter.sum(axis=0)
+        count_at_least = bitsets[position_rows:].reshape(len(self.alphabet), self._count_rows, word_count)
+        count_at_least[...] = counts[:, np.newaxis, :] >= np.arange(self._count_rows)[:, np.newaxis]
+
+    @property
+    def bitsets(self) -> np.ndarray:
+        """
+        Get the table every bitset of the index is a row of, as saved in the on-disk cache.
+
+        Returns:
+            np.ndarray: The (L * K + K * (L + 2), N) bool table (must not be modified).
+        """
+        return self._bitsets
+
+    def all_words(self) -> np.ndarray:
+        """
+        Get a bitset containing every word in the dictionary.
+
+        Returns:
+            np.ndarray: A new bool array with every entry set.
+        """
+        return np.ones(len(self.words), dtype=bool)
+
+    def filter(self, mask: np.ndarray, must_contain: Iterable[str], position_constraints: List[set],
+               min_counts: Optional[Mapping[str, int]] = None,
+               max_counts: Optional[Mapping[str, int]] = None) -> np.ndarray:
+        """
+        Keep the words that contain the required letters and satisfy the position and count constraints.
+
+        Args:
+            mask (np.ndarray): Bitset of the current candidates.
+            must_contain (Iterable[str]): Letters that must appear in the word.
+            position_constraints (List[set]): Allowed letters for each position.
+            min_counts (Optional[Mapping[str, int]]): Least number of copies of each letter.
+            max_counts (Optional[Mapping[str, int]]): Most number of copies of each letter.
+
+        Returns:
+            np.ndarray: A new bitset of the remaining candidates.
+        """
+        mask = mask.copy()
+        for letter in must_contain:
+            mask &= self.contains[self._letter_index[letter]]
+        for letter, count in (min_counts or {}).items():
+            mask &= self.count_at_least[self._letter_index[letter], count]
+        for letter, count in (max_counts or {}).items():
+            mask &= ~self.count_at_least[self._letter_index[letter], count + 1]
+        for i, constraint in enumerate(position_constraints):
+            if len(constraint) == len(self.alphabet):
+                continue
+            # Every word has exactly one letter per position, so excluding the
+            # disallowed letters is equivalent to requiring an allowed one.
+            excluded = [j for j, letter in enumerate(self.alphabet) if letter not in constraint]
+            if len(excluded) <= len(constraint):
+                mask &= ~self.position_letter[i, excluded].any(axis=0)
+            else:
+                allowed = [self._letter_index[letter] for letter in constraint]
+                mask &= self.position_letter[i, allowed].any(axis=0)
+        return mask
+
+    def filter_feedback(self, mask: np.ndarray, guess: str, marks: Sequence[int]) -> np.ndarray:
+        """
+        Keep the words that would have produced the observed marks for a guess.
+
+        Only this one observation is applied, so the cost does not grow with the
+        number of guesses made. A 2 requires the letter at its position and any
+        other mark forbids it there; the number of 1s and 2s of a letter is a
+        minimum count, and an exact count if the letter also got a 0.
+
+        Args:
+            mask (np.ndarray): Bitset of the current candidates.
+            guess (str): The guessed word.
+            marks (Sequence[int]): The marks received for the guess.
+
+        Returns:
+            np.ndarray: A new bitset of the remaining candidates.
+        """
+        mask = mask.copy()
+        rows, required = self._feedback_rows(guess, marks)
+        for row, row_required in zip(rows, required):
+            if row_required:
+                mask &= self._bitsets[row]
+            else:
+                mask &= ~self._bitsets[row]
+        return mask
+
+    def filter_feedback_ids(self, candidate_ids: np.ndarray, guess: str, marks: Sequence[int]) -> np.ndarray:
+        """
+        Keep the candidates that would have produced the observed marks for a guess, like filter_feedback.
+
+        Only the candidates' bits are read (in one gather), so the cost follows
+        the number of candidates rather than the size of the dictionary.
+
+        Args:
+            candidate_ids (np.ndarray): Sorted word IDs of the current candidates.
+            guess (str): The guessed word.
+            marks (Sequence[int]): The marks received for the guess.
+
+        Returns:
+            np.ndarray: Sorted word IDs of the remaining candidates.
+        """
+        rows, required = self._feedback_rows(guess, marks)
+        bits = self._bitsets[np.array(rows)[:, np.newaxis], candidate_ids]
+        return candidate_ids[(bits == np.array(required)[:, np.newaxis]).all(axis=0)]
+
+    def _feedback_rows(self, guess: str, marks: Sequence[int]) -> Tuple[List[int], List[bool]]:
+        """
+        Get the bitsets the candidates must (or must not) be in to match the marks for a guess.
+
+        Args:
+            guess (str): The guessed word.
+            marks (Sequence[int]): The marks received for the guess.
+
+        Returns:
+            Tuple[List[int], List[bool]]: Rows of the bitset table, and whether candidates must be
+            in each row (or outside it).
+        """
+        rows = []
+        required = []
+        found: Dict[int, int] = {}
+        absent = set()
+        letter_count = len(self.alphabet)
+        for i, (letter, mark) in enumerate(zip(guess, marks)):
+            j = self._letter_index[letter]
+            rows.append(i * letter_count + j)
+            required.append(mark == 2)
+            if mark == 0:
+                absent.add(j)
+            else:
+                found[j] = found.get(j, 0) + 1
+        count_rows = len(guess) * letter_count
+        for j, count in found.items():
+            rows.append(count_rows + j * self._count_rows + count)
+            required.append(True)
+        for j in absent:
+            rows.append(count_rows + j * self._count_rows + found.get(j, 0) + 1)
+            required.append(False)
+        return rows, required
+
+    def words_of(self, mask: np.ndarray) -> List[str]:
+        """
+        Look up the words in a bitset.
+
+        Args:
+            mask (np.ndarray): Bitset of word IDs.
+
+        Returns:
+            List[str]: The words whose bits are set, in word ID order.
+        """
+        return [self.words[i] for i in np.flatnonzero(mask)]
+
+    def mask_of(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Build a bitset from a collection of words.
+
+        Args:
+            words (Iterable[str]): Words in the dictionary.
+
+        Returns:
+            np.ndarray: A bitset with the bits of the given words set.
+        """
+        mask = np.zeros(len(self.words), dtype=bool)
+        mask[[self.words.word_ids[word] for word in words]] = True
+        return mask
+
+
+def word_index_path(words: Sequence[str], cache_dir: str = None) -> str:
+    """
+    Get the cache file path for the index of a word list.
+
+    Args:
+        words (Sequence[str]): The dictionary.
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        str: Path of the .npy file keyed by the word list hash.
+    """
+    cache_dir = cache_dir or Config.CACHE_DIR
+    return os.path.join(cache_dir, f"index-v{INDEX_VERSION}-{word_list_hash(words)[:16]}.npy")
+
+
+def get_word_index(words: Sequence[str], cache_dir: str = None) -> WordIndex:
+    """
+    Get the shared index for a word list, building and caching it on first use.
+
+    Like the pattern matrix, the bitset table is memory-mapped from a cache
+    file keyed by the word list hash (which covers the alphabet), so each
+    dictionary's index is built once and then shared by later runs.
+
+    Args:
+        words (Sequence[str]): The dictionary.
+        cache_dir (str): Directory holding cache files (defaults to Config.CACHE_DIR).
+
+    Returns:
+        WordIndex: The index for the word list.
+
+    Raises:
+        ValueError: If the cached table does not have the shape of the word list's index.
+    """
+    key = word_list_hash(words)
+    if key in _built_indexes:
+        return _built_indexes[key]
+
+    path = word_index_path(words, cache_dir)
+    if not os.path.exists(path):
+        index = WordIndex(words)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, index.bitsets)
+        os.replace(tmp_path, path)
+    else:
+        # A plain array over the mapped file, so filtering does not go through np.memmap
+        index = WordIndex(words, np.asarray(np.load(path, mmap_mode='r')))
+
+    _built_indexes[key] = index
+    return index
@@ -1,5 +1,6 @@
 import unittest
-from src.arg_parser import parse_args
+from unittest import mock
+from src.arg_parser import parse_args, parse_options
 from src.config import Config
 
 
@@ -66,6 +67,59 @@ class TestArgParser(unittest.TestCase):
         self.assertEqual(args[0], 'example.com')
         self.assertEqual(args[2], 'john.doe')
 
+    def test_strategy_option(self):
+        """
+        Test if the guess strategy defaults to Config and can be set with --strategy.
+
+        This test checks that parse_options exposes the strategy and rejects unknown ones.
+        """
+        self.assertEqual(parse_options(['hostname', 'username']).strategy, Config.STRATEGY)
+        self.assertEqual(parse_options(['--strategy', 'entropy', 'hostname', 'username']).strategy, 'entropy')
+        with self.assertRaises(SystemExit):
+            parse_options(['--strategy', 'random', 'hostname', 'username'])
+
+    def test_games_and_concurrency(self):
+        """
+        Test if --games and --concurrency are parsed and validated.
+
+        This test checks the defaults for single-game mode and that non-positive values are rejected.
+        """
+        options = parse_options(['hostname', 'username'])
+        self.assertIsNone(options.games)
+        self.assertEqual(options.concurrency, 1)
+
+        options = parse_options(['--games', '100', '--concurrency', '8', 'hostname', 'username'])
+        self.assertEqual((options.games, options.concurrency), (100, 8))
+        with self.assertRaises(SystemExit):
+            parse_options(['--games', '0', 'hostname', 'username'])
+
+    def test_stats_option(self):
+        """
+        Test if --stats and --stats-file are parsed and validated.
+
+        This test checks that stats are off by default, that only known formats
+        are accepted and that --stats-file needs --stats.
+        """
+        self.assertIsNone(parse_options(['hostname', 'username']).stats)
+        options = parse_options(['--stats', 'prometheus', '--stats-file', 'out.prom', 'hostname', 'username'])
+        self.assertEqual((options.stats, options.stats_file), ('prometheus', 'out.prom'))
+        with self.assertRaises(SystemExit):
+            parse_options(['--stats', 'xml', 'hostname', 'username'])
+        with self.assertRaises(SystemExit):
+            parse_options(['--stats-file', 'out.json', 'hostname', 'username'])
+
+    def test_stats_file_from_environment(self):
+        """
+        Test that a STATS_FILE setting alone does not make the client's arguments invalid.
+
+        This test checks that only a --stats-file passed on the command line
+        requires --stats; the client falls back to Config.STATS_FILE itself.
+        """
+        with mock.patch.object(Config, 'STATS_FILE', 'env.json'):
+            options = parse_options(['hostname', 'username'])
+        self.assertIsNone(options.stats)
+        self.assertIsNone(options.stats_file)
+
 
 if __name__ == '__main__':
     unittest.main()
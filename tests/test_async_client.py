@@ -0,0 +1,96 @@
+import asyncio
+import json
+import logging
+import unittest
+
+from src.async_client import MultiGameClient, percentile, summarize
+from src.patterns import compute_marks
+
+
+class TestAsyncClient(unittest.TestCase):
+    """
+    A test suite for the asyncio multi-game driver.
+
+    This class runs the driver against a minimal in-process server that speaks
+    the hello/guess/retry/bye protocol, one target word per connection.
+    """
+
+    TARGETS = ["crane", "hello", "geese", "tiara", "zonal", "eerie"]
+
+    async def play_against_server(self, games, concurrency):
+        """
+        Start a throwaway server and play games against it.
+
+        Returns:
+            tuple: The game results and the list of connections the server saw.
+        """
+        connections = []
+
+        async def handle(reader, writer):
+            target = self.TARGETS[len(connections) % len(self.TARGETS)]
+            connections.append(target)
+            guesses = []
+            while line := await reader.readline():
+                message = json.loads(line)
+                if message["type"] == "hello":
+                    reply = {"type": "start", "id": f"game-{len(connections)}"}
+                elif message["word"] == target:
+                    reply = {"type": "bye", "id": message["id"], "flag": f"flag-{target}"}
+                else:
+                    guesses.append({"word": message["word"], "marks": compute_marks(message["word"], target)})
+                    reply = {"type": "retry", "id": message["id"], "guesses": guesses}
+                writer.write((json.dumps(reply) + '\n').encode())
+                await writer.drain()
+                if reply["type"] == "bye":
+                    break
+            writer.close()
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            client = MultiGameClient('127.0.0.1', port, "test_user", concurrency=concurrency)
+            results = await client.run(games)
+        return results, connections
+
+    def test_plays_all_games_concurrently(self):
+        """
+        Test that every game finishes with the flag the server sent on its connection.
+        """
+        logging.getLogger('App').setLevel(logging.WARN)
+        results, connections = asyncio.run(self.play_against_server(games=12, concurrency=3))
+
+        self.assertEqual(len(results), 12)
+        self.assertTrue(all(result.error is None for result in results), results)
+        self.assertEqual(sorted(result.flag for result in results), sorted(f"flag-{target}" for target in connections))
+
+    def test_connection_failure_is_reported(self):
+        """
+        Test that a refused connection is reported as a failed game instead of raising.
+        """
+        async def play():
+            server = await asyncio.start_server(lambda r, w: None, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            return await MultiGameClient('127.0.0.1', port, "test_user").run(1)
+
+        results = asyncio.run(play())
+        self.assertEqual(len(results), 1)
+        self.assertIsNotNone(results[0].error)
+
+    def test_summary(self):
+        """
+        Test the throughput and latency percentiles computed by summarize.
+        """
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 50), 2.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 99), 4.0)
+
+        results, _ = asyncio.run(self.play_against_server(games=4, concurrency=2))
+        summary = summarize(results, elapsed=2.0)
+        self.assertEqual(summary["succeeded"], 4)
+        self.assertEqual(summary["games_per_sec"], 2.0)
+        self.assertLessEqual(summary["latency"]["p50"], summary["latency"]["p99"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src import dictionary, patterns, word_bank, word_index
+from src.config import Config
+from src.dictionary import get_dictionary
+from src.game import Game
+from src.patterns import compute_marks
+from src.word_index import WordIndex, get_word_index, word_index_path
+
+
+class TestDictionary(unittest.TestCase):
+    """
+    A test suite for playing with dictionaries other than the default one.
+
+    This class checks that a dictionary of six-letter words over a reduced
+    alphabet, with a separate answer list, is solved like the default one, and
+    that its word index is cached on disk under its content hash.
+    """
+
+    ALPHABET = "adeilnorst"
+    WORDS = ["listen", "silent", "enlist", "tinsel", "inlets", "rental", "antler", "learnt", "ratios", "sailor",
+             "stolen", "stored", "strode", "sorted", "rested", "desert", "salted", "lasted", "slated", "dental",
+             "loaned", "soiled", "toiled", "trials", "trails", "radios"]
+    ANSWERS = ["silent", "rental", "sailor", "stored", "desert", "slated", "loaned", "trails"]
+
+    def setUp(self):
+        """Use an empty cache directory for each test, and compute every guess rather than look it up."""
+        self.cache_dir = tempfile.TemporaryDirectory()
+        for name, value in [('CACHE_DIR', self.cache_dir.name), ('ALPHABET', self.ALPHABET),
+                            ('USE_OPENING_BOOK', False)]:
+            patcher = mock.patch.object(Config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+        for cache in (dictionary._loaded_dictionaries, word_bank._loaded_banks, word_index._built_indexes,
+                      patterns._loaded_matrices):
+            self.addCleanup(cache.clear)
+        self.word_list = self.write_text(self.WORDS, 'words.txt')
+        self.answer_list = self.write_text(self.ANSWERS, 'answers.txt')
+
+    def write_text(self, words, name):
+        """
+        Write a text word list into the cache directory.
+
+        Returns:
+            str: The path of the text file.
+        """
+        path = os.path.join(self.cache_dir.name, name)
+        with open(path, 'w') as f:
+            f.write(''.join(f"{word}\n" for word in words))
+        return path
+
+    def test_answers_are_a_subset(self):
+        """
+        Test that answer IDs point at the answers and that the answers change the content hash.
+        """
+        answers = get_dictionary(self.word_list, self.answer_list)
+        every_word = get_dictionary(self.word_list)
+
+        self.assertEqual(answers.word_length, 6)
+        self.assertEqual(answers.alphabet, self.ALPHABET)
+        self.assertEqual(sorted(answers.words[i] for i in answers.answer_ids), sorted(self.ANSWERS))
+        self.assertEqual(int(answers.answer_mask().sum()), len(self.ANSWERS))
+        self.assertIsNone(every_word.answer_ids)
+        self.assertTrue(every_word.answer_mask().all())
+        self.assertNotEqual(answers.content_hash, every_word.content_hash)
+        self.assertIs(get_dictionary(self.word_list, self.answer_list), answers)
+
+    def test_invalid_answers(self):
+        """
+        Test that answers that are not allowed guesses, or of another length, are rejected.
+        """
+        for name, answers in [('unknown.txt', ["silent", "tirade"]), ('short.txt', ["stole"])]:
+            with self.assertRaises(ValueError):
+                get_dictionary(self.word_list, self.write_text(answers, name))
+
+    def test_letters_outside_alphabet(self):
+        """
+        Test that a word list with letters outside the alphabet is rejected.
+        """
+        with self.assertRaises(ValueError):
+            get_dictionary(self.write_text(self.WORDS + ["quartz"], 'other.txt'))
+
+    def test_game_solves_every_answer(self):
+        """
+        Test that a game over the dictionary only guesses allowed words and solves every answer.
+        """
+        game = Game(None, "test_user", log_level=logging.WARN,
+                    dictionary=get_dictionary(self.word_list, self.answer_list))
+        self.assertEqual(sorted(game.possible_words), sorted(self.ANSWERS))
+        initial = game._get_initial_guess()
+        self.assertIn(initial, self.WORDS)
+
+        for target in self.ANSWERS:
+            game.reset()
+            guesses = []
+            guess = initial
+            while guess != target:
+                self.assertIn(guess, self.WORDS)
+                self.assertLess(len(guesses), 6)
+                guesses.append({"word": guess, "marks": compute_marks(guess, target)})
+                guess = game._get_next_guess({"guesses": guesses})
+
+    def test_index_cached_on_disk(self):
+        """
+        Test that the word index is saved once and later memory-mapped instead of rebuilt.
+        """
+        words = get_dictionary(self.word_list).words
+        built = get_word_index(words)
+        path = word_index_path(words)
+        self.assertTrue(os.path.exists(path))
+        modified = os.path.getmtime(path)
+
+        word_index._built_indexes.clear()
+        with mock.patch.object(WordIndex, '_build', side_effect=AssertionError("index was rebuilt")):
+            loaded = get_word_index(words)
+
+        self.assertIsNot(loaded, built)
+        self.assertTrue(np.array_equal(loaded.bitsets, built.bitsets))
+        self.assertEqual(os.path.getmtime(path), modified)
+        marks = compute_marks("listen", "silent")
+        self.assertTrue(np.array_equal(loaded.filter_feedback(loaded.all_words(), "listen", marks),
+                                       built.filter_feedback(built.all_words(), "listen", marks)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import logging
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.game import Game
+from src.patterns import compute_marks
+
+
+class TestGameSession(unittest.TestCase):
+    """
+    A test suite for reusing Game instances across games.
+
+    This class checks that constructing many games does not pile up log
+    handlers, that disabled log levels skip their formatting work, and that
+    new_game starts a clean game with the loaded data reused.
+    """
+
+    def test_logger_handler_added_once(self):
+        """
+        Test that creating many games keeps a single file handler on the shared logger.
+        """
+        Game(None, "test_user", log_level=logging.WARN)
+        handlers = list(logging.getLogger('App').handlers)
+        for _ in range(20):
+            Game(None, "test_user", log_level=logging.WARN)
+        self.assertEqual(logging.getLogger('App').handlers, handlers)
+
+    def test_debug_work_skipped_when_disabled(self):
+        """
+        Test that the removed-words debug message is only built when DEBUG is enabled.
+        """
+        self.addCleanup(logging.getLogger('App').setLevel, logging.WARN)
+        marks = compute_marks("salet", "crane")
+        for level, expected in ((logging.WARN, False), (logging.DEBUG, True)):
+            game = Game(None, "test_user", log_level=level)
+            with mock.patch('src.game.np.setdiff1d', wraps=np.setdiff1d) as setdiff1d:
+                game._update_constraints("salet", marks)
+                game._filter_possible_words("salet", marks)
+            self.assertEqual(setdiff1d.called, expected)
+
+    def test_new_game_reuses_loaded_data(self):
+        """
+        Test that new_game clears the previous game's state but keeps the dictionary and index.
+        """
+        game = Game(None, "test_user", log_level=logging.WARN)
+        word_list, index = game.word_list, game.index
+        game.game_id = "previous"
+        game._get_next_guess({"guesses": [{"word": "salet", "marks": compute_marks("salet", "crane")}]})
+        self.assertLess(len(game.possible_words), len(word_list))
+
+        sock = object()
+        game.new_game(sock)
+        self.assertIs(game.sock, sock)
+        self.assertEqual(game.game_id, "")
+        self.assertEqual(len(game.possible_words), len(word_list))
+        self.assertEqual(game.must_contain, set())
+        self.assertIs(game.word_list, word_list)
+        self.assertIs(game.index, index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import logging
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from src.game import Game
+from src.game_state import GameState, letters_of
+from src.patterns import compute_marks
+
+
+class TestGameState(unittest.TestCase):
+    """
+    A test suite for the compact per-game solver state.
+
+    This class checks the letter bitmasks and count tables, the switch between
+    the candidate representations, and how much memory a live game takes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one solver shared by every game in the tests."""
+        cls.solver = Game(None, "test_user", log_level=logging.WARN)
+        cls.word_count = len(cls.solver.word_list)
+
+    def test_apply_feedback(self):
+        """
+        Test that marks update the position masks, required letters and letter counts.
+        """
+        state = GameState()
+        state.apply_feedback("geese", compute_marks("geese", "crepe"))  # [0, 0, 2, 0, 2]
+
+        self.assertEqual(letters_of(state.must_contain), {'e'})
+        self.assertEqual(letters_of(state.positions[2]), {'e'})
+        self.assertEqual(letters_of(state.positions[4]), {'e'})
+        self.assertNotIn('g', letters_of(state.positions[0]))
+        self.assertNotIn('s', letters_of(state.positions[3]))
+        self.assertIn('e', letters_of(state.positions[0]))
+        self.assertEqual(state.min_count_map(), {'e': 2})
+        self.assertEqual(state.max_count_map(), {'g': 0, 'e': 2, 's': 0})
+
+    def test_candidate_representations(self):
+        """
+        Test that candidates switch from a packed bitset to word IDs as they shrink, with the same words.
+        """
+        state = GameState()
+        self.assertEqual(state.count(self.word_count), self.word_count)
+        self.assertTrue(state.mask(self.word_count).all())
+
+        rng = np.random.default_rng(0)
+        for size, sparse in ((self.word_count // 2, False), (self.word_count // 100, True)):
+            mask = np.zeros(self.word_count, dtype=bool)
+            mask[rng.choice(self.word_count, size, replace=False)] = True
+            state.set_mask(mask)
+            self.assertEqual(state.ids is not None, sparse)
+            self.assertEqual(state.bitset is None, sparse)
+            self.assertEqual(state.count(self.word_count), size)
+            np.testing.assert_array_equal(state.mask(self.word_count), mask)
+            np.testing.assert_array_equal(state.candidate_ids(self.word_count), np.flatnonzero(mask))
+
+    def test_shared_solver_matches_own_game(self):
+        """
+        Test that games interleaved on one solver guess exactly as games with a Game of their own.
+        """
+        targets = ["crane", "geese", "eerie", "lemon"]
+        states = {target: GameState() for target in targets}
+        guesses = {target: [] for target in targets}
+        next_guess = {target: "salet" for target in targets}
+        for _ in range(3):
+            for target in targets:
+                guess = next_guess[target]
+                guesses[target].append({"word": guess, "marks": compute_marks(guess, target)})
+                next_guess[target] = self.solver.next_guess_for(states[target], {"guesses": guesses[target]})
+
+        for target in targets:
+            game = Game(None, "test_user", log_level=logging.WARN)
+            for turn in range(3):
+                guess = game._get_next_guess({"guesses": guesses[target][:turn + 1]})
+            self.assertEqual(guess, next_guess[target])
+
+    def test_memory_per_game(self):
+        """
+        Test that a live game's state stays within a few KB after its first guess.
+        """
+        words = self.solver.word_list
+        targets = [words[i] for i in range(0, len(words), len(words) // 1000)]
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            states = []
+            for target in targets:
+                state = GameState()
+                marks = compute_marks("salet", target)
+                self.solver.next_guess_for(state, {"guesses": [{"word": "salet", "marks": marks}]})
+                states.append(state)
+            per_game = (tracemalloc.get_traced_memory()[0] - before) / len(states)
+        finally:
+            tracemalloc.stop()
+        self.assertLess(per_game, 3 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
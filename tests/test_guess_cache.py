@@ -0,0 +1,101 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src import guess_cache
+from src.config import Config
+from src.game import Game
+from src.guess_cache import GuessCache, candidate_fingerprint, get_guess_cache, guess_cache_path
+from src.patterns import compute_marks
+
+
+class TestGuessCache(unittest.TestCase):
+    """
+    A test suite for the memoized candidate-set -> best-guess cache.
+
+    This class checks the LRU bookkeeping, that cached guesses equal the
+    guesses the solver computes, and that the cache survives a save and load.
+    """
+
+    def setUp(self):
+        """Use an empty cache directory and no shared caches for each test."""
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(Config, 'CACHE_DIR', self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+        self.addCleanup(guess_cache._guess_caches.clear)
+        guess_cache._guess_caches.clear()
+
+    def test_lru_eviction_and_counters(self):
+        """
+        Test that the least recently used entry is evicted and every lookup is counted.
+        """
+        cache = GuessCache(max_entries=2)
+        cache.put(b'a', "crane")
+        cache.put(b'b', "salet")
+        self.assertEqual(cache.get(b'a'), "crane")
+        cache.put(b'c', "geese")
+
+        self.assertIsNone(cache.get(b'b'))
+        self.assertEqual(cache.get(b'c'), "geese")
+        self.assertEqual(cache.counters(), {"entries": 2, "hits": 2, "misses": 1, "evictions": 1})
+
+    def test_fingerprint_is_canonical(self):
+        """
+        Test that equal candidate sets have equal fingerprints and different sets do not.
+        """
+        mask = np.zeros(100, dtype=bool)
+        mask[[3, 50, 99]] = True
+        self.assertEqual(candidate_fingerprint(mask), candidate_fingerprint(mask.copy()))
+        mask[4] = True
+        self.assertNotEqual(candidate_fingerprint(mask), candidate_fingerprint(mask[::-1]))
+
+    def test_game_reuses_cached_guess(self):
+        """
+        Test that a second game reaching the same state is answered from the cache with the same guess.
+        """
+        guesses = [{"word": "crane", "marks": compute_marks("crane", "hello")}]
+        with mock.patch.object(Config, 'USE_OPENING_BOOK', False):
+            first = Game(None, "test_user", log_level=logging.WARN)
+            guess = first._get_next_guess({"guesses": guesses})
+            second = Game(None, "test_user", log_level=logging.WARN)
+            with mock.patch.object(second, '_choose_best_guess') as choose:
+                self.assertEqual(second._get_next_guess({"guesses": guesses}), guess)
+                choose.assert_not_called()
+        self.assertIs(first.guess_cache, second.guess_cache)
+        self.assertEqual(first.guess_cache.counters()["hits"], 1)
+
+    def test_disabled_cache(self):
+        """
+        Test that a cache size of 0 disables the cache.
+        """
+        with mock.patch.object(Config, 'GUESS_CACHE_SIZE', 0):
+            self.assertIsNone(Game(None, "test_user", log_level=logging.WARN).guess_cache)
+
+    def test_persisted_cache_round_trip(self):
+        """
+        Test that a saved cache is reloaded for the same solver and rejected for another.
+        """
+        solver = {"strategy": "frequency"}
+        with mock.patch.object(Config, 'PERSIST_GUESS_CACHE', True), mock.patch('atexit.register') as register:
+            cache = get_guess_cache(["crane", "hello"], solver)
+            cache.put(b'\x01' * 16, "crane")
+            save, *args = register.call_args[0]
+            save(*args)
+            self.assertTrue(os.path.exists(guess_cache_path(["crane", "hello"], solver)))
+
+            guess_cache._guess_caches.clear()
+            self.assertEqual(get_guess_cache(["crane", "hello"], solver).get(b'\x01' * 16), "crane")
+
+        path = guess_cache_path(["crane", "hello"], solver)
+        with self.assertRaises(ValueError):
+            GuessCache(10).load(path, {"strategy": "entropy"}, "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import contextlib
+import io
+import shutil
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+from src.config import Config
+from src.game import Game
+from src.load_test import run_load_test
+from src.local_server import (ServerThread, WordleServer, generate_self_signed_cert, load_words,
+                              make_server_ssl_context)
+from src.my_socket import MySocket
+
+
+class TestLocalServer(unittest.TestCase):
+    """
+    A test suite for the local Wordle server and the end-to-end load test.
+
+    This class plays real games through MySocket and Game against the server
+    running in a background thread.
+    """
+
+    def test_game_over_plain_socket(self):
+        """
+        Test that Game.start_game wins against the local server and prints the flag.
+        """
+        server = WordleServer(load_words(), answers=["crane"])
+        with ServerThread(server):
+            sock = MySocket()
+            sock.connect(host=server.host, port=server.port)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                Game(sock, "test_user").start_game()
+
+        self.assertEqual(len(output.getvalue().strip()), 64)
+        self.assertEqual(server.games_played, 1)
+
+    def test_invalid_guess_is_rejected(self):
+        """
+        Test that a word outside the dictionary gets an error and the connection is closed.
+        """
+        server = WordleServer(load_words())
+        with ServerThread(server):
+            with socket.create_connection((server.host, server.port)) as conn:
+                conn.sendall(b'{"type": "hello", "northeastern_username": "test_user"}\n')
+                reader = conn.makefile('rb')
+                reader.readline()
+                conn.sendall(b'{"type": "guess", "id": "wrong", "word": "salet"}\n')
+                self.assertIn(b'"error"', reader.readline())
+                self.assertEqual(reader.readline(), b'')
+
+    @unittest.skipIf(shutil.which('openssl') is None, "openssl is not available")
+    def test_game_over_tls(self):
+        """
+        Test full games over TLS using a freshly generated self-signed certificate, resuming the TLS session.
+        """
+        with tempfile.TemporaryDirectory() as cert_dir:
+            certfile, keyfile = generate_self_signed_cert(cert_dir)
+            server = WordleServer(load_words(), ssl_context=make_server_ssl_context(certfile, keyfile))
+            with ServerThread(server), mock.patch.object(Config, 'TLS_CA_FILE', certfile), \
+                    mock.patch('src.stats.increment') as increment:
+                for _ in range(2):
+                    sock = MySocket()
+                    sock.connect(host=server.host, port=server.port, use_tls=True)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        Game(sock, "test_user").start_game()
+
+        # The second connection resumed the first one's TLS session
+        increment.assert_any_call("tls_sessions_reused")
+
+        self.assertEqual(server.games_played, 2)
+
+    def test_load_test_summary(self):
+        """
+        Test that the load test plays the requested games and reports latency and CPU split.
+        """
+        summary = run_load_test(20, seed=0)
+        self.assertEqual(summary["games"], 20)
+        self.assertGreaterEqual(summary["guesses"], 20)
+        self.assertLessEqual(summary["round_trip_ms"]["p50"], summary["round_trip_ms"]["p99"])
+        self.assertGreater(summary["cpu_seconds"]["solver"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import contextlib
+import logging
+import unittest
+
+from src.game import Game
+from src.microbench import STATES, Benchmark, build_benchmarks, compare_results, measure_memory, run_benchmarks
+from src.strategy import FREQUENCY
+
+
+class TestMicrobench(unittest.TestCase):
+    """
+    A test suite for the microbenchmarks of the client's hot functions.
+
+    This class checks that every benchmark runs and is reported, that memory
+    is measured per call, and the regression check used by --compare.
+    """
+
+    def test_every_benchmark_reported(self):
+        """
+        Test that a short run reports throughput and allocations for every benchmark.
+        """
+        report = run_benchmarks(FREQUENCY, min_time=0, repeats=1)
+        names = list(report["benchmarks"])
+
+        for state in STATES:
+            self.assertIn(f"filter_possible_words[{state}]", names)
+            self.assertIn(f"choose_best_guess[{FREQUENCY}/{state}]", names)
+        self.assertIn("recv_msg[retry-500]", names)
+        for result in report["benchmarks"].values():
+            self.assertGreater(result["ops_per_sec"], 0)
+            self.assertGreaterEqual(result["peak_bytes"], 0)
+        self.assertEqual(report["strategy"], FREQUENCY)
+
+    def test_setup_restores_state(self):
+        """
+        Test that repeated calls of a state benchmark start from the same candidates.
+        """
+        game = Game(None, "test_user", log_level=logging.WARN, strategy=FREQUENCY)
+        with contextlib.ExitStack() as stack:
+            benchmarks = {benchmark.name: benchmark for benchmark in build_benchmarks(game, stack)}
+            benchmark = benchmarks["filter_possible_words[midgame]"]
+            counts = []
+            for _ in range(3):
+                benchmark.setup()
+                benchmark.run()
+                counts.append(len(game.possible_ids))
+        self.assertEqual(counts, [61, 61, 61])
+
+    def test_measure_memory(self):
+        """
+        Test that the memory of a call is measured, and that freed memory is not retained.
+        """
+        peak, retained = measure_memory(Benchmark("alloc", lambda: len(bytearray(1 << 20))))
+        self.assertGreaterEqual(peak, 1 << 20)
+        self.assertLess(retained, 1 << 20)
+
+    def test_compare_results(self):
+        """
+        Test that slower or hungrier benchmarks are regressions and benchmarks missing from either side are not.
+        """
+        baseline = {"benchmarks": {
+            "fast": {"ops_per_sec": 1000.0, "peak_bytes": 100_000},
+            "lean": {"ops_per_sec": 1000.0, "peak_bytes": 100_000},
+            "removed": {"ops_per_sec": 1000.0, "peak_bytes": 0},
+        }}
+        report = {"benchmarks": {
+            "fast": {"ops_per_sec": 700.0, "peak_bytes": 100_500},
+            "lean": {"ops_per_sec": 900.0, "peak_bytes": 120_000},
+            "new": {"ops_per_sec": 1.0, "peak_bytes": 1 << 30},
+        }}
+
+        regressions = compare_results(report, baseline, max_time_regression=0.25, max_memory_regression=0.10)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("fast: 700.0 ops/sec"))
+        self.assertTrue(regressions[1].startswith("lean: peak 120000 bytes"))
+        self.assertEqual(compare_results(baseline, baseline, 0.0, 0.0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
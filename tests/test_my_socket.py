@@ -0,0 +1,172 @@
+import shutil
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+from src import my_socket
+from src.config import Config
+from src.local_server import generate_self_signed_cert
+from src.my_socket import MySocket, open_connection, resolve, tls_context
+
+
+class TestMySocket(unittest.TestCase):
+    """
+    A test suite for the line-framed receive path of MySocket.
+
+    This class feeds data through a socket pair and checks that messages are
+    split on newlines without losing bytes between reads.
+    """
+
+    def setUp(self):
+        """Connect a MySocket to one end of a socket pair."""
+        self.peer, local = socket.socketpair()
+        self.sock = MySocket()
+        self.sock.sock = local
+
+    def tearDown(self):
+        """Close both ends of the socket pair."""
+        self.sock.disconnect()
+        self.peer.close()
+
+    def test_keeps_bytes_after_newline(self):
+        """
+        Test that several messages arriving in one read are returned one at a time.
+        """
+        self.peer.sendall(b'{"type": "start"}\n{"type": "retry"}\n{"type": "by')
+        self.assertEqual(self.sock.recv_msg(), '{"type": "start"}\n')
+        self.assertEqual(self.sock.recv_msg(), '{"type": "retry"}\n')
+        self.peer.sendall(b'e"}\n')
+        self.assertEqual(self.sock.recv_msg(), '{"type": "bye"}\n')
+
+    def test_message_split_across_reads(self):
+        """
+        Test that a message larger than the buffer, sent in small pieces, is reassembled.
+        """
+        msg = b'{"guesses": [' + b'{"word": "salet", "marks": [0, 0, 0, 0, 0]}, ' * 200 + b']}\n'
+        self.assertGreater(len(msg), Config.BUFFER_SIZE)
+        for i in range(0, len(msg) - 100, 997):
+            self.peer.sendall(msg[i:i + 997])
+        self.peer.sendall(msg[i + 997:] + b'next\n')
+        self.assertEqual(self.sock.recv_msg(), msg.decode())
+        self.assertEqual(self.sock.recv_msg(), 'next\n')
+
+    def test_leftover_moved_to_front(self):
+        """
+        Test that a partial message is kept when the buffer is compacted to make room.
+        """
+        first = b'a' * (Config.BUFFER_SIZE - 100) + b'\n'
+        second = b'b' * 300 + b'\n'
+        self.peer.sendall(first + second[:50])
+        self.assertEqual(self.sock.recv_msg(), first.decode())
+        self.peer.sendall(second[50:])
+        self.assertEqual(self.sock.recv_msg(), second.decode())
+
+    def test_connection_closed(self):
+        """
+        Test that buffered bytes are returned when the peer closes the connection.
+        """
+        self.peer.sendall(b'first\npartial')
+        self.peer.close()
+        self.assertEqual(self.sock.recv_msg(), 'first\n')
+        self.assertEqual(self.sock.recv_msg(), 'partial')
+        self.assertEqual(self.sock.recv_msg(), '')
+
+    def test_message_size_limit(self):
+        """
+        Test that a message without a newline is rejected once it exceeds the size limit.
+        """
+        self.peer.sendall(b'x' * 5000)
+        with mock.patch.object(Config, 'MAX_MESSAGE_SIZE', 4096):
+            with self.assertRaises(RuntimeError):
+                self.sock.recv_msg()
+
+
+class TestConnectionSetup(unittest.TestCase):
+    """
+    A test suite for how MySocket opens connections.
+
+    This class checks the resolver cache, the address race, the socket
+    options and the shared TLS context against a local listening socket.
+    """
+
+    def setUp(self):
+        """Listen on a local port and start from an empty resolver cache."""
+        self.listener = socket.create_server(('127.0.0.1', 0))
+        self.port = self.listener.getsockname()[1]
+        self.addCleanup(self.listener.close)
+        self.addCleanup(my_socket._resolved.clear)
+        my_socket._resolved.clear()
+
+    def test_resolver_cache(self):
+        """
+        Test that a host is resolved once and then served from the cache until it expires.
+        """
+        with mock.patch('socket.getaddrinfo', wraps=socket.getaddrinfo) as getaddrinfo:
+            first = resolve('localhost', self.port)
+            self.assertEqual(resolve('localhost', self.port), first)
+            self.assertEqual(getaddrinfo.call_count, 1)
+            with mock.patch.object(Config, 'DNS_CACHE_TTL', 0):
+                my_socket._resolved.clear()
+                resolve('localhost', self.port)
+                resolve('localhost', self.port)
+            self.assertEqual(getaddrinfo.call_count, 3)
+
+    def test_falls_back_to_next_address(self):
+        """
+        Test that a refused address is skipped in favour of the next one.
+        """
+        closed = socket.create_server(('127.0.0.1', 0))
+        closed_port = closed.getsockname()[1]
+        closed.close()
+        addresses = [(socket.AF_INET, socket.SOCK_STREAM, 0, '', ('127.0.0.1', closed_port)),
+                     (socket.AF_INET, socket.SOCK_STREAM, 0, '', ('127.0.0.1', self.port))]
+        with open_connection(addresses, timeout=5, delay=5) as sock:
+            self.assertEqual(sock.getpeername()[1], self.port)
+            self.assertIsNone(sock.gettimeout())
+
+        with self.assertRaises(OSError):
+            open_connection(addresses[:1], timeout=5)
+
+    def test_socket_options(self):
+        """
+        Test that connect disables Nagle's algorithm and applies the read timeout.
+        """
+        sock = MySocket()
+        with mock.patch.object(Config, 'READ_TIMEOUT', 2.5):
+            sock.connect('127.0.0.1', self.port)
+        self.addCleanup(sock.disconnect)
+        self.assertTrue(sock.sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        self.assertFalse(sock.sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+        self.assertEqual(sock.sock.gettimeout(), 2.5)
+
+    def test_connect_error(self):
+        """
+        Test that a refused connection is reported as a ConnectionError.
+        """
+        self.listener.close()
+        with self.assertRaises(ConnectionError):
+            MySocket().connect('127.0.0.1', self.port)
+
+    def test_tls_context_is_shared(self):
+        """
+        Test that one TLS context is created per CA file.
+        """
+        self.assertIs(tls_context(), tls_context())
+
+    @unittest.skipIf(shutil.which('openssl') is None, "openssl is not available")
+    def test_tls_context_keeps_system_cas(self):
+        """
+        Test that a CA file is trusted in addition to the system CA certificates, not instead of them.
+        """
+        with tempfile.TemporaryDirectory() as cert_dir:
+            certfile, _ = generate_self_signed_cert(cert_dir)
+            system_cas = tls_context().get_ca_certs()
+            cas = tls_context(certfile).get_ca_certs()
+        self.assertEqual(len(cas), len(system_cas) + 1)
+        for ca in system_cas:
+            self.assertIn(ca, cas)
+
+
+if __name__ == '__main__':
+    unittest.main()
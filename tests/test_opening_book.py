@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import opening_book
+from src.config import Config
+from src.game import Game
+from src.opening_book import OpeningBook, build_opening_book, history_key, load_opening_book, opening_book_path
+from src.patterns import compute_marks
+
+
+class TestOpeningBook(unittest.TestCase):
+    """
+    A test suite for the offline-computed opening book.
+
+    This class checks that book guesses are exactly the guesses the solver
+    computes live, and that Game only uses a book built for its settings.
+    """
+
+    TARGETS = ["crane", "hello", "geese", "tiara", "zonal", "eerie", "abwab", "fuzzy"]
+
+    @classmethod
+    def setUpClass(cls):
+        """Build a depth-2 book for the default solver once."""
+        game = Game(None, "test_user", log_level=logging.WARN)
+        cls.book = build_opening_book(game, max_depth=2)
+
+    def setUp(self):
+        """Use an empty cache directory for each test."""
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(Config, 'CACHE_DIR', self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+        self.addCleanup(opening_book._loaded_books.clear)
+
+    def play(self, game, target, turns):
+        """
+        Play the first turns of a game against a target.
+
+        Returns:
+            list: The guess history after the given number of turns.
+        """
+        guesses = [{"word": Config.INITIAL_GUESS, "marks": compute_marks(Config.INITIAL_GUESS, target)}]
+        for _ in range(turns - 1):
+            guess = game._get_next_guess({"guesses": guesses})
+            guesses.append({"word": guess, "marks": compute_marks(guess, target)})
+        return guesses
+
+    def test_book_matches_live_solver(self):
+        """
+        Test that every book entry on the path of several targets equals the live guess.
+        """
+        for target in self.TARGETS:
+            game = Game(None, "test_user", log_level=logging.WARN)
+            guesses = [{"word": Config.INITIAL_GUESS, "marks": compute_marks(Config.INITIAL_GUESS, target)}]
+            for _ in range(2):
+                if guesses[-1]["word"] == target:
+                    break
+                guess = game._get_next_guess({"guesses": guesses})
+                self.assertEqual(self.book.lookup(guesses), guess, history_key(guesses))
+                guesses.append({"word": guess, "marks": compute_marks(guess, target)})
+
+    def test_lookup_beyond_depth(self):
+        """
+        Test that histories longer than the book depth are not looked up.
+        """
+        guesses = self.play(Game(None, "test_user", log_level=logging.WARN), "fuzzy", 3)
+        self.assertIsNone(self.book.lookup(guesses))
+
+    def test_game_uses_saved_book(self):
+        """
+        Test that Game loads a saved book lazily and answers book states from it.
+        """
+        game = Game(None, "test_user", log_level=logging.WARN)
+        self.book.save(opening_book_path(game.word_list, game._solver_settings()))
+        self.assertFalse(game._opening_book_loaded)
+
+        guesses = [{"word": Config.INITIAL_GUESS, "marks": compute_marks(Config.INITIAL_GUESS, "crane")}]
+        with mock.patch.object(game, '_compute_next_guess') as compute:
+            self.assertEqual(game._get_next_guess({"guesses": guesses}), self.book.lookup(guesses))
+            compute.assert_not_called()
+
+    def test_mismatched_book_is_ignored(self):
+        """
+        Test that a book built for other settings, or another version, is not used.
+        """
+        game = Game(None, "test_user", log_level=logging.WARN)
+        solver = game._solver_settings()
+        path = opening_book_path(game.word_list, solver)
+
+        OpeningBook(dict(solver, strategy="other"), self.book.word_list_hash, 2, self.book.entries).save(path)
+        self.assertIsNone(load_opening_book(game.word_list, solver))
+
+        opening_book._loaded_books.clear()
+        self.book.save(path)
+        with open(path, 'r') as f:
+            data = json.load(f)
+        data["version"] = -1
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        self.assertIsNone(load_opening_book(game.word_list, solver))
+        self.assertTrue(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
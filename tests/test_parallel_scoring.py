@@ -0,0 +1,82 @@
+import logging
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src import parallel_scoring
+from src.config import Config
+from src.game import Game
+from src.parallel_scoring import ScoringPool, get_scoring_pool
+from src.patterns import PatternMatrix, build_pattern_matrix
+from src.strategy import ENTROPY, choose_entropy_guess
+from src.word_bank import WordBank
+
+
+class TestParallelScoring(unittest.TestCase):
+    """
+    A test suite for scoring guesses with worker processes.
+
+    This class checks that the workers pick exactly the guess the in-process
+    entropy scorer picks, for both guess pools, and that the game only hands
+    candidate sets above the threshold to the pool.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one pool of two workers over a small in-memory pattern matrix."""
+        words = WordBank.from_words(["crane", "salet", "hello", "world", "geese", "eerie", "about", "lemon",
+                                     "melon", "crate", "trace", "caret", "react", "slate", "least", "steal"])
+        cls.patterns = PatternMatrix(words, build_pattern_matrix(words))
+        cls.pool = ScoringPool(cls.patterns, workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the workers."""
+        cls.pool.close()
+
+    def test_matches_single_process_guess(self):
+        """
+        Test that the pool chooses the same guess as choose_entropy_guess.
+        """
+        rng = np.random.default_rng(7)
+        word_count = len(self.patterns.words)
+        for _ in range(5):
+            mask = rng.random(word_count) < 0.5
+            mask[0] = True
+            candidate_ids = np.flatnonzero(mask)
+            self.assertEqual(self.pool.choose_entropy_guess(mask, all_words=True),
+                             choose_entropy_guess(self.patterns, candidate_ids, np.arange(word_count)))
+            self.assertEqual(self.pool.choose_entropy_guess(mask, all_words=False),
+                             choose_entropy_guess(self.patterns, candidate_ids))
+
+    def test_disabled_without_workers(self):
+        """
+        Test that no pool is started unless at least two workers are configured.
+        """
+        with mock.patch.object(Config, 'SCORING_WORKERS', 1):
+            self.assertIsNone(get_scoring_pool(self.patterns))
+
+    def test_game_uses_pool_above_threshold(self):
+        """
+        Test that the game scores with the pool only when the candidate set is large enough.
+        """
+        game = Game(None, "test_user", log_level=logging.WARN)
+        game.strategy = ENTROPY
+        game.patterns = self.patterns
+        game.word_list = self.patterns.words
+        game.possible_mask = np.ones(len(self.patterns.words), dtype=bool)
+
+        with mock.patch.object(parallel_scoring, '_scoring_pools', {id(self.patterns): self.pool}), \
+                mock.patch.object(Config, 'SCORING_WORKERS', 2), \
+                mock.patch.object(self.pool, 'choose_entropy_guess', return_value="crane") as choose:
+            with mock.patch.object(Config, 'PARALLEL_SCORING_THRESHOLD', 10 ** 9):
+                game._choose_best_guess()
+            choose.assert_not_called()
+            with mock.patch.object(Config, 'PARALLEL_SCORING_THRESHOLD', 1):
+                self.assertEqual(game._choose_best_guess(), "crane")
+            choose.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.game import Game
+from src.patterns import (PatternMatrix, build_pattern_matrix, compute_marks, compute_pattern,
+                          decode_pattern, encode_marks, load_pattern_matrix, pattern_matrix_path)
+from src.word_index import WordIndex
+
+
+class TestPatterns(unittest.TestCase):
+    """
+    A test suite for the precomputed feedback-pattern matrix.
+
+    This class checks that the vectorized matrix builder agrees with the
+    per-word marks computation, and that the on-disk cache is keyed by the word list.
+    """
+
+    WORDS = ["salet", "eerie", "there", "speed", "abide", "hello", "llama", "geese", "crane", "treat"]
+
+    def test_encode_decode_round_trip(self):
+        """
+        Test that every marks array survives encoding to a base-3 code and back.
+        """
+        for code in range(3 ** 5):
+            self.assertEqual(encode_marks(decode_pattern(code)), code)
+        self.assertEqual(encode_marks([2, 2, 2, 2, 2]), 242)
+
+    def test_repeated_letters(self):
+        """
+        Test that repeated letters are marked the way the server marks them.
+        """
+        self.assertEqual(compute_marks("eerie", "there"), [1, 0, 1, 0, 2])
+        self.assertEqual(compute_marks("geese", "speed"), [0, 1, 2, 1, 0])
+        self.assertEqual(compute_marks("llama", "hello"), [1, 1, 0, 0, 0])
+
+    def test_matrix_matches_scalar_computation(self):
+        """
+        Test that the vectorized matrix builder agrees with compute_pattern for every pair.
+        """
+        matrix = build_pattern_matrix(self.WORDS)
+        for g, guess in enumerate(self.WORDS):
+            for a, answer in enumerate(self.WORDS):
+                self.assertEqual(matrix[g, a], compute_pattern(guess, answer), f"{guess} vs {answer}")
+
+    def test_cache_is_keyed_by_word_list(self):
+        """
+        Test that the cache file is reused for the same list and rebuilt for a different one.
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            patterns = load_pattern_matrix(self.WORDS, cache_dir)
+            self.assertTrue(os.path.exists(pattern_matrix_path(self.WORDS, cache_dir)))
+            self.assertIsInstance(patterns.matrix, np.memmap)
+            self.assertIs(load_pattern_matrix(self.WORDS, cache_dir), patterns)
+
+            other_words = self.WORDS[:-1]
+            self.assertNotEqual(pattern_matrix_path(other_words, cache_dir),
+                                pattern_matrix_path(self.WORDS, cache_dir))
+            self.assertEqual(load_pattern_matrix(other_words, cache_dir).matrix.shape, (9, 9))
+
+    def test_game_filters_with_pattern_matrix(self):
+        """
+        Test that Game keeps exactly the words consistent with the observed marks.
+        """
+        game = Game(None, "test_user")
+        game.word_list = list(self.WORDS)
+        game.index = WordIndex(self.WORDS)
+        game.possible_mask = game.index.all_words()
+        game.patterns = PatternMatrix(self.WORDS, build_pattern_matrix(self.WORDS))
+
+        marks = compute_marks("salet", "there")
+        game._update_constraints("salet", marks)
+        game._filter_possible_words("salet", marks)
+
+        expected = {word for word in self.WORDS if compute_marks("salet", word) == marks}
+        self.assertEqual(game.possible_words, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import unittest
+
+from src.protocol import GuessEncoder, decode_response, encode_hello
+
+
+class TestProtocol(unittest.TestCase):
+    """
+    A test suite for the message codec.
+
+    This class checks that pre-encoded guesses match json.dumps and that the
+    cheap reply decoding extracts the same fields as a full json.loads.
+    """
+
+    def retry_message(self, guesses, **extra):
+        """
+        Build a retry reply the way the server does.
+
+        Returns:
+            str: The newline-terminated reply.
+        """
+        return json.dumps({"type": "retry", "id": "abc123", "guesses": guesses, **extra}) + '\n'
+
+    def test_encoded_messages_match_json(self):
+        """
+        Test that hello and guess messages are byte-for-byte what json.dumps produces.
+        """
+        self.assertEqual(encode_hello("user"),
+                         (json.dumps({"type": "hello", "northeastern_username": "user"}) + '\n').encode())
+        for game_id, word in (("abc123", "salet"), ('we"ird\\id', "crane"), ("abc123", 'quo"te')):
+            expected = (json.dumps({"type": "guess", "id": game_id, "word": word}) + '\n').encode()
+            self.assertEqual(GuessEncoder(game_id).encode(word), expected)
+
+    def test_retry_decodes_last_guess_only(self):
+        """
+        Test that a long retry reply is decoded to its last guess.
+        """
+        guesses = [{"word": "salet", "marks": [0, 1, 0, 2, 0]}] * 300 + [{"word": "crane", "marks": [2, 2, 0, 0, 1]}]
+        response = decode_response(self.retry_message(guesses))
+        self.assertEqual(response, {"type": "retry", "guesses": [guesses[-1]]})
+
+        full = decode_response(self.retry_message(guesses), validate=True)
+        self.assertEqual(full["guesses"], guesses)
+        self.assertEqual(full["id"], "abc123")
+
+    def test_bye_and_other_replies(self):
+        """
+        Test that bye replies yield their flag and other replies are decoded in full.
+        """
+        self.assertEqual(decode_response('{"type": "bye", "id": "abc123", "flag": "f00d"}\n'),
+                         {"type": "bye", "flag": "f00d"})
+        self.assertEqual(decode_response('{"type": "start", "id": "abc123"}\n'), {"type": "start", "id": "abc123"})
+        self.assertEqual(decode_response('{"type": "error", "message": "Invalid guess"}\n'),
+                         {"type": "error", "message": "Invalid guess"})
+
+    def test_unexpected_layout_falls_back_to_full_decode(self):
+        """
+        Test that replies with reordered keys or trailing fields are still decoded correctly.
+        """
+        guesses = [{"marks": [0, 0, 0, 0, 0], "word": "salet"}]
+        self.assertEqual(decode_response(self.retry_message(guesses))["guesses"][-1], guesses[-1])
+
+        reordered = json.dumps({"guesses": guesses, "type": "retry"}) + '\n'
+        self.assertEqual(decode_response(reordered)["guesses"], guesses)
+
+        trailing = '{"type": "retry", "guesses": [], "note": {"word": "x", "marks": []}}\n'
+        self.assertEqual(decode_response(trailing)["guesses"], [])
+
+        with self.assertRaises(ValueError):
+            decode_response('{"type": "retry", "guesses": [{"word": "salet", "marks": [0, 0]}\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import logging
+import unittest
+from unittest import mock
+
+from src.config import Config
+from src.game import Game
+from src.simulate import build_report, compare_reports, run_simulation, simulate_game, simulate_tree
+
+
+class TestSimulate(unittest.TestCase):
+    """
+    A test suite for the process-parallel simulation benchmark.
+
+    This class checks the report contents and the regression check used by --compare.
+    """
+
+    def test_parallel_simulation_report(self):
+        """
+        Test that a sharded run solves every target and reports a consistent histogram.
+        """
+        words = ["crane", "hello", "geese", "tiara", "zonal", "eerie", "salet", "abwab"]
+        report = run_simulation(words, workers=2)
+
+        self.assertEqual(report["total_words"], len(words))
+        self.assertEqual(report["solved"], len(words))
+        self.assertEqual(report["failed_words"], [])
+        self.assertEqual(sum(report["histogram"].values()), len(words))
+        self.assertEqual(report["histogram"].get("1"), 1)  # 'salet' is the opening guess
+        self.assertEqual(report["worst_words"][0]["guesses"], max(int(n) for n in report["histogram"]))
+
+    def test_tree_matches_game_loop(self):
+        """
+        Test that the tree walk gives every target the same guess count as playing it alone.
+        """
+        game = Game(None, "test_user", log_level=logging.WARN)
+        targets = list(game.word_list[::40])
+        expected = [(word, simulate_game(game, word)) for word in targets]
+        self.assertEqual(simulate_tree(game, targets), expected)
+
+        with mock.patch.object(Config, 'MAX_RETRIES', 2):
+            results = dict(simulate_tree(game, ["salet", "crane", "zonal"]))
+            self.assertEqual(results["salet"], 1)
+            self.assertEqual(results["zonal"], simulate_game(game, "zonal"))
+
+        report = run_simulation(targets, tree=True)
+        self.assertEqual((report["mode"], report["total_words"]), ("tree", len(targets)))
+
+    def test_build_report(self):
+        """
+        Test the average, histogram and failed words computed from raw results.
+        """
+        report = build_report([("aaaaa", 3), ("bbbbb", 5), ("ccccc", None), ("ddddd", 3)], elapsed=2.0)
+        self.assertEqual(report["average_guesses"], 11 / 3)
+        self.assertEqual(report["histogram"], {"3": 2, "5": 1})
+        self.assertEqual(report["failed_words"], ["ccccc"])
+        self.assertEqual(report["worst_words"][0], {"word": "bbbbb", "guesses": 5})
+        self.assertEqual(report["words_per_sec"], 2.0)
+
+    def test_compare_reports(self):
+        """
+        Test that only regressions beyond the thresholds are reported.
+        """
+        baseline = {"average_guesses": 5.0, "wall_time": 10.0, "failed_words": []}
+        within = {"average_guesses": 5.04, "wall_time": 10.9, "failed_words": []}
+        slower = {"average_guesses": 5.2, "wall_time": 12.0, "failed_words": ["zzzzz"]}
+
+        self.assertEqual(compare_reports(within, baseline, 0.01, 0.10), [])
+        self.assertEqual(len(compare_reports(slower, baseline, 0.01, 0.10)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
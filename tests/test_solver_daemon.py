@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+from src import stats
+from src.config import Config
+from src.local_server import ServerThread, WordleServer, load_words
+from src.my_socket import MySocket
+from src.patterns import compute_marks
+from src.remote_solver import LocalSolver, RemoteSolver, play_game, solver_settings
+from src.solver_daemon import MAX_SOLVERS, SolverDaemon
+from src.strategy import FREQUENCY, RANKED
+
+
+class TestSolverDaemon(unittest.TestCase):
+    """
+    A test suite for the solver daemon and the client's fallback to in-process solving.
+
+    This class runs the daemon in a background thread on a temporary Unix
+    socket and checks that it guesses exactly like an in-process solver.
+    """
+
+    def setUp(self):
+        """Start a daemon on a socket in a temporary directory."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'solver.sock')
+        self.daemon = SolverDaemon(self.path, FREQUENCY)
+        self.daemon_thread = ServerThread(self.daemon).start()
+        self.addCleanup(self.daemon_thread.stop)
+
+    @staticmethod
+    def _play(solver, target):
+        """
+        Play a game against a known target with a solver.
+
+        Returns:
+            List[str]: The guesses made.
+        """
+        guesses = [solver.next_guess([])]
+        while guesses[-1] != target:
+            guesses.append(solver.next_guess([{"word": guesses[-1], "marks": compute_marks(guesses[-1], target)}]))
+        solver.close()
+        return guesses
+
+    def test_same_guesses_as_in_process(self):
+        """
+        Test that games solved by the daemon guess the same words as games solved in-process.
+        """
+        for target in ["crane", "geese", "vivid"]:
+            remote = self._play(RemoteSolver.connect(FREQUENCY, self.path), target)
+            local = self._play(LocalSolver.create(FREQUENCY), target)
+            self.assertEqual(remote, local)
+        self.assertGreaterEqual(self.daemon.queries_answered, 6)
+
+    def test_game_against_server(self):
+        """
+        Test that play_game wins a game against the local server with guesses from the daemon.
+        """
+        server = WordleServer(load_words(), answers=["crane"])
+        with ServerThread(server):
+            sock = MySocket()
+            sock.connect(host=server.host, port=server.port)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                flag = play_game(sock, "test_user", RemoteSolver.connect(FREQUENCY, self.path))
+
+        self.assertEqual(output.getvalue().strip(), flag)
+        self.assertEqual(server.games_played, 1)
+        self.assertGreater(self.daemon.queries_answered, 0)
+
+    def test_no_daemon(self):
+        """
+        Test that connecting without a listening daemon (or with the daemon disabled) gives no solver,
+        and that a daemon needs a socket path.
+        """
+        self.assertIsNone(RemoteSolver.connect(FREQUENCY, self.path + '.missing'))
+        self.assertIsNone(RemoteSolver.connect(FREQUENCY, ''))
+        with mock.patch.object(Config, 'SOLVER_SOCKET', ''):
+            self.assertIsNone(RemoteSolver.connect(FREQUENCY))
+            with self.assertRaises(ValueError):
+                SolverDaemon()
+
+    def test_falls_back_when_daemon_fails(self):
+        """
+        Test that a game goes on in-process when the daemon stops answering mid-game.
+        """
+        stats.disable()
+        self.addCleanup(stats.disable)
+        registry = stats.enable()
+        peer, local = socket.socketpair()
+        # A daemon that answers the first query, then goes away
+        peer.sendall(b'{"word": "salet"}\n')
+        peer.close()
+
+        server = WordleServer(load_words(), answers=["crane"])
+        with ServerThread(server), contextlib.redirect_stdout(io.StringIO()):
+            sock = MySocket()
+            sock.connect(host=server.host, port=server.port)
+            play_game(sock, "test_user", RemoteSolver(local, FREQUENCY))
+
+        self.assertEqual(server.games_played, 1)
+        self.assertEqual(registry.counters.get("solver_daemon_failures"), 1)
+
+    def _first_guess(self, settings):
+        """
+        Ask the daemon for the first guess of a game played with some solver settings.
+
+        Returns:
+            Dict: The daemon's reply.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(self.path)
+            conn.sendall((json.dumps({"settings": settings, "guesses": []}) + '\n').encode())
+            return json.loads(conn.makefile('rb').readline())
+
+    def test_client_settings_applied(self):
+        """
+        Test that the daemon solves with the client's solver settings rather than its own.
+        """
+        self.assertEqual(self._first_guess({"strategy": FREQUENCY, "initial_guess": "crane"}), {"word": "crane"})
+        self.assertEqual(self._first_guess({"strategy": FREQUENCY}), {"word": Config.INITIAL_GUESS})
+
+        with mock.patch.object(Config, 'INITIAL_GUESS', 'crane'):
+            settings = solver_settings(FREQUENCY)
+            self.assertEqual(self._play(RemoteSolver.connect(FREQUENCY, self.path), "vivid"),
+                             self._play(LocalSolver.create(FREQUENCY), "vivid"))
+        self.assertEqual(settings["initial_guess"], "crane")
+        self.assertNotIn("shortlist_size", settings)
+        self.assertIn("shortlist_size", solver_settings(RANKED))
+
+    def test_unsupported_settings_rejected(self):
+        """
+        Test that the daemon only solves with its own dictionary and valid settings, and keeps few solvers.
+        """
+        for settings in [{"word_list": "/etc/passwd"}, {"alphabet": "abc"}, {"use_pattern_matrix": 1},
+                         {"shortlist_size": "many"}, {"unknown": True}]:
+            self.assertIn("error", self._first_guess(dict(settings, strategy=FREQUENCY)))
+        self.assertEqual(len(self.daemon._solvers), 1)
+
+        for size in range(MAX_SOLVERS + 2):
+            self.assertIn("word", self._first_guess({"strategy": FREQUENCY, "shortlist_size": size + 1}))
+        self.assertEqual(len(self.daemon._solvers), MAX_SOLVERS)
+
+    def test_invalid_query(self):
+        """
+        Test that an invalid query gets an error and the connection is closed.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(self.path)
+            reader = conn.makefile('rb')
+            conn.sendall(b'{"settings": {"strategy": "unknown"}, "guesses": []}\n')
+            self.assertIn("error", json.loads(reader.readline()))
+            self.assertEqual(reader.readline(), b'')
+
+    def test_socket_in_use(self):
+        """
+        Test that a second daemon cannot take over a live socket but replaces a stale one.
+        """
+        with self.assertRaises(RuntimeError):
+            asyncio.run(SolverDaemon(self.path, FREQUENCY).start())
+
+        stale_path = self.path + '.stale'
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(stale_path)
+        with ServerThread(SolverDaemon(stale_path, FREQUENCY)):
+            self.assertEqual(self._play(RemoteSolver.connect(FREQUENCY, stale_path), "crane")[-1], "crane")
+        self.assertFalse(os.path.exists(stale_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
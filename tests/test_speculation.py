@@ -0,0 +1,128 @@
+import contextlib
+import io
+import json
+import logging
+import unittest
+from unittest import mock
+
+from src import stats
+from src.config import Config
+from src.game import Game
+from src.patterns import compute_marks, compute_pattern
+from src.speculation import likely_patterns
+from src.strategy import FREQUENCY
+
+
+class FakeSocket:
+    """A socket that answers each guess like the server would for a fixed target."""
+
+    def __init__(self, target, game=None):
+        self.target = target
+        self.game = game
+        self.guesses = []
+
+    def send_msg(self, msg):
+        word = json.loads(msg)["word"]
+        self.guesses.append({"word": word, "marks": compute_marks(word, self.target)})
+
+    def recv_msg(self):
+        # Let the speculation finish, as it would over a slow network
+        if self.game is not None and self.game._speculation is not None:
+            self.game._speculation._future.result()
+        if self.guesses[-1]["word"] == self.target:
+            return json.dumps({"type": "bye", "id": "game", "flag": "flag"}) + '\n'
+        return json.dumps({"type": "retry", "id": "game", "guesses": self.guesses}) + '\n'
+
+    def disconnect(self):
+        pass
+
+
+class TestSpeculation(unittest.TestCase):
+    """
+    A test suite for computing the next guess while the previous one is in flight.
+
+    This class checks that a reply whose follow-up was speculated is answered
+    without computing it again, that any other reply falls back to the normal
+    path, and that speculating never changes the guesses a game makes.
+    """
+
+    def setUp(self):
+        """Record stats for each test, and compute every guess rather than look it up in the opening book."""
+        stats.disable()
+        self.addCleanup(stats.disable)
+        self.registry = stats.enable()
+        patcher = mock.patch.object(Config, 'USE_OPENING_BOOK', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _game(target):
+        """Create a game whose socket answers for the given target."""
+        game = Game(None, "test_user", log_level=logging.WARN, strategy=FREQUENCY)
+        game.sock = FakeSocket(target, game)
+        return game
+
+    def _next_guess(self, target, patterns):
+        """Play the first turn of a game with speculation over the given number of patterns."""
+        game = self._game(target)
+        with mock.patch.object(Config, 'SPECULATIVE_PATTERNS', patterns):
+            response = game._guess_word("salet")
+        with mock.patch.object(game, '_compute_next_guess', wraps=game._compute_next_guess) as compute:
+            guess = game._get_next_guess(response)
+        return game, guess, compute.called
+
+    def test_hit_skips_computation(self):
+        """
+        Test that a reply among the speculated patterns is answered from the speculation.
+        """
+        game = self._game("crane")
+        likeliest = likely_patterns(game, "salet", 1)[0]
+        target = next(word for word in game.word_list if compute_pattern("salet", word) == likeliest)
+
+        game, guess, computed = self._next_guess(target, 1)
+        plain = Game(None, "test_user", log_level=logging.WARN, strategy=FREQUENCY)
+        expected = plain._get_next_guess({"guesses": [{"word": "salet", "marks": compute_marks("salet", target)}]})
+
+        self.assertFalse(computed)
+        self.assertEqual(guess, expected)
+        self.assertEqual(game.possible_words, plain.possible_words)
+        self.assertEqual(game.history, plain.history)
+        self.assertEqual(self.registry.counters.get("speculation_hits"), 1)
+
+    def test_miss_falls_back(self):
+        """
+        Test that a reply outside the speculated patterns is computed as usual.
+        """
+        game = self._game("crane")
+        likeliest = likely_patterns(game, "salet", 1)[0]
+        target = next(word for word in game.word_list
+                      if compute_pattern("salet", word) not in (likeliest, compute_pattern("salet", "salet")))
+
+        game, guess, computed = self._next_guess(target, 1)
+        plain = Game(None, "test_user", log_level=logging.WARN, strategy=FREQUENCY)
+        expected = plain._get_next_guess({"guesses": [{"word": "salet", "marks": compute_marks("salet", target)}]})
+
+        self.assertTrue(computed)
+        self.assertEqual(guess, expected)
+        self.assertEqual(game.history, plain.history)
+        self.assertEqual(self.registry.counters.get("speculation_misses"), 1)
+
+    def test_same_guesses_as_without(self):
+        """
+        Test that whole games guess the same words with and without speculation.
+        """
+        for target in ["crane", "geese", "lemon"]:
+            guesses = {}
+            for patterns in (0, 8):
+                game = self._game(target)
+                with mock.patch.object(Config, 'SPECULATIVE_PATTERNS', patterns), \
+                        contextlib.redirect_stdout(io.StringIO()):
+                    game._send_recv_hello_message = lambda: None
+                    game.start_game()
+                guesses[patterns] = [guess["word"] for guess in game.sock.guesses]
+            self.assertEqual(guesses[8], guesses[0])
+            self.assertEqual(guesses[0][-1], target)
+
+
+if __name__ == '__main__':
+    unittest.main()
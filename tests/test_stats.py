@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import socket
+import tempfile
+import unittest
+
+from src import stats
+from src.game import Game
+from src.my_socket import MySocket
+from src.patterns import compute_marks
+
+
+class TestStats(unittest.TestCase):
+    """
+    A test suite for the hot-path timers and counters.
+
+    This class checks that nothing is recorded while instrumentation is
+    disabled, and that the game and socket phases show up in the JSON and
+    Prometheus dumps once it is enabled.
+    """
+
+    def setUp(self):
+        """Start each test with instrumentation disabled."""
+        stats.disable()
+        self.addCleanup(stats.disable)
+
+    def test_disabled_records_nothing(self):
+        """
+        Test that the module-level helpers are no-ops while disabled.
+        """
+        self.assertIsNone(stats.registry())
+        with stats.timer("filter") as timer:
+            stats.observe("candidates_remaining", 10)
+            stats.increment("bytes_sent", 5)
+        self.assertIs(timer, stats.timer("choose_guess"))
+        self.assertIsNone(stats.registry())
+
+    def test_histogram_buckets(self):
+        """
+        Test that values land in the first bucket whose upper bound is not below them.
+        """
+        histogram = stats.Histogram([1, 2, 4])
+        for value in (0.5, 1, 3, 100):
+            histogram.observe(value)
+        summary = histogram.to_dict()
+        self.assertEqual(summary["buckets"], {"1": 2, "2": 2, "4": 3, "+Inf": 4})
+        self.assertEqual((summary["count"], summary["sum"], summary["min"], summary["max"]), (4, 104.5, 0.5, 100))
+
+    def test_game_phases_recorded(self):
+        """
+        Test that a simulated turn records the solver phases and the remaining candidates.
+        """
+        registry = stats.enable()
+        game = Game(None, "test_user", log_level=logging.WARN)
+        guesses = [{"word": "salet", "marks": compute_marks("salet", "crane")}]
+        game._get_next_guess({"guesses": guesses})
+
+        report = registry.to_dict()
+        for name in ("update_constraints_seconds", "filter_seconds", "candidates_remaining"):
+            self.assertEqual(report["histograms"][name]["count"], 1)
+        self.assertEqual(report["histograms"]["candidates_remaining"]["sum"], len(game.possible_words))
+
+    def test_socket_bytes_and_prometheus_dump(self):
+        """
+        Test that MySocket counts bytes and the dump is valid Prometheus text.
+        """
+        stats.enable()
+        peer, local = socket.socketpair()
+        sock = MySocket()
+        sock.sock = local
+        try:
+            sock.send_msg(b'{"type": "hello"}\n')
+            peer.sendall(b'{"type": "start"}\n')
+            sock.recv_msg()
+        finally:
+            sock.disconnect()
+            peer.close()
+
+        text = stats.registry().format_prometheus()
+        self.assertIn("wordle_bytes_sent_total 18\n", text)
+        self.assertIn("wordle_bytes_received_total 18\n", text)
+
+        stats.observe("candidates_remaining", 3)
+        text = stats.registry().format_prometheus()
+        self.assertIn("# TYPE wordle_candidates_remaining histogram", text)
+        self.assertIn('wordle_candidates_remaining_bucket{le="4"} 1', text)
+        self.assertIn('wordle_candidates_remaining_bucket{le="+Inf"} 1', text)
+        self.assertIn("wordle_candidates_remaining_count 1", text)
+
+    def test_json_dump_to_file(self):
+        """
+        Test that dump writes the JSON report to a file and rejects unknown formats.
+        """
+        stats.enable()
+        stats.increment("bytes_sent", 7)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stats.json')
+            stats.dump(stats.JSON, path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)["counters"], {"bytes_sent": 7})
+        with self.assertRaises(ValueError):
+            stats.dump('xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import time
+import unittest
+
+import numpy as np
+
+from src.patterns import SOLVED_PATTERN, PatternMatrix, build_pattern_matrix, compute_pattern
+from src.strategy import (EXPECTED_REMAINING, choose_entropy_guess, choose_frequency_guess, choose_ranked_guess,
+                          expected_information, expected_remaining, frequency_scores, pattern_histograms)
+from src.word_index import WordIndex
+
+
+class TestStrategy(unittest.TestCase):
+    """
+    A test suite for the guess selection strategies.
+
+    This class checks the letter-frequency scorer against the README example and
+    the vectorized entropy scorer against a direct per-word computation.
+    """
+
+    WORDS = ["barat", "barit", "karat", "salet", "crane", "treat", "brain", "tiara", "trait", "rabid"]
+
+    def setUp(self):
+        """Build a pattern matrix for the small test dictionary."""
+        self.patterns = PatternMatrix(self.WORDS, build_pattern_matrix(self.WORDS))
+
+    def test_frequency_readme_example(self):
+        """
+        Test that the frequency strategy picks 'barit' for the README example.
+        """
+        self.assertEqual(choose_frequency_guess({'barat', 'barit', 'karat'}), 'barit')
+
+    def test_histograms_match_direct_count(self):
+        """
+        Test that the batched histograms equal a per-word count of feedback patterns.
+        """
+        candidates = np.arange(len(self.WORDS))
+        histograms = pattern_histograms(self.patterns.matrix[:, candidates].astype(np.intp))
+        for g, guess in enumerate(self.WORDS):
+            expected = np.zeros(histograms.shape[1], dtype=int)
+            for answer in self.WORDS:
+                expected[compute_pattern(guess, answer)] += 1
+            np.testing.assert_array_equal(histograms[g], expected)
+
+    def test_expected_information(self):
+        """
+        Test the entropy of a uniform split and of a split that gives no information.
+        """
+        histograms = np.array([[1, 1, 1, 1], [4, 0, 0, 0]])
+        np.testing.assert_allclose(expected_information(histograms, 4), [2.0, 0.0])
+
+    def test_entropy_guess_maximizes_information(self):
+        """
+        Test that the entropy strategy returns a guess with maximal expected information.
+        """
+        candidates = np.array([0, 1, 2, 6, 8])
+        guess_ids = np.arange(len(self.WORDS))
+        best = choose_entropy_guess(self.patterns, candidates, guess_ids)
+        histograms = pattern_histograms(self.patterns.matrix[:, candidates].astype(np.intp))
+        scores = expected_information(histograms, len(candidates))
+        self.assertAlmostEqual(scores[self.WORDS.index(best)], scores.max())
+
+    def test_expected_remaining(self):
+        """
+        Test the expected candidates left by an even split and by a guess that may be the answer.
+        """
+        histograms = np.zeros((2, SOLVED_PATTERN + 1), dtype=int)
+        histograms[0, :2] = 2
+        histograms[1, [0, SOLVED_PATTERN]] = [3, 1]
+        np.testing.assert_allclose(expected_remaining(histograms, 4), [2.0, 2.25])
+
+    def test_frequency_scores_match_frequency_strategy(self):
+        """
+        Test that the vectorized frequency scores pick the same word as the frequency strategy.
+        """
+        index = WordIndex(self.WORDS)
+        mask = index.mask_of({'barat', 'barit', 'karat'})
+        ids = np.flatnonzero(mask)
+        scores = frequency_scores(index, mask, ids)
+        self.assertEqual(list(scores), [11, 12, 10])
+        self.assertEqual(self.WORDS[ids[int(np.argmax(scores))]], choose_frequency_guess({'barat', 'barit', 'karat'}))
+
+    def test_ranked_guess_without_pruning_maximizes_information(self):
+        """
+        Test that reranking every guess, with or without the pattern matrix, picks a best entropy guess.
+        """
+        index = WordIndex(self.WORDS)
+        candidates = np.array([0, 1, 2, 6, 8])
+        mask = np.isin(np.arange(len(self.WORDS)), candidates)
+        guess_ids = np.arange(len(self.WORDS))
+        histograms = pattern_histograms(self.patterns.matrix[:, candidates].astype(np.intp))
+        scores = expected_information(histograms, len(candidates)) + mask * 1e-6
+        for patterns in (None, self.patterns):
+            # Equal scores may be broken differently, so compare the scores of the picks
+            guess = choose_ranked_guess(index, mask, guess_ids, shortlist_size=len(self.WORDS), patterns=patterns)
+            self.assertAlmostEqual(scores[self.WORDS.index(guess)], scores.max(), places=9)
+        self.assertIn(choose_ranked_guess(index, mask, guess_ids, scorer=EXPECTED_REMAINING), self.WORDS)
+        with self.assertRaises(ValueError):
+            choose_ranked_guess(index, mask, guess_ids, scorer='random')
+
+    def test_ranked_guess_stops_at_deadline(self):
+        """
+        Test that a passed deadline still returns the best guess of the first batch, from the shortlist.
+        """
+        index = WordIndex(self.WORDS)
+        mask = np.ones(len(self.WORDS), dtype=bool)
+        guess = choose_ranked_guess(index, mask, shortlist_size=3, deadline=time.perf_counter() - 1)
+        scores = frequency_scores(index, mask, np.arange(len(self.WORDS)))
+        shortlist = {self.WORDS[i] for i in np.argsort(-scores, kind='stable')[:3]}
+        self.assertIn(guess, shortlist)
+
+
+if __name__ == '__main__':
+    unittest.main()
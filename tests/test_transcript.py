@@ -0,0 +1,110 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from src import transcript
+from src.config import Config
+from src.game import Game
+from src.local_server import ServerThread, WordleServer, load_words
+from src.my_socket import MySocket
+from src.replay import ReplaySocket, replay_transcript
+from src.strategy import FREQUENCY, RANKED
+from src.transcript import CLOSED, OPENED, RECEIVED, SENT, Event, load_sessions
+
+
+class TestTranscript(unittest.TestCase):
+    """
+    A test suite for recording client traffic and replaying it offline.
+
+    This class records real games against the local server, then checks that
+    the transcript holds every message and that replaying it plays the same
+    games without a network.
+    """
+
+    def setUp(self):
+        """Record into a fresh transcript file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'transcript.jsonl')
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(self._close_recorders)
+
+    @staticmethod
+    def _close_recorders():
+        """Close and forget the recorders opened by a test."""
+        for recorder in transcript._recorders.values():
+            recorder.close()
+        transcript._recorders.clear()
+
+    def _record_games(self, answers):
+        """Play one game per answer against the local server with recording enabled."""
+        server = WordleServer(load_words(), answers=answers)
+        with ServerThread(server), mock.patch.object(Config, 'TRANSCRIPT_FILE', self.path):
+            for _ in answers:
+                sock = MySocket()
+                sock.connect(host=server.host, port=server.port)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    Game(sock, "test_user", strategy=FREQUENCY).start_game()
+
+    def test_records_every_message(self):
+        """
+        Test that each connection is recorded as one session of opened, sent, received and closed events.
+        """
+        self._record_games(["crane", "hello"])
+        sessions = load_sessions(self.path)
+
+        self.assertEqual(len(sessions), 2)
+        for events in sessions.values():
+            directions = [event.direction for event in events]
+            self.assertEqual(directions[0], OPENED)
+            self.assertEqual(directions[-1], CLOSED)
+            self.assertEqual(directions.count(SENT), directions.count(RECEIVED))
+            self.assertIn('"hello"', events[1].message)
+            self.assertIn('"bye"', events[-2].message)
+            self.assertEqual([event.time for event in events], sorted(event.time for event in events))
+
+    def test_replay_matches_recording(self):
+        """
+        Test that replaying with the recording solver sends exactly the recorded messages.
+        """
+        self._record_games(["crane", "hello", "geese"])
+        recorded_sent = sum(event.direction == SENT for events in load_sessions(self.path).values()
+                            for event in events)
+
+        summary = replay_transcript(self.path, strategy=FREQUENCY)
+        self.assertEqual(summary["sessions"], 3)
+        self.assertEqual(summary["games"], 3)
+        self.assertEqual(summary["divergences"], 0)
+        # The hello message is not counted as a guess
+        self.assertEqual(summary["guesses"], recorded_sent - 3)
+
+    def test_replay_with_other_solver(self):
+        """
+        Test that a different solver replays the same turns, counting its differing guesses.
+        """
+        self._record_games(["crane", "hello", "geese"])
+        summary = replay_transcript(self.path, strategy=RANKED)
+        self.assertEqual(summary["games"], 3)
+        self.assertGreater(summary["divergences"], 0)
+
+    def test_realtime_waits_for_recorded_latency(self):
+        """
+        Test that realtime replay waits as long as the server took to reply.
+        """
+        events = [Event(0.0, OPENED, "host:1"), Event(0.01, SENT, "ping\n"), Event(0.11, RECEIVED, "pong\n")]
+        for realtime, expect_wait in ((False, False), (True, True)):
+            sock = ReplaySocket(events, realtime=realtime)
+            start = time.perf_counter()
+            sock.send_msg(b"ping\n")
+            self.assertEqual(sock.recv_msg(), "pong\n")
+            self.assertEqual(time.perf_counter() - start >= 0.1, expect_wait)
+            self.assertEqual(sock.divergences, 0)
+            with self.assertRaises(RuntimeError):
+                sock.recv_msg()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import word_bank
+from src.config import Config
+from src.word_bank import WordBank, get_word_bank, word_list_hash, write_word_bank
+
+
+class TestWordBank(unittest.TestCase):
+    """
+    A test suite for the packed binary word bank.
+
+    This class checks that the binary file round-trips the word list, that
+    IDs and hashes match the text list, and that banks are loaded once.
+    """
+
+    WORDS = ["crane", "hello", "geese", "abbey", "zonal"]
+
+    def setUp(self):
+        """Use an empty cache directory for each test."""
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(Config, 'CACHE_DIR', self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+        self.addCleanup(word_bank._loaded_banks.clear)
+
+    def write_text(self, words, name='words.txt'):
+        """
+        Write a CRLF text word list into the cache directory.
+
+        Returns:
+            str: The path of the text file.
+        """
+        path = os.path.join(self.cache_dir.name, name)
+        with open(path, 'w', newline='') as f:
+            f.write(''.join(f"{word}\r\n" for word in words))
+        return path
+
+    def test_binary_round_trip(self):
+        """
+        Test that a memory-mapped bank holds the same words, IDs and hash as the list.
+        """
+        path = os.path.join(self.cache_dir.name, 'words.bin')
+        write_word_bank(self.WORDS, path)
+        bank = WordBank.open(path)
+
+        self.assertEqual(list(bank), self.WORDS)
+        self.assertEqual(len(bank), len(self.WORDS))
+        self.assertEqual(bank[1], "hello")
+        self.assertEqual(bank[-1], "zonal")
+        self.assertEqual(bank[1:3], ("hello", "geese"))
+        self.assertEqual(bank.id_of("geese"), 2)
+        self.assertIn("abbey", bank)
+        self.assertNotIn("salet", bank)
+        self.assertEqual(bank.content_hash, word_list_hash(self.WORDS))
+        self.assertEqual(word_list_hash(bank), word_list_hash(self.WORDS))
+        self.assertEqual(bank.letters[0].tolist(), [2, 17, 0, 13, 4])
+
+    def test_invalid_files_and_words(self):
+        """
+        Test that bad headers, truncated files and malformed words are rejected.
+        """
+        path = os.path.join(self.cache_dir.name, 'words.bin')
+        with open(path, 'wb') as f:
+            f.write(b'not a word bank file at all, no sir, not even close')
+        with self.assertRaises(ValueError):
+            WordBank.open(path)
+
+        write_word_bank(self.WORDS, path)
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 1)
+        with self.assertRaises(ValueError):
+            WordBank.open(path)
+
+        for words in ([], ["crane", "cat"], ["Crane"]):
+            with self.assertRaises(ValueError):
+                WordBank.from_words(words)
+
+    def test_text_list_is_converted_once(self):
+        """
+        Test that a text list is cached as a binary file and shared within the process.
+        """
+        path = self.write_text(self.WORDS)
+        bank = get_word_bank(path)
+
+        self.assertEqual(list(bank), self.WORDS)
+        self.assertIs(get_word_bank(path), bank)
+        self.assertTrue(any(name.endswith('.bin') for name in os.listdir(self.cache_dir.name)))
+
+        word_bank._loaded_banks.clear()
+        with mock.patch.object(word_bank, 'read_text_word_list') as read_text:
+            self.assertEqual(list(get_word_bank(path)), self.WORDS)
+        read_text.assert_not_called()
+
+    def test_changed_text_list_is_reconverted(self):
+        """
+        Test that editing the text list produces a new binary copy.
+        """
+        path = self.write_text(self.WORDS)
+        get_word_bank(path)
+        word_bank._loaded_banks.clear()
+
+        self.write_text(self.WORDS + ["salet"])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(get_word_bank(path)[-1], "salet")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from src.patterns import compute_marks
+from src.word_index import ALPHABET, WordIndex
+
+
+class TestWordIndex(unittest.TestCase):
+    """
+    A test suite for the bitset word index.
+
+    This class checks that bitset filtering keeps exactly the words that the
+    per-word constraint checks in Game used to keep.
+    """
+
+    WORDS = ["salet", "eerie", "there", "speed", "abide", "hello", "llama", "geese", "crane", "treat"]
+
+    def setUp(self):
+        """Build the index for the small test dictionary."""
+        self.index = WordIndex(self.WORDS)
+
+    def reference_filter(self, must_contain, position_constraints):
+        """
+        Filter the test dictionary with the original per-word checks.
+
+        Returns:
+            set: The words satisfying every constraint.
+        """
+        return {
+            word for word in self.WORDS
+            if all(letter in word for letter in must_contain) and
+               all(word[i] in constraint for i, constraint in enumerate(position_constraints))
+        }
+
+    def test_no_constraints_keeps_everything(self):
+        """
+        Test that filtering without constraints keeps every word.
+        """
+        mask = self.index.filter(self.index.all_words(), set(), [set(ALPHABET) for _ in range(5)])
+        self.assertEqual(self.index.words_of(mask), self.WORDS)
+
+    def test_matches_reference_filter(self):
+        """
+        Test both the excluded-letter and allowed-letter paths against the reference filter.
+        """
+        cases = [
+            ({'e'}, [set(ALPHABET) - {'s'}, set(ALPHABET), set(ALPHABET), set(ALPHABET) - {'e'}, set(ALPHABET)]),
+            ({'e', 'r'}, [set(ALPHABET), set(ALPHABET), set(ALPHABET), set(ALPHABET), {'e'}]),
+            ({'l'}, [set('hl'), set(ALPHABET), set(ALPHABET), set(ALPHABET), set(ALPHABET) - {'t'}]),
+        ]
+        for must_contain, position_constraints in cases:
+            mask = self.index.filter(self.index.all_words(), must_contain, position_constraints)
+            self.assertEqual(set(self.index.words_of(mask)), self.reference_filter(must_contain, position_constraints))
+
+    def test_filter_does_not_modify_input(self):
+        """
+        Test that filtering returns a new bitset and leaves the input untouched.
+        """
+        mask = self.index.all_words()
+        self.index.filter(mask, {'z'}, [set(ALPHABET) for _ in range(5)])
+        self.assertTrue(mask.all())
+
+    def test_filter_feedback_matches_marks(self):
+        """
+        Test that one guess's feedback keeps exactly the words that would produce the same marks.
+
+        The dictionary has repeated letters, so this covers the minimum and exact letter counts.
+        """
+        for guess in self.WORDS:
+            for answer in self.WORDS:
+                marks = compute_marks(guess, answer)
+                mask = self.index.filter_feedback(self.index.all_words(), guess, marks)
+                expected = {word for word in self.WORDS if compute_marks(guess, word) == marks}
+                self.assertEqual(set(self.index.words_of(mask)), expected, (guess, answer))
+
+    def test_letter_count_constraints(self):
+        """
+        Test that filter applies minimum and maximum letter counts.
+        """
+        any_letter = [set(ALPHABET) for _ in range(5)]
+        mask = self.index.filter(self.index.all_words(), set(), any_letter, min_counts={'e': 2})
+        self.assertEqual(set(self.index.words_of(mask)), {"eerie", "there", "speed", "geese"})
+        mask = self.index.filter(self.index.all_words(), set(), any_letter, min_counts={'e': 2}, max_counts={'e': 2})
+        self.assertEqual(set(self.index.words_of(mask)), {"there", "speed"})
+
+    def test_mask_round_trip(self):
+        """
+        Test that a set of words survives conversion to a bitset and back.
+        """
+        words = {'hello', 'crane', 'salet'}
+        self.assertEqual(set(self.index.words_of(self.index.mask_of(words))), words)
+
+
+if __name__ == '__main__':
+    unittest.main()